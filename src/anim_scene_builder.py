@@ -1,6 +1,19 @@
 #die fertigen animationen sind als spritesheet hinterlegt jeweils das passende beim objektaufruf übergeben
+#frames werden NICHT mehr alle beim start auf bildschirmgröße skaliert (bei 4k waren das hunderte MB),
+#sondern erst, wenn die szene zum ersten mal gezeichnet wird: dann alle auf einmal (einmal pro größe,
+#über asset_cache.load_sheet), danach wird beim abspielen nichts mehr skaliert.
+#beim nächsten start() wird festhalten wieder freigegeben, der asset-cache darf sie dann bei speicherknappheit wegwerfen
+#zeit kommt von der gemeinsamen spieluhr (animation.game_clock), nicht mehr von pygame.time.get_ticks
 import pygame
 
+from src.assets import asset_cache
+from src.animation import game_clock
+
+class _FrameHold:
+    #hält die skalierten frames im asset-cache fest, solange die szene läuft (weakref-fähig)
+    pass
+
+
 class Animator_Scenes:
     def __init__(self,x,y,speed,schleife):
         self.x=x
@@ -12,38 +25,64 @@ class Animator_Scenes:
         self.aktiv=False
         self.frame_index=0
         self.animation_counter = 0
-        self.last_update=pygame.time.get_ticks()
+        self.last_update=game_clock.time_ms
+
+        self.target_size=(0,0)      #auf diese größe wird skaliert
+        self.sheet_path=None
+        self.frame_size=(0,0)
+        self.scaled_frames=()       #alle frames in target_size, erst beim ersten zeichnen geholt
+        self._hold=None
 
     def load_from_spritesheet(self, sheet_path, frame_width, frame_height, background: pygame.Surface):#funktion von gpt "schreibe mir ne funktion in ner klasse die spritesheets aus pixel lädt damit ich nicht jedes bild einzeln laden muss"
     # Keine Transparenz → convert() statt convert_alpha()
            
-        sheet = pygame.image.load(sheet_path).convert()
+        sheet = asset_cache.load(sheet_path, alpha=False, owner=self)
 
         sheet_width = sheet.get_width()
         self.sheetliste = []  # alte Frames überschreiben
+        self.release_frames()
+        self.sheet_path = sheet_path
+        self.frame_size = (frame_width, frame_height)
 
         # Anzahl Frames = Breite / Framebreite
         self.sheetliste_count = int(sheet_width // frame_width)
 
+        # nur Subsurfaces (keine Kopien): zeigen direkt ins kleine Original-Sheet
         for i in range(self.sheetliste_count):
             rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-            frame = sheet.subsurface(rect).copy()
-            frame = pygame.transform.scale(frame, (background.get_width(), background.get_height()))
-            self.sheetliste.append(frame)
+            self.sheetliste.append(sheet.subsurface(rect))
+
+        # skaliert wird erst beim ersten Zeichnen (get_frame)
+        self.target_size = (background.get_width(), background.get_height())
         return self.sheetliste
 
+    def release_frames(self):
+        #skalierte frames nicht mehr festhalten (cache behält sie, solange platz ist)
+        self.scaled_frames = ()
+        self._hold = None
+
+    def get_frame(self, index):
+        #liefert das frame in bildschirmgröße, beim ersten aufruf werden alle frames einmal skaliert
+        if not self.scaled_frames:
+            self._hold = _FrameHold()
+            w, h = self.frame_size
+            self.scaled_frames = asset_cache.load_sheet(self.sheet_path, w, h, self.target_size,
+                                                        alpha=False, owner=self._hold)
+        return self.scaled_frames[index]
+
 
 
     def start (self):
+        self.release_frames()
         self.aktiv=True
         self.frame_index=0
         self.animation_counter=0
-        self.last_update=pygame.time.get_ticks()
+        self.last_update=game_clock.time_ms
 
     def update(self):
         if self.aktiv==False: #die logik müsste auch funktionieren? not ist mir zu gefährlich
             return False
-        now=pygame.time.get_ticks()
+        now=game_clock.time_ms
         
         if now - self.last_update>= self.speed:
             self.last_update=now
@@ -59,5 +98,11 @@ class Animator_Scenes:
                 self.aktiv = False 
         return True         
 
+    def next_frame_in(self):
+        #ms bis zum nächsten frame (für den RedrawScheduler), None wenn nix läuft
+        if self.aktiv==False:
+            return None
+        return max(0, self.speed-(game_clock.time_ms-self.last_update))
+
     def draw (self,screen: pygame.Surface, background_rect: pygame.Rect):
-        screen.blit(self.sheetliste[self.frame_index], background_rect)
\ No newline at end of file
+        screen.blit(self.get_frame(self.frame_index), background_rect)
\ No newline at end of file
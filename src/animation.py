@@ -0,0 +1,134 @@
+# animation.py
+# ----------------------------------------------------------
+# Gemeinsame Animationen für Coins, Student und Szenen.
+#
+# Früher hat jeder Coin selbst pygame.time.get_ticks() abgefragt und
+# seinen Frame ausgerechnet, der Student hatte eigene Timer und die
+# Game-Over-Szene hat sich last_update gemerkt. Jetzt gibt es:
+#
+# - GameClock: EINE Uhr fürs ganze Spiel, Game.run zählt sie pro Frame
+#   mit dt weiter (headless/Replay: gleiche dt -> gleiche Frames).
+# - AnimationClip: Frame-Liste + Frame-Dauer, wird nur einmal geladen
+#   und von allen Objekten geteilt. Der aktuelle Frame wird pro Tick
+#   nur einmal pro Clip berechnet.
+# - Animator: pro Objekt nur Clip-Referenz + Phasenverschiebung.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import weakref
+import pygame
+
+from src.assets import asset_cache
+
+
+class GameClock:
+    def __init__(self):
+        self.time_ms = 0.0
+        # zählt die Ticks, damit Clips ihren Frame nur einmal pro Tick rechnen
+        self.ticks = 0
+
+    def tick(self, dt: float) -> None:
+        """Uhr um dt Sekunden weiterstellen (einmal pro Frame)."""
+        self.time_ms += dt * 1000.0
+        self.ticks += 1
+
+    def reset(self) -> None:
+        self.time_ms = 0.0
+        self.ticks += 1
+
+
+# Eine Uhr für das ganze Spiel
+game_clock = GameClock()
+
+
+class AnimationClip:
+    def __init__(self, frames, frame_ms: float, loop: bool = True):
+        self.frames: tuple[pygame.Surface, ...] = tuple(frames)
+        self.frame_ms = frame_ms
+        self.loop = loop
+
+        # Frame-Index für den letzten Tick (geteilt von allen Animatoren ohne Phase)
+        self._tick = -1
+        self._index = 0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def index_at(self, time_ms: float) -> int:
+        n = len(self.frames)
+        if n <= 1:
+            return 0
+        i = int(time_ms // self.frame_ms)
+        return i % n if self.loop else min(i, n - 1)
+
+    def current_index(self, clock: GameClock = game_clock) -> int:
+        """Frame-Index zur aktuellen Spielzeit, einmal pro Tick berechnet."""
+        if self._tick != clock.ticks:
+            self._tick = clock.ticks
+            self._index = self.index_at(clock.time_ms)
+        return self._index
+
+    def next_change_in(self, time_ms: float) -> float | None:
+        """ms bis zum nächsten Framewechsel (None = Standbild)."""
+        if len(self.frames) <= 1:
+            return None
+        if not self.loop and time_ms >= (len(self.frames) - 1) * self.frame_ms:
+            return None
+        return self.frame_ms - time_ms % self.frame_ms
+
+
+class Animator:
+    # pro Objekt nur zwei Felder, die Frames stecken im geteilten Clip
+    __slots__ = ("clip", "phase_ms")
+
+    def __init__(self, clip: AnimationClip, phase_ms: float = 0.0):
+        self.clip = clip
+        self.phase_ms = phase_ms
+
+    def play(self, clip: AnimationClip, clock: GameClock = game_clock) -> None:
+        """Auf einen anderen Clip wechseln, der dann bei Frame 0 startet."""
+        if clip is self.clip:
+            return
+        self.clip = clip
+        self.phase_ms = -clock.time_ms
+
+    def index(self, clock: GameClock = game_clock) -> int:
+        if self.phase_ms == 0.0:
+            return self.clip.current_index(clock)
+        return self.clip.index_at(clock.time_ms + self.phase_ms)
+
+    def image(self, clock: GameClock = game_clock) -> pygame.Surface:
+        return self.clip.frames[self.index(clock)]
+
+    def next_change_in(self, clock: GameClock = game_clock) -> float | None:
+        return self.clip.next_change_in(clock.time_ms + self.phase_ms)
+
+
+# ------------------------------------------------------------
+# Clips laden (jeder Clip existiert nur einmal, solange ihn jemand benutzt)
+# ------------------------------------------------------------
+_clips: "weakref.WeakValueDictionary[tuple, AnimationClip]" = weakref.WeakValueDictionary()
+
+
+def load_clip(path: str, frame_w: int | None, frame_h: int | None,
+              size: tuple[int, int], frame_ms: float, loop: bool = True) -> AnimationClip:
+    """Clip aus einem Sprite-Sheet (siehe AssetCache.load_sheet)."""
+    key = ("sheet", path, frame_w, frame_h, tuple(size), frame_ms, loop)
+    clip = _clips.get(key)
+    if clip is None:
+        clip = AnimationClip((), frame_ms, loop)
+        # der Clip hält die Frames im Asset-Cache fest
+        clip.frames = asset_cache.load_sheet(path, frame_w, frame_h, size, owner=clip)
+        _clips[key] = clip
+    return clip
+
+
+def clip_from_files(paths, size: tuple[int, int], frame_ms: float, loop: bool = True) -> AnimationClip:
+    """Clip aus einzelnen Bilddateien (ein Bild pro Frame)."""
+    key = ("files", tuple(paths), tuple(size), frame_ms, loop)
+    clip = _clips.get(key)
+    if clip is None:
+        clip = AnimationClip((), frame_ms, loop)
+        clip.frames = tuple(asset_cache.load(p, size, owner=clip) for p in paths)
+        _clips[key] = clip
+    return clip
@@ -0,0 +1,155 @@
+# assets.py
+# ----------------------------------------------------------
+# Zentraler Bild-Cache für das ganze Spiel.
+#
+# Früher hat jede Münze, jedes PowerUp, jeder Prof und jeder Restart
+# seine Bilder neu von der Platte geladen und skaliert. Jetzt geht alles
+# über diesen Cache, Schlüssel: (Pfad, Größe, Convert-Modus).
+#
+# - Gleiche Bilder gibt es nur einmal im Speicher (alle Coins teilen sich
+#   z.B. dieselben Frames).
+# - Referenzzählung: Wer ein Bild mit owner=... holt, hält es fest, bis
+#   das owner-Objekt vom Garbage Collector weggeräumt wird.
+# - Wird die Speichergrenze überschritten, fliegen die am längsten nicht
+#   benutzten Einträge raus, aber nur solche ohne Referenzen.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from collections import OrderedDict
+import weakref
+import pygame
+
+from src.config import ASSET_CACHE_MAX_BYTES
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class _Entry:
+    def __init__(self, value, nbytes: int):
+        self.value = value      # Surface oder Tupel aus Surfaces (Sprite-Sheet)
+        self.nbytes = nbytes
+        self.refs = 0
+
+
+class AssetCache:
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+
+        # kleine Statistik, praktisch zum Profilen
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------
+    # intern: Einträge verwalten
+    # ------------------------------------------------------------
+    def _get(self, key: tuple):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _put(self, key: tuple, value, nbytes: int) -> _Entry:
+        self.misses += 1
+        entry = _Entry(value, nbytes)
+        self._entries[key] = entry
+        self.bytes_used += nbytes
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        if self.bytes_used <= self.max_bytes:
+            return
+        # älteste zuerst, aber nur Einträge, die gerade niemand benutzt
+        # (der gerade eingefügte, neueste Eintrag bleibt immer drin)
+        for key in list(self._entries)[:-1]:
+            if self.bytes_used <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry.refs == 0:
+                del self._entries[key]
+                self.bytes_used -= entry.nbytes
+
+    def _retain(self, key: tuple, entry: _Entry, owner) -> None:
+        if owner is None:
+            return
+        entry.refs += 1
+        # sobald der Besitzer weg ist, Referenz wieder freigeben
+        weakref.finalize(owner, self._release, key)
+
+    def _release(self, key: tuple) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.refs > 0:
+            entry.refs -= 1
+            self._evict()
+
+    # ------------------------------------------------------------
+    # Öffentliche API
+    # ------------------------------------------------------------
+    def _load_source(self, path: str, alpha: bool) -> pygame.Surface:
+        """Dekodiertes Originalbild (unskaliert), ebenfalls gecacht."""
+        key = (path, None, alpha)
+        entry = self._get(key)
+        if entry is None:
+            img = pygame.image.load(path)
+            img = img.convert_alpha() if alpha else img.convert()
+            entry = self._put(key, img, _surface_bytes(img))
+        return entry.value
+
+    def load(self, path: str, size: tuple[int, int] | None = None, alpha: bool = True,
+             owner=None) -> pygame.Surface:
+        """
+        Lädt ein Bild (optional skaliert auf size).
+        Das zurückgegebene Surface wird geteilt -> nicht darauf zeichnen!
+        """
+        key = (path, tuple(size) if size else None, alpha)
+        entry = self._get(key)
+        if entry is None:
+            img = self._load_source(path, alpha)
+            if size and tuple(size) != img.get_size():
+                img = pygame.transform.scale(img, size)
+                entry = self._put(key, img, _surface_bytes(img))
+            else:
+                # passt schon (z.B. logische Auflösung mit Originalgröße) -> nicht skalieren
+                entry = self._entries[(path, None, alpha)]
+                key = (path, None, alpha)
+        self._retain(key, entry, owner)
+        return entry.value
+
+    def load_sheet(self, path: str, frame_w: int | None, frame_h: int | None,
+                   size: tuple[int, int], alpha: bool = True, owner=None) -> tuple[pygame.Surface, ...]:
+        """
+        Schneidet ein Sprite-Sheet in Frames (links->rechts, oben->unten)
+        und skaliert jeden Frame auf size.
+        frame_w=None -> Breite des Sheets, frame_h=None -> quadratisch (= frame_w).
+        """
+        key = ("sheet", path, frame_w, frame_h, tuple(size), alpha)
+        entry = self._get(key)
+        if entry is None:
+            sheet = self._load_source(path, alpha)
+            fw = frame_w or sheet.get_width()
+            fh = frame_h or fw
+            frames = []
+            for y in range(sheet.get_height() // fh):
+                for x in range(sheet.get_width() // fw):
+                    frame = sheet.subsurface(pygame.Rect(x * fw, y * fh, fw, fh))
+                    if frame.get_size() != tuple(size):
+                        frame = pygame.transform.scale(frame, size)
+                    frames.append(frame)
+            frames = tuple(frames)
+            entry = self._put(key, frames, sum(_surface_bytes(f) for f in frames))
+        self._retain(key, entry, owner)
+        return entry.value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+
+# Ein Cache für den ganzen Prozess
+asset_cache = AssetCache()
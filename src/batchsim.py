@@ -0,0 +1,294 @@
+# batchsim.py
+# ----------------------------------------------------------
+# Batch-Simulator zum Balancen der LEVELS-Tabelle (config.py).
+#
+# Spielt für jedes Semester viele Level mit festen Seeds durch - ohne
+# Fenster, ohne Sound, nur mit dem pygame-freien Kern (Level, Student,
+# Profs, PowerUps). Gesteuert wird der Student von einer einfachen
+# Strategie: immer zum nächsten ECTS laufen, Profs nach Möglichkeit
+# ausweichen, Fragen mit einer festen Trefferquote beantworten.
+#
+# Die Läufe werden in Pakete aufgeteilt und über einen Prozess-Pool auf
+# alle Kerne verteilt. Jedes Paket liefert nur Summen zurück, damit kaum
+# Daten zwischen den Prozessen hin- und hergehen.
+#
+# Aufruf (aus dem Projektordner, wie das Spiel selbst):
+#   python -m src.batchsim --runs 100000
+#   python -m src.batchsim --levels 1,2 --runs 20000 --accuracy 0.5
+#   python -m src.batchsim --runs 5000 --workers 1 --json balance.json
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from src.config import LEVELS, SIM_TICK_RATE
+from src.entities import Student
+from src.level import Level, LevelEvent, START_CELL
+
+
+# Läufe pro Paket (ein Paket = eine Aufgabe für einen Worker-Prozess).
+# Alle Semester laufen über EINEN Pool, große Pakete halten den Overhead
+# fürs Verschicken klein.
+CHUNK_RUNS = 1000
+
+# Fehler, ab denen das Semester verloren ist (wie in Game.resolve_question)
+MAX_MISTAKES = 3
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+# ------------------------------------------------------------
+# Strategie: nächstes ECTS ansteuern
+# ------------------------------------------------------------
+def choose_move(level: Level, student: Student) -> tuple[int, int] | None:
+    """
+    Schritt Richtung nächstes ECTS (Manhattan-Abstand, Graben kostet nichts).
+    Felder mit Prof werden gemieden, solange es einen anderen guten Schritt gibt.
+    """
+    if not level.ects_items:
+        return None
+    sx, sy = student.grid_x, student.grid_y
+    target = min(level.ects_items, key=lambda e: abs(e.gx - sx) + abs(e.gy - sy))
+
+    good = []
+    for dx, dy in DIRECTIONS:
+        nx, ny = sx + dx, sy + dy
+        if abs(target.gx - nx) + abs(target.gy - ny) < abs(target.gx - sx) + abs(target.gy - sy):
+            good.append((dx, dy))
+    if not good:
+        return None
+
+    for dx, dy in good:
+        if not level.is_prof_at(sx + dx, sy + dy):
+            return dx, dy
+    return good[0]
+
+
+# ------------------------------------------------------------
+# Ein Semester durchspielen
+# ------------------------------------------------------------
+def simulate(level_index: int, seed: int, moves_per_second: float, accuracy: float) -> dict:
+    """
+    Spielt ein Level wie Game.step/Game.handle_key durch (feste Schritte
+    mit SIM_TICK_RATE) und gibt die Kennzahlen dieses Laufs zurück.
+
+    Schritte, in denen nichts passiert (kein Tastendruck, nichts in der
+    Zeitleiste des Levels fällig), werden am Stück mit einem level.update()
+    erledigt - statt ~60 Aufrufen pro Sekunde nur einer pro Ereignis.
+    """
+    level = Level(level_index=level_index, seed=seed)
+    student = Student(*START_CELL)
+    level.dig(*START_CELL)
+
+    # eigener Zufall für die Antworten, damit das Level-RNG unverändert bleibt
+    answers = random.Random(seed ^ 0x5EED)
+
+    dt = 1.0 / SIM_TICK_RATE
+    steps_per_move = max(1, round(SIM_TICK_RATE / moves_per_second))
+    max_steps = int(level.timer.duration * SIM_TICK_RATE) + 1
+
+    mistakes = 0
+    encounters = 0
+    questions = 0
+    correct = 0
+    ects_times: list[float] = []
+    elapsed = 0.0
+
+    def ask(prof) -> None:
+        # wie Game.open_question + Game.resolve_question
+        nonlocal mistakes, questions, correct
+        questions += 1
+        prof.get_question()
+        if answers.random() < accuracy:
+            correct += 1
+            level.answer_question(prof, True)
+        else:
+            mistakes += 1
+            if mistakes >= MAX_MISTAKES:
+                level.is_game_over = True
+                level.game_over_reason = "Zu viele Fehler."
+                return
+            level.answer_question(prof, False)
+
+    def collect_events() -> None:
+        for event in level.pop_events():
+            if event is LevelEvent.ECTS_COLLECTED:
+                ects_times.append(elapsed)
+
+    step = 0
+    while step < max_steps:
+        if level.is_finished:
+            break
+
+        # Eingabe: alle steps_per_move Schritte ein Feld weiter
+        if step % steps_per_move == 0:
+            move = choose_move(level, student)
+            if move is not None:
+                prof = student.move(move[0], move[1], level)
+                collect_events()
+                if prof is not None:
+                    encounters += 1
+                    ask(prof)
+                    if level.is_finished:
+                        break
+
+        # Schritte bis zum nächsten Ereignis (Tastendruck oder Eintrag in der
+        # Zeitleiste), dazwischen ändert sich nur der BAföG-Timer
+        ticks = steps_per_move - step % steps_per_move
+        due_in = level.clock.next_due_in()
+        if due_in is not None:
+            ticks = min(ticks, max(1, math.ceil(due_in * SIM_TICK_RATE - 1e-6)))
+        ticks = min(ticks, max_steps - step)
+        if level.is_prof_at(student.grid_x, student.grid_y):
+            ticks = 1  # Prof bleibt stehen -> wie im Spiel jeden Schritt neue Begegnung
+
+        # feste Simulationsschritte (wie Game.step), am Stück
+        level.update(dt * ticks)
+        elapsed += dt * ticks
+        step += ticks
+        prof = level.player_contact(student)
+        if LevelEvent.SHIELD_USED in level.pop_events():
+            encounters += 1  # Pizza-Schild hat einen Prof abgewehrt
+        if prof is not None:
+            encounters += 1
+            ask(prof)
+
+    return {
+        "won": level.is_won,
+        "timeout": level.timer.is_over and not level.is_won,
+        "mistakes_out": mistakes >= MAX_MISTAKES,
+        "time_left": level.timer.time_left,
+        "ects_times": ects_times,
+        "encounters": encounters,
+        "questions": questions,
+        "correct": correct,
+    }
+
+
+# ------------------------------------------------------------
+# Pakete + Zusammenfassen
+# ------------------------------------------------------------
+def _empty_totals() -> dict:
+    return {"runs": 0, "wins": 0, "timeouts": 0, "mistakes_out": 0,
+            "time_left_won": 0.0, "ects_collected": 0, "ects_time": 0.0,
+            "encounters": 0, "questions": 0, "correct": 0}
+
+
+def run_chunk(task: tuple[int, int, int, float, float]) -> tuple[int, dict]:
+    """Worker: count Läufe ab first_seed für ein Level, nur Summen zurück."""
+    level_index, first_seed, count, moves_per_second, accuracy = task
+    totals = _empty_totals()
+    for seed in range(first_seed, first_seed + count):
+        r = simulate(level_index, seed, moves_per_second, accuracy)
+        totals["runs"] += 1
+        if r["won"]:
+            totals["wins"] += 1
+            totals["time_left_won"] += r["time_left"]
+        totals["timeouts"] += r["timeout"]
+        totals["mistakes_out"] += r["mistakes_out"]
+        totals["ects_collected"] += len(r["ects_times"])
+        totals["ects_time"] += sum(r["ects_times"])
+        totals["encounters"] += r["encounters"]
+        totals["questions"] += r["questions"]
+        totals["correct"] += r["correct"]
+    return level_index, totals
+
+
+def summarize(level_index: int, t: dict) -> dict:
+    runs = max(1, t["runs"])
+    return {
+        "level": level_index + 1,
+        "config": LEVELS[level_index],
+        "runs": t["runs"],
+        "win_rate": t["wins"] / runs,
+        "timeout_rate": t["timeouts"] / runs,
+        "mistakes_rate": t["mistakes_out"] / runs,
+        # nur gewonnene Läufe: wie viel BAföG-Zeit war noch übrig?
+        "time_left_won_s": t["time_left_won"] / t["wins"] if t["wins"] else None,
+        # Zeitpunkt (ab Levelstart), zu dem ein Coin eingesammelt wurde, gemittelt
+        "ects_time_s": t["ects_time"] / t["ects_collected"] if t["ects_collected"] else None,
+        "encounters_per_run": t["encounters"] / runs,
+        "questions_per_run": t["questions"] / runs,
+        "correct_per_run": t["correct"] / runs,
+    }
+
+
+def run_batch(levels: list[int], runs: int, seed: int, moves_per_second: float,
+              accuracy: float, workers: int) -> list[dict]:
+    tasks = []
+    for level_index in levels:
+        for start in range(0, runs, CHUNK_RUNS):
+            count = min(CHUNK_RUNS, runs - start)
+            tasks.append((level_index, seed + start, count, moves_per_second, accuracy))
+
+    totals = {i: _empty_totals() for i in levels}
+
+    def merge(result):
+        level_index, part = result
+        for key, value in part.items():
+            totals[level_index][key] += value
+
+    if workers == 1:
+        for task in tasks:
+            merge(run_chunk(task))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for result in pool.imap_unordered(run_chunk, tasks):
+                merge(result)
+
+    return [summarize(i, totals[i]) for i in levels]
+
+
+def _fmt(value, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch-Simulator für die LEVELS-Tabelle von Dig Or Exma")
+    parser.add_argument("--runs", type=int, default=10000, help="Läufe pro Semester")
+    parser.add_argument("--levels", help="Komma-Liste der Semester (1-basiert), Standard: alle")
+    parser.add_argument("--seed", type=int, default=0, help="erster Seed (Lauf i nutzt seed + i)")
+    parser.add_argument("--moves-per-second", type=float, default=4.0, help="Tastendrücke des Bots pro Sekunde")
+    parser.add_argument("--accuracy", type=float, default=0.6, help="Anteil richtig beantworteter Fragen")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Prozesse (1 = ohne Pool)")
+    parser.add_argument("--json", dest="json_path", help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    if args.levels:
+        levels = [int(x) - 1 for x in args.levels.split(",") if x.strip()]
+        bad = [i + 1 for i in levels if not 0 <= i < len(LEVELS)]
+        if bad:
+            parser.error(f"unbekannte Semester: {', '.join(map(str, bad))} (1-{len(LEVELS)})")
+    else:
+        levels = list(range(len(LEVELS)))
+
+    t0 = time.perf_counter()
+    results = run_batch(levels, args.runs, args.seed, args.moves_per_second, args.accuracy, args.workers)
+    elapsed = time.perf_counter() - t0
+
+    total = args.runs * len(levels)
+    print(f"{total} Läufe in {elapsed:.1f} s ({total / max(elapsed, 1e-9):.0f} Läufe/s, {args.workers} Prozesse)")
+    print(f"{'Sem':<5}{'win %':>8}{'timeout %':>11}{'fehler %':>10}{'rest s':>9}"
+          f"{'ECTS s':>9}{'Profs':>8}{'Fragen':>8}{'richtig':>9}")
+    for r in results:
+        print(f"{r['level']:<5}{r['win_rate'] * 100:>8.1f}{r['timeout_rate'] * 100:>11.1f}"
+              f"{r['mistakes_rate'] * 100:>10.1f}{_fmt(r['time_left_won_s'], '.1f'):>9}"
+              f"{_fmt(r['ects_time_s'], '.1f'):>9}{r['encounters_per_run']:>8.2f}"
+              f"{r['questions_per_run']:>8.2f}{r['correct_per_run']:>9.2f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "seed": args.seed, "moves_per_second": args.moves_per_second,
+                       "accuracy": args.accuracy, "results": results}, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# bench.py
+# ----------------------------------------------------------
+# Headless-Render-Benchmark (ohne echten Bildschirm).
+#
+# Läuft mit dem SDL-Dummy-Treiber und einer frei wählbaren virtuellen
+# Auflösung, zeichnet für jeden State N Frames und gibt Mittelwert,
+# p95 und p99 der Frame-Zeiten sowie Python-Allokationen pro Frame aus.
+# Damit können wir Render-Regressionen auch auf CI-Rechnern ohne
+# Display erkennen.
+#
+# Aufruf (aus dem Projektordner, wie das Spiel selbst):
+#   python -m src.bench --frames 300 --size 1920x1080
+#   python -m src.bench --states running,question --json bench.json
+#   python -m src.bench --fail-above 8.0     (Exit-Code 1, wenn p95 > 8 ms)
+#   python -m src.bench --size 3840x2160 --logical 960x540   (logische Auflösung)
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Muss vor dem ersten pygame.init() gesetzt sein
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.game import Game, GameState
+
+
+SCENARIOS = ("running", "question", "game_over", "level_complete", "paused")
+
+# Bewegungen, die der "Bot" im running-Szenario abwechselnd macht
+MOVES = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT, pygame.K_UP)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _prepare(game: Game, scenario: str) -> None:
+    """Bringt das Spiel in einen typischen Zustand für das Szenario."""
+    game.state = GameState.RUNNING
+    game.restart()
+
+    if scenario == "question":
+        if game.level.professors:
+            game.open_question(game.level.professors[0])
+    elif scenario == "game_over":
+        game.level.is_game_over = True
+        game.level.game_over_reason = "BAföG-Zeit abgelaufen."
+        game.state = GameState.GAME_OVER
+        game.game_over_animation.start()
+    elif scenario == "level_complete":
+        game.level.is_won = True
+        game.state = GameState.LEVEL_COMPLETE
+    elif scenario == "paused":
+        game.state = GameState.PAUSED
+
+
+def _frame(game: Game, scenario: str, i: int, dt: float) -> None:
+    """Ein Frame: ein fester Simulationsschritt (wie im Spiel) + Zeichnen."""
+    if scenario == "running":
+        if i % 15 == 0:
+            game.handle_key(MOVES[(i // 15) % len(MOVES)])
+    # feste Schrittweite -> Simulation und Animationen laufen in jedem Lauf gleich
+    game.step(dt)
+    if scenario != "running":
+        # Standbilder werden im Spiel nur nach Eingaben neu gezeichnet.
+        # Hier wollen wir aber die Kosten eines echten Frames messen.
+        game.renderer.request_full_redraw()
+
+    game.draw()
+
+
+def run_scenario(game: Game, scenario: str, frames: int, warmup: int) -> dict:
+    dt = game.sim_step
+    target = None
+
+    def ensure_state():
+        nonlocal target
+        # Wenn der Bot z.B. in einen Prof läuft, wechselt der State -> neu aufsetzen
+        if target is None or game.state != target:
+            _prepare(game, scenario)
+            target = game.state
+
+    # Aufwärmen (Caches füllen, erster Full-Redraw)
+    for i in range(warmup):
+        ensure_state()
+        _frame(game, scenario, i, dt)
+
+    # 1) Zeiten messen
+    times_ms: list[float] = []
+    for i in range(frames):
+        ensure_state()
+        t0 = time.perf_counter()
+        _frame(game, scenario, i, dt)
+        times_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    # 2) Allokationen messen (eigener Durchlauf, tracemalloc bremst die Zeiten)
+    tracemalloc.start()
+    peaks: list[int] = []
+    start_current, _ = tracemalloc.get_traced_memory()
+    for i in range(frames):
+        ensure_state()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        _frame(game, scenario, i, dt)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    end_current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "scenario": scenario,
+        "frames": frames,
+        "mean_ms": statistics.fmean(times_ms),
+        "p95_ms": _percentile(times_ms, 95),
+        "p99_ms": _percentile(times_ms, 99),
+        "max_ms": max(times_ms),
+        "alloc_peak_kb_per_frame": statistics.fmean(peaks) / 1024.0,
+        "retained_kb": (end_current - start_current) / 1024.0,
+    }
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless-Render-Benchmark für Dig Or Exma")
+    parser.add_argument("--frames", type=int, default=300, help="gemessene Frames pro Szenario")
+    parser.add_argument("--warmup", type=int, default=30, help="Frames zum Aufwärmen (nicht gemessen)")
+    parser.add_argument("--size", type=_parse_size, default=(1920, 1080), help="virtuelle Auflösung, z.B. 3840x2160")
+    parser.add_argument("--logical", type=_parse_size, default=None,
+                        help="logische Render-Auflösung (pygame.SCALED), z.B. 960x540")
+    parser.add_argument("--states", default=",".join(SCENARIOS), help="Komma-Liste aus: " + ", ".join(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=23, help="Zufalls-Seed für den Level-Aufbau")
+    parser.add_argument("--json", dest="json_path", help="Ergebnisse zusätzlich als JSON speichern")
+    parser.add_argument("--fail-above", type=float, help="Exit-Code 1, wenn ein p95 (ms) darüber liegt")
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.states.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unbekannte States: {', '.join(unknown)}")
+
+    game = Game(display_size=args.size, logical_size=args.logical, seed=args.seed)
+
+    results = [run_scenario(game, s, args.frames, args.warmup) for s in scenarios]
+
+    logical = f" (logisch {args.logical[0]}x{args.logical[1]})" if args.logical else ""
+    print(f"Auflösung {args.size[0]}x{args.size[1]}{logical}, {args.frames} Frames pro State")
+    print(f"{'State':<16}{'mean ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'alloc KB/f':>12}{'retained KB':>13}")
+    for r in results:
+        print(f"{r['scenario']:<16}{r['mean_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}"
+              f"{r['max_ms']:>10.3f}{r['alloc_peak_kb_per_frame']:>12.1f}{r['retained_kb']:>13.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"size": list(args.size), "results": results}, f, indent=2)
+
+    pygame.quit()
+
+    if args.fail_above is not None and any(r["p95_ms"] > args.fail_above for r in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import pygame
 import sys
+from src.text_cache import render_text
 hover_aenderung=5  # globale Hover-Vergrößerung (Pixelanzahl um die der Button wächst)
 
 
@@ -29,37 +30,55 @@ class Button:
         self.rect=pygame.Rect(x,y,self.breite_orginal,self.hoehe_orginal) 
         # Das Rechteck, das Position und Größe repräsentiert (wird dynamisch verändert)
 
+        self.hover=False    #liegt die Maus gerade über dem Button?
 
-    def draw (self,screen):
-        #zeichnet den Button auf den Screen
-        #parameter screen: das pygame-fenster
-        pygame.draw.rect(screen,self.buttonfarbe,self.rect)  # zeichnet das Rechteck
+        #Button + Text einmal für beide Zustände vorrendern, statt jeden Frame
+        self.surface_normal=self._render(self.breite_orginal,self.hoehe_orginal)
+        self.surface_hover=self._render(self.breite_orginal+hover_aenderung,
+                                        self.hoehe_orginal+hover_aenderung)
+
+
+    def _render (self,breite,hoehe):
+        #baut die fertige Button-Grafik in der gegebenen Größe
+        surface=pygame.Surface((breite,hoehe)).convert()
+        surface.fill(self.buttonfarbe)
         if self.text and self.schriftart:
-            text_surface=self.schriftart.render(
-                self.text, True, self.schriftfarbe
+            text_surface=render_text(
+                self.schriftart, self.text, self.schriftfarbe
             )
             text_rect= text_surface.get_rect(
-                center=self.rect.center
+                center=surface.get_rect().center
             )
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+        return surface
 
 
-    def b_groesse_aendern (self,mausposition):
-        #Passt die Buttongröße an, wenn der Mauszeiger darüber ist (Hover-Effekt).
-        #Mauspositon: Aktuelle Mausposition als Tupel
-        mausposition=pygame.mouse.get_pos() #holt aktuelle Mausposition
-        if self.rect.collidepoint(mausposition):
-            #Button befindet sich unter der Maus =größer zeichnen
-            neue_breite = self.breite_orginal+hover_aenderung
-            neue_hoehe=self.hoehe_orginal+hover_aenderung
+    def draw (self,screen):
+        #zeichnet den Button auf den Screen (vorgerendertes Bild)
+        #parameter screen: das pygame-fenster
+        #return: gezeichnetes Rechteck (für Dirty-Rects)
+        if self.hover:
+            return screen.blit(self.surface_hover,self.rect)
+        return screen.blit(self.surface_normal,self.rect)
 
+
+    def set_hover (self,mausposition):
+        #Hover-Zustand nur bei MOUSEMOTION aktualisieren (Hover-Effekt).
+        #Mauspositon: Position aus dem Event als Tupel
+        #return True wenn sich der Zustand geändert hat (dann neu zeichnen)
+        hover=bool(self.rect.collidepoint(mausposition))
+        if hover==self.hover:
+            return False
+        self.hover=hover
+
+        if hover:
+            #Button befindet sich unter der Maus =größer zeichnen
             verschiebung_x=hover_aenderung//2 #zentriert verschiebung x
             verschiebung_y=hover_aenderung//2 #zentriert verschiebung y
-            
-            #neue größe setzen
-            self.rect.width=neue_breite
-            self.rect.height=neue_hoehe
-            #button wächst zur mitte hin position korriegieren
+
+            #neue größe setzen, button wächst zur mitte hin -> position korrigieren
+            self.rect.width=self.breite_orginal+hover_aenderung
+            self.rect.height=self.hoehe_orginal+hover_aenderung
             self.rect.x=self.x_orginal-verschiebung_x
             self.rect.y=self.y_orginal-verschiebung_y
 
@@ -69,17 +88,15 @@ class Button:
             self.rect.height=self.hoehe_orginal
             self.rect.x=self.x_orginal
             self.rect.y=self.y_orginal
+        return True
 
 
-    def is_clicked (self):
-        #prüft ob der Button mit der linken Maustaste angeklickt wurde.
-        #return true wenn geklickt wurde sonst False
-        mausposition=pygame.mouse.get_pos() #aktuelle Position
-        mausklick=pygame.mouse.get_pressed()    #aktueller Status der Maustaste
+    def b_groesse_aendern (self,mausposition):
+        #alter Name, macht dasselbe wie set_hover
+        self.set_hover(mausposition)
 
-        if  self.rect.collidepoint(mausposition) and mausklick[0]:
-            return True
-        else:
-           return False
 
-            
\ No newline at end of file
+    def is_clicked (self,mausposition):
+        #prüft ob ein Klick (Position aus MOUSEBUTTONDOWN) den Button trifft.
+        #return true wenn geklickt wurde sonst False
+        return self.rect.collidepoint(mausposition)
@@ -0,0 +1,90 @@
+# camera.py
+# ----------------------------------------------------------
+# Kamera / Viewport für große Spielfelder.
+#
+# Früher wurde die Kachelgröße so klein gerechnet, dass das komplette
+# Grid in den Gamepad-Bildschirm passt, und jedes Feld wurde gezeichnet.
+# Jetzt zeigt der Bildschirm höchstens VIEWPORT_COLS x VIEWPORT_ROWS
+# Felder, die Kamera folgt dem Studenten und gezeichnet wird nur, was
+# im sichtbaren Ausschnitt liegt. Die Render-Kosten hängen damit von
+# der Bildschirmgröße ab, nicht mehr von der Level-Größe.
+#
+# Die Kamera springt feldweise (kein weiches Scrollen), damit Tiles und
+# Sprites pixelgenau auf dem Raster bleiben.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+
+
+class Camera:
+    def __init__(self, view_cols: int, view_rows: int, tile_size: int, margin: int = 2):
+        # maximale Größe des Ausschnitts (in Feldern)
+        self.max_cols = view_cols
+        self.max_rows = view_rows
+        self.tile_size = tile_size
+
+        # so viele Felder Abstand zum Rand, bevor die Kamera nachzieht
+        self.margin = margin
+
+        # aktueller Ausschnitt: linkes oberes Feld + Größe
+        self.x = 0
+        self.y = 0
+        self.cols = view_cols
+        self.rows = view_rows
+
+        # Größe des Levels (zum Begrenzen)
+        self.level_cols = view_cols
+        self.level_rows = view_rows
+
+    def reset(self, level_cols: int, level_rows: int, target_x: int = 0, target_y: int = 0) -> None:
+        """Auf ein neues Level einstellen und direkt auf das Ziel zentrieren."""
+        self.level_cols = level_cols
+        self.level_rows = level_rows
+        # kleine Level passen ganz rein -> Kamera steht still
+        self.cols = min(self.max_cols, level_cols)
+        self.rows = min(self.max_rows, level_rows)
+
+        self.x = self._clamp(target_x - self.cols // 2, self.level_cols - self.cols)
+        self.y = self._clamp(target_y - self.rows // 2, self.level_rows - self.rows)
+
+    @staticmethod
+    def _clamp(value: int, maximum: int) -> int:
+        return max(0, min(value, maximum))
+
+    def follow(self, target_x: int, target_y: int) -> bool:
+        """
+        Zieht die Kamera nach, wenn das Ziel zu nah an den Rand kommt.
+        Rückgabe: True, wenn sich der Ausschnitt verschoben hat.
+        """
+        # Randabstand darf bei sehr kleinen Ausschnitten nicht über die Mitte gehen
+        mx = min(self.margin, (self.cols - 1) // 2)
+        my = min(self.margin, (self.rows - 1) // 2)
+
+        x, y = self.x, self.y
+        if target_x < x + mx:
+            x = target_x - mx
+        elif target_x > x + self.cols - 1 - mx:
+            x = target_x - (self.cols - 1 - mx)
+        if target_y < y + my:
+            y = target_y - my
+        elif target_y > y + self.rows - 1 - my:
+            y = target_y - (self.rows - 1 - my)
+
+        x = self._clamp(x, self.level_cols - self.cols)
+        y = self._clamp(y, self.level_rows - self.rows)
+
+        moved = (x, y) != (self.x, self.y)
+        self.x, self.y = x, y
+        return moved
+
+    def visible(self, gx: int, gy: int) -> bool:
+        """True, wenn das Feld (gx, gy) im sichtbaren Ausschnitt liegt."""
+        return self.x <= gx < self.x + self.cols and self.y <= gy < self.y + self.rows
+
+    def offset(self, screen_x: int, screen_y: int) -> tuple[int, int]:
+        """
+        Pixel-Offset für Grid-Objekte: liegt der Ausschnitt bei screen_x/screen_y,
+        landet Feld (gx, gy) bei offset + (gx, gy) * tile_size.
+        """
+        return (screen_x - self.x * self.tile_size,
+                screen_y - self.y * self.tile_size)
@@ -12,6 +12,12 @@ from src.questions import questions as raw_questions_data
 GRID_COLS = 15         #wie viele Kacheln breit
 GRID_ROWS = 9          #wie viele Kacheln hoch
 
+#Sichtbarer Ausschnitt (Kamera, siehe camera.py): so viele Kacheln passen
+#höchstens in den Gamepad-Bildschirm. Ist das Level größer, scrollt die
+#Kamera mit dem Studenten mit (z.B. GRID_COLS = GRID_ROWS = 200).
+VIEWPORT_COLS = 15
+VIEWPORT_ROWS = 9
+
 #Abstand zum Bildschirmrand (in Kacheln), damit alles zentriert ist
 GRID_MARGIN_X_TILES = 2
 GRID_MARGIN_Y_TILES = 2
@@ -22,8 +28,73 @@ BAFOEG_TIME_SECONDS = 60.0
 #Wie viele ECTS brauche ich, um das Level zu bestehen?
 REQUIRED_ECTS = 5
 
+#Level-Generator: so lange braucht ein Spieler pro Schritt (Sekunden).
+#Damit prüft Level, ob die ECTS in der BAföG-Zeit erreichbar sind,
+#sonst wird höchstens LEVEL_GEN_MAX_ATTEMPTS-mal neu gewürfelt.
+PLAYER_STEP_SECONDS = 0.25   #durch einen offenen Tunnel
+PLAYER_DIG_SECONDS = 0.4     #in Erde (graben)
+LEVEL_GEN_MAX_ATTEMPTS = 20
+
+#Prof-Jagd (siehe flowfield.py): ist der Student höchstens so viele Schritte
+#durch gegrabene Tunnel entfernt, läuft ein Prof auf ihn zu, sonst irrt er
+#zufällig herum. 0 -> Profs laufen immer zufällig (wie früher).
+PROF_CHASE_RADIUS = 12
+
+#Wach-Profs (guard_mode) bleiben an der Leine: höchstens so viele Wegkosten
+#vom bewachten ECTS entfernt (Tunnel-Schritt 1, Erde 2, siehe guard.py)
+GUARD_LEASH = 6
+
+#So lange bleibt eine PowerUp-Meldung unten im HUD stehen (Sekunden Spielzeit)
+POWERUP_MESSAGE_SECONDS = 4.0
+
 WHITE = (255, 255, 255)
 
+#Speichergrenze für gerenderte Texte (HUD, Menüs, Meldungen), siehe text_cache.py
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+#Speichergrenze für geladene/skalierte Bilder, siehe assets.py
+#(Bilder, die gerade benutzt werden, bleiben immer im Cache)
+ASSET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+#Grid-Objekte (Coins, PowerUps, Profs, Student) gesammelt mit Surface.blits()
+#zeichnen statt einzeln. Im Spiel mit F4 umschaltbar (zum Vergleichen/Profilen).
+BATCHED_BLITS = True
+
+#Render-Modus:
+# None       -> native Auflösung, alle Sprites werden auf die echte Kachelgröße skaliert
+# (w, h)     -> feste logische Auflösung, gezeichnet wird immer in dieser Größe und
+#               pygame.SCALED skaliert das fertige Bild einmal pro Frame auf den Monitor.
+#               (960, 540) = 3x Gamepad-Grafik -> Kacheln sind 32px, also genau die
+#               Originalgröße der Student-Sprites. Kosten pro Frame sind dann auf
+#               1080p, 1440p und 4K gleich.
+LOGICAL_RESOLUTION = None
+
+#HUD und Buttons sind in Pixeln für diese Bildhöhe angegeben und werden
+#auf andere (auch logische) Auflösungen mitskaliert.
+HUD_REFERENCE_HEIGHT = 1080
+
+#Event-gesteuertes Neuzeichnen: der GameLoop schläft, bis eine Eingabe kommt
+#oder sich sichtbar etwas ändert (Standbilder kosten dann fast keine CPU).
+#False -> wie früher jeden Frame mit 60 FPS.
+EVENT_DRIVEN_REDRAW = True
+
+#Feste Simulationsschritte (unabhängig von der Framerate):
+#Level/Timer/Profs/Buffs laufen immer mit SIM_TICK_RATE Schritten pro Sekunde.
+#Nach einem Hänger werden höchstens SIM_MAX_CATCHUP_STEPS Schritte nachgeholt,
+#der Rest wird verworfen (lieber kurz langsamer als alles auf einmal).
+#RENDER_FPS_CAP = 0 -> Zeichnen ohne Begrenzung.
+SIM_TICK_RATE = 60
+SIM_MAX_CATCHUP_STEPS = 15
+RENDER_FPS_CAP = 60
+
+#Nächstes Semester / Neustart im Hintergrund-Thread vorbauen (siehe prebuild.py),
+#damit der Wechsel ohne Hänger passiert. False -> Level erst beim Wechsel bauen.
+PREBUILD_LEVELS = True
+
+#Frame-Profiler (F3): Zeitbudget pro Frame bei 60 FPS und Länge des Graphen
+FRAME_BUDGET_MS = 1000.0 / 60.0
+PROFILER_HISTORY_FRAMES = 180
+
 
 
 @dataclass #wir benutzen Dataclass, um uns Schreibarbeit zu sparen und den Code übersichtlicher zu machen
@@ -89,6 +160,7 @@ for q_id, data in raw_questions_data.items():
         if prof_key == "klausur":
             prof_entry["sprite"] = "assets/sprites/Prüfung.png"
             prof_entry["hp"] = 3
+            prof_entry["speed"] = 0.5  # halb so viele Schritte wie ein normaler Prof
 
         PROFESSORS.append(prof_entry)
         prof_id_counter += 1
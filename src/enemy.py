@@ -1,5 +1,4 @@
 import random
-import pygame
 from src.entities import Entity
 
 # Wir holen uns die Fragen direkt aus unserer "Datenbank" (questions.py)
@@ -23,9 +22,17 @@ class Enemy(Entity):
     Basisklasse für alle Gegner (Dozenten & Klausuren).
     Hier steckt die Logik für Bewegung, Lebenspunkte und Fragen drin.
     """
-    def __init__(self, grid_x: int, grid_y: int, tile_size: int, sprite: pygame.Surface, hp: int):
-        # Position und Grafik an die Mutterklasse (Entity) weitergeben
-        super().__init__(grid_x, grid_y, tile_size, sprite)
+    def __init__(self, grid_x: int, grid_y: int, hp: int, rng: random.Random | None = None,
+                 sprite_path: str | None = None, speed: float = 1.0):
+        # Position an die Mutterklasse (Entity) weitergeben
+        super().__init__(grid_x, grid_y)
+
+        # Nur der Pfad aus der Config - das Bild lädt die Darstellung (presentation.py)
+        self.sprite_path = sprite_path
+
+        # Zufall kommt vom Level (gleicher Seed -> gleiche Bewegungen, wichtig für Replays).
+        # Ohne Level-RNG nehmen wir wie früher das globale random-Modul.
+        self.rng = rng if rng is not None else random
         
         self.hp = hp
         self.max_hp = hp
@@ -34,9 +41,18 @@ class Enemy(Entity):
         # damit ich mit random.choice() einfach zufällige Fragen ziehen kann.
         self.questions_pool = list(QUESTION_DB.values())
         
-        # Kleiner Zufalls-Timer für die Bewegung, damit nicht alle Gegner
+        # Schritte pro Sekunde relativ zum Standard-Prof (0.5 = halb so oft)
+        self.speed = speed
+
+        # Kleine Zufalls-Wartezeit bis zum ersten Schritt, damit nicht alle Gegner
         # exakt gleichzeitig loslaufen (sieht natürlicher aus).
-        self._move_cooldown = random.uniform(0.5, 1.5)
+        self.first_move_in = self.rng.uniform(0.5, 1.5) / speed
+
+        # Eintrag in der Zeitleiste des Levels (timeline.py, setzt das Level)
+        self.turn = None
+
+        # Revier, falls der Prof ein ECTS bewacht (guard.py, setzt das Level)
+        self.guard = None
 
     def get_question(self) -> dict:
         """
@@ -53,7 +69,7 @@ class Enemy(Entity):
             }
         
         # Zufällige Frage auswählen
-        return random.choice(self.questions_pool)
+        return self.rng.choice(self.questions_pool)
 
     def take_answer(self) -> bool:
         """
@@ -67,25 +83,37 @@ class Enemy(Entity):
         
         return self.hp <= 0
 
-    def update(self, dt: float, level) -> None:
+    def take_turn(self, level) -> float:
         """
         Steuert die KI-Bewegung des Gegners.
-        Wird jeden Frame vom Level aufgerufen.
+        Wird vom Level aufgerufen, wenn der Gegner laut Zeitleiste dran ist.
+        Rückgabe: Sekunden bis zum nächsten Schritt (leicht zufällig).
         """
-        # Cooldown runterzählen
-        self._move_cooldown -= dt
-        
-        # Wenn wir noch warten müssen oder das Level vorbei ist -> nix tun
-        if self._move_cooldown > 0 or level.is_finished:
+        delay = self.rng.uniform(0.8, 1.2) / self.speed
+        self._step(level)
+        return delay
+
+    def _step(self, level) -> None:
+        # Jagen: ist der Student durch die Tunnel erreichbar, einen Schritt das
+        # gemeinsame Distanzfeld des Levels hinunter (flowfield.py) - O(1) pro Prof.
+        # So läuft ein Prof im Tunnel nie durch die Erde.
+        target = level.chase_step(self.grid_x, self.grid_y)
+        # Wachen jagen nur, solange sie dabei in ihrem Revier bleiben
+        if target is not None and self.guard is not None and target not in self.guard:
+            target = None
+        if target is not None:
+            if target != (self.grid_x, self.grid_y):
+                level.move_professor(self, *target)
             return
 
-        # Cooldown neu setzen (leicht zufällig)
-        self._move_cooldown = random.uniform(0.8, 1.2)
+        if self.guard is not None:
+            self._patrol(level)
+            return
 
-        # Versuchen, in eine zufällige Richtung zu laufen
+        # Sonst wie bisher: versuchen, in eine zufällige Richtung zu laufen
         # (Oben, Unten, Links, Rechts)
         directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        random.shuffle(directions)
+        self.rng.shuffle(directions)
 
         for dx, dy in directions:
             nx, ny = self.grid_x + dx, self.grid_y + dy
@@ -95,24 +123,44 @@ class Enemy(Entity):
                 continue
             
             # Check: Steht da schon ein anderer Prof? (Wir wollen nicht stapeln)
-            # 'level.professors' ist die Liste aller Gegner im Level
-            if hasattr(level, 'professors') and any(e.grid_x == nx and e.grid_y == ny for e in level.professors):
+            # Das Level hat dafür einen Belegungs-Index (O(1) statt alle Profs durchgehen)
+            if level.is_prof_at(nx, ny):
                 continue
                 
-            # Wenn alles frei ist -> Position updaten und Schleife abbrechen
-            self.grid_x = nx
-            self.grid_y = ny
+            # Wenn alles frei ist -> Position updaten (über das Level, damit der
+            # Index mitkommt) und Schleife abbrechen
+            level.move_professor(self, nx, ny)
             break
 
+    def _patrol(self, level) -> None:
+        """
+        Wache: im Revier zufällig Streife laufen, ohne es zu verlassen.
+        Ist der Prof draußen (z.B. Spawn neben dem ECTS war belegt), geht
+        er auf direktem Weg zurück zum Posten.
+        """
+        x, y = self.grid_x, self.grid_y
+        if (x, y) in self.guard:
+            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+            self.rng.shuffle(directions)
+            cells = [(x + dx, y + dy) for dx, dy in directions if (x + dx, y + dy) in self.guard]
+        else:
+            cells = self.guard.way_home(x, y)
+
+        for nx, ny in cells:
+            if level.in_bounds(nx, ny) and not level.is_prof_at(nx, ny):
+                level.move_professor(self, nx, ny)
+                break
+
 
 class Dozent(Enemy):
     """
     Der Standard-Gegner.
     Braucht nur 1 richtige Antwort, um besiegt zu werden.
     """
-    def __init__(self, grid_x: int, grid_y: int, tile_size: int, sprite: pygame.Surface):
+    def __init__(self, grid_x: int, grid_y: int, rng: random.Random | None = None,
+                 sprite_path: str | None = None, speed: float = 1.0):
         # Ruft den Enemy-Konstruktor mit 1 HP auf
-        super().__init__(grid_x, grid_y, tile_size, sprite, hp=1)
+        super().__init__(grid_x, grid_y, hp=1, rng=rng, sprite_path=sprite_path, speed=speed)
 
 
 class Klausur(Enemy):
@@ -120,14 +168,10 @@ class Klausur(Enemy):
     Der Boss-Gegner.
     Braucht 5 richtige Antworten und bewegt sich langsamer.
     """
-    def __init__(self, grid_x: int, grid_y: int, tile_size: int, sprite: pygame.Surface):
-        # Klausuren sind zäh: 5 HP
-        super().__init__(grid_x, grid_y, tile_size, sprite, hp=5)
-    
-    def update(self, dt: float, level) -> None:
-        # Trick: Ich übergebe nur die halbe Zeit (dt * 0.5) an die Update-Funktion.
-        # Dadurch läuft der Timer langsamer ab und die Klausur bewegt sich nur halb so oft.
-        super().update(dt * 0.5, level)
+    def __init__(self, grid_x: int, grid_y: int, rng: random.Random | None = None,
+                 sprite_path: str | None = None):
+        # Klausuren sind zäh: 5 HP, und bewegen sich nur halb so oft
+        super().__init__(grid_x, grid_y, hp=5, rng=rng, sprite_path=sprite_path, speed=0.5)
 
 # Damit der alte Code in level.py nicht crasht, der noch "ProfessorEnemy" sucht:
 ProfessorEnemy = Dozent
@@ -0,0 +1,99 @@
+# flowfield.py
+# ----------------------------------------------------------
+# Gemeinsames Distanzfeld ("Flow Field") für die Prof-Jagd.
+#
+# Statt dass jeder Prof selbst einen Weg zum Studenten sucht (A* pro
+# Prof und Schritt), gibt es EIN Feld: für jedes Tunnel-Feld die Anzahl
+# Schritte bis zum Studenten (BFS über gegrabene Felder). Ein Prof schaut
+# nur auf seine vier Nachbarn und geht zu einem mit kleinerer Distanz -
+# O(1) pro Prof, egal wie viele es sind.
+#
+# Neu gerechnet wird nur, wenn sich etwas geändert hat (Student bewegt
+# sich, ein Feld wird gegraben), und erst beim nächsten Abfragen - also
+# höchstens einmal pro Simulationsschritt. Die Suche hört nach `radius`
+# Schritten auf: weiter entfernte Profs jagen nicht, und die Kosten
+# hängen nur vom Radius ab, nicht von der Level-Größe.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING
+
+from src.tile import TileType
+
+if TYPE_CHECKING:
+    from src.tile import TileGrid
+
+_EMPTY = TileType.EMPTY.value
+
+
+class FlowField:
+    def __init__(self, tiles: TileGrid, radius: int):
+        self.tiles = tiles
+        self.radius = radius
+
+        # Distanz pro Feld (flach, y * cols + x), -1 = nicht erreichbar / zu weit
+        self.dist = [-1] * (tiles.cols * tiles.rows)
+        # Felder, die die letzte Suche gesetzt hat (nur die werden zurückgesetzt)
+        self._touched: list[int] = []
+
+        self.target: tuple[int, int] | None = None
+        self._dirty = True
+
+    def set_target(self, x: int, y: int) -> None:
+        """Ziel (Feld des Studenten) setzen, gerechnet wird erst bei Bedarf."""
+        if self.target != (x, y):
+            self.target = (x, y)
+            self._dirty = True
+
+    def invalidate(self) -> None:
+        """Tunnelnetz hat sich geändert (gegraben / neues Level)."""
+        self._dirty = True
+
+    def _refresh(self) -> None:
+        self._dirty = False
+        dist = self.dist
+        for i in self._touched:
+            dist[i] = -1
+        self._touched = touched = []
+        if self.target is None or self.radius <= 0:
+            return
+
+        tiles = self.tiles
+        cols, rows, cells = tiles.cols, tiles.rows, tiles.cells
+        tx, ty = self.target
+        start = ty * cols + tx
+        dist[start] = 0
+        touched.append(start)
+
+        # BFS nur über gegrabene Felder (Gras/Erde sind Wände)
+        queue = deque((start,))
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            if d > self.radius:
+                continue
+            x, y = i % cols, i // cols
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    j = ny * cols + nx
+                    if dist[j] < 0 and cells[j] == _EMPTY:
+                        dist[j] = d
+                        touched.append(j)
+                        queue.append(j)
+
+    def distance(self, x: int, y: int) -> int | None:
+        """Schritte bis zum Ziel durch Tunnel (None = kein Weg im Radius)."""
+        if self._dirty:
+            self._refresh()
+        d = self.dist[y * self.tiles.cols + x]
+        return None if d < 0 else d
+
+    def downhill(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Nachbarfelder, die einen Schritt näher am Ziel liegen (feste Reihenfolge)."""
+        d = self.distance(x, y)
+        if not d:
+            return []
+        cols, rows, dist = self.tiles.cols, self.tiles.rows, self.dist
+        return [(nx, ny) for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y))
+                if 0 <= nx < cols and 0 <= ny < rows and dist[ny * cols + nx] == d - 1]
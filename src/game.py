@@ -2,12 +2,21 @@
 # Hauptsteuerung fürs Spiel: GameLoop, States, Rendering, Frage-Logik
 
 from __future__ import annotations
+import os
+import random
 import sys
 from enum import Enum, auto
 import pygame
+from pygame._sdl2.video import Window
 from .pausemenu import PauseMenu
 from .sound import SoundManager
 from .ui import Mutebutton
+from .render import DirtyRectRenderer, RenderList, RedrawScheduler
+from .text_cache import render_text
+from .assets import asset_cache
+from .profiler import FrameProfiler
+from .camera import Camera
+from .animation import game_clock
 
 # ------------------------------------------------------------------------------
 # GenAI-Kennzeichnung
@@ -29,15 +38,30 @@ try:
     from src.config import (
         GRID_COLS, GRID_ROWS,
         GRID_MARGIN_X_TILES, GRID_MARGIN_Y_TILES,
-        REQUIRED_ECTS,
-        LEVELS
+        LEVELS,
+        BATCHED_BLITS,
+        LOGICAL_RESOLUTION,
+        VIEWPORT_COLS, VIEWPORT_ROWS,
+        EVENT_DRIVEN_REDRAW,
+        SIM_TICK_RATE, SIM_MAX_CATCHUP_STEPS, RENDER_FPS_CAP,
+        PREBUILD_LEVELS,
+        HUD_REFERENCE_HEIGHT
     )
 except ImportError:
     GRID_COLS = 15
     GRID_ROWS = 9
     GRID_MARGIN_X_TILES = 2
     GRID_MARGIN_Y_TILES = 2
-    REQUIRED_ECTS = 5
+    BATCHED_BLITS = True
+    LOGICAL_RESOLUTION = None
+    VIEWPORT_COLS = 15
+    VIEWPORT_ROWS = 9
+    EVENT_DRIVEN_REDRAW = True
+    SIM_TICK_RATE = 60
+    SIM_MAX_CATCHUP_STEPS = 15
+    RENDER_FPS_CAP = 60
+    PREBUILD_LEVELS = True
+    HUD_REFERENCE_HEIGHT = 1080
 
 # Sprite-Fallback
 try:
@@ -50,12 +74,14 @@ except ImportError:
             self.surface.fill((120, 120, 120))
 
         def draw(self, screen: pygame.Surface, x: int, y: int):
-            screen.blit(self.surface, (x, y))
+            return screen.blit(self.surface, (x, y))
 
 
 from src.entities import Student
 from src.level import Level
-from src.tile import TileType
+from src.presentation import LevelView
+from src.prebuild import LevelPrebuilder
+from src.terrain import TerrainLayer
 from src.anim_scene_builder import Animator_Scenes
 from src.mainmenu import MainMenu
 
@@ -71,23 +97,78 @@ class GameState(Enum):
     PAUSED = auto()
 
 
+# States, in denen sich ohne Eingabe nichts bewegt -> nur neu zeichnen,
+# wenn sich der State ändert oder ein Event reinkommt
+STATIC_STATES = (GameState.MENU, GameState.QUESTION, GameState.LEVEL_COMPLETE,
+                 GameState.PAUSED, GameState.GAME_OVER)
+
+
 # ------------------------------------------------------------------------------
 # Hauptklasse Game – enthält die komplette Steuerung
 # ------------------------------------------------------------------------------
 class Game:
-    def __init__(self):
+    def __init__(self, display_size: tuple[int, int] | None = None,
+                 logical_size: tuple[int, int] | None = LOGICAL_RESOLUTION,
+                 seed: int | None = None):
         pygame.init()
 
         self.running=True
 
-        # Vollbild – wir nutzen die nativen Monitorwerte
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        info = pygame.display.Info()
-        self.width, self.height = info.current_w, info.current_h
+        # Ein Seed für die ganze Session, jedes Level bekommt daraus seinen eigenen.
+        # Zusammen mit den aufgezeichneten Eingaben reicht das für ein Replay.
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
+        # Eingabe-Aufzeichnung (replay.InputRecorder), None = aus
+        self.recorder = None
+
+        if logical_size is not None:
+            # Logische Auflösung: wir zeichnen immer in logical_size,
+            # pygame.SCALED skaliert einmal pro Frame auf Fenster/Monitor hoch
+            # (Mauskoordinaten rechnet pygame automatisch zurück)
+            flags = pygame.SCALED
+            if display_size is None:
+                flags |= pygame.FULLSCREEN
+            self.screen = pygame.display.set_mode(logical_size, flags)
+            if display_size is not None:
+                # SCALED wählt sonst selbst ein Vielfaches von logical_size -> Fenster auf
+                # die gewünschte Größe bringen (das Bild wird hineinskaliert)
+                Window.from_display_module().size = display_size
+        elif display_size is None:
+            # Vollbild – wir nutzen die nativen Monitorwerte
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            # feste (virtuelle) Auflösung, z.B. für den Headless-Benchmark
+            self.screen = pygame.display.set_mode(display_size)
+        self.width, self.height = self.screen.get_size()
+
+        # HUD/Buttons sind für 1080 Pixel Höhe ausgelegt, bei anderen (auch
+        # logischen) Auflösungen wird mit diesem Faktor mitskaliert
+        self.ui_scale = self.height / HUD_REFERENCE_HEIGHT
 
         pygame.display.set_caption("Dig Or Exma - Team 23")
         self.clock = pygame.time.Clock()
 
+        # Dirty-Rect-Renderer: präsentiert nur geänderte Bereiche,
+        # kompletter Flip nur bei State-Wechseln
+        self.renderer = DirtyRectRenderer()
+        self._drawn_state: GameState | None = None
+
+        # Grid-Objekte gesammelt per Surface.blits() zeichnen (F4 schaltet um)
+        self.render_list = RenderList()
+        self.batched_blits = BATCHED_BLITS
+
+        # Simulation läuft in festen Schritten, Zeichnen mit Bildschirmrate
+        self.sim_step = 1.0 / SIM_TICK_RATE
+        self.sim_accumulator = 0.0
+        self.sim_ticks = 0     # Anzahl Schritte seit Start (Zeitachse für Replays)
+
+        # Schläft zwischen den Frames, bis sich sichtbar etwas ändert
+        self.scheduler = RedrawScheduler(EVENT_DRIVEN_REDRAW)
+
+        # Frame-Profiler mit Overlay (F3), kostet ausgeschaltet praktisch nichts
+        self.profiler = FrameProfiler()
+
         # Kachelgröße dynamisch berechnen – damit es unabhängig von Auflösung gleich aussieht
         max_tile_w = self.width // (GRID_COLS + 2 * GRID_MARGIN_X_TILES)
         max_tile_h = self.height // (GRID_ROWS + 2 * GRID_MARGIN_Y_TILES)
@@ -146,15 +227,21 @@ class Game:
             int(BOX_H * sy),
         )
 
-        # Tilegröße so berechnen, dass das Grid reinpasst
+        # Tilegröße so berechnen, dass der sichtbare Ausschnitt reinpasst
+        # (bei großen Levels scrollt die Kamera, statt die Tiles zu verkleinern)
+        view_cols = min(GRID_COLS, VIEWPORT_COLS)
+        view_rows = min(GRID_ROWS, VIEWPORT_ROWS)
         self.tile_size = min(
-            self.board_rect.w // GRID_COLS,
-            self.board_rect.h // GRID_ROWS
+            self.board_rect.w // view_cols,
+            self.board_rect.h // view_rows
         )
 
-        # Grid innerhalb des Kastens zentrieren
-        grid_w = GRID_COLS * self.tile_size
-        grid_h = GRID_ROWS * self.tile_size
+        # Kamera folgt dem Studenten, gezeichnet wird nur der Ausschnitt
+        self.camera = Camera(view_cols, view_rows, self.tile_size)
+
+        # Ausschnitt innerhalb des Kastens zentrieren
+        grid_w = view_cols * self.tile_size
+        grid_h = view_rows * self.tile_size
         self.grid_offset_x = self.board_rect.x + (self.board_rect.w - grid_w) // 2
         self.grid_offset_y = self.board_rect.y + (self.board_rect.h - grid_h) // 2
 
@@ -166,20 +253,26 @@ class Game:
         self.block_grass = Sprite("assets/sprites/grass.png",
                                   self.tile_size, self.tile_size)
 
+        # Vorgerenderte Tile-Ebene (wird pro Level einmal gebaut)
+        self.terrain = TerrainLayer(self.tile_size, self.block_solid,
+                                    self.block_empty, self.block_grass)
+
         # Soundverwaltung
         self.sound_manager = SoundManager()
         self.sound_manager.play_song(1)
+
+        # Darstellung der Spiel-Logik (Sprites, Animationen, Sounds zu Level-Ereignissen)
+        self.view = LevelView(self.tile_size, self.sound_manager)
         
         # Buff-Icons vorladen Pizza-Schild
-        self.buff_icon_size = 35
-        self.buff_icon_pizza = pygame.image.load("assets/sprites/pizza.png").convert_alpha()
-        self.buff_icon_pizza = pygame.transform.scale(
-        self.buff_icon_pizza, (self.buff_icon_size, self.buff_icon_size)
-)
+        self.buff_icon_size = self.ui(35)
+        self.buff_icon_pizza = asset_cache.load(
+            "assets/sprites/pizza.png", (self.buff_icon_size, self.buff_icon_size)
+        )
 
         # Mute-Button oben rechts
-        button_size = 50
-        padding = 30
+        button_size = self.ui(50)
+        padding = self.ui(30)
         self.mute_button = Mutebutton(
             self.width - button_size - padding,
             self.height - button_size - padding,
@@ -188,9 +281,14 @@ class Game:
         )
 
         # Schriften
-        self.font_small = pygame.font.SysFont(None, 26)
-        self.font_big = pygame.font.SysFont(None, 48)
-        self.font_title = pygame.font.SysFont(None, 64)
+        self.font_small = pygame.font.SysFont(None, self.ui(26))
+        self.font_big = pygame.font.SysFont(None, self.ui(48))
+        self.font_title = pygame.font.SysFont(None, self.ui(64))
+
+        # HUD-Box einmal vorbauen statt jeden Frame eine neue Surface anzulegen
+        self.hud_box = self._build_hud_box()
+        # ECTS-Anzeige steht rechts neben der Zeit an fester Position
+        self.hud_ects_x = self.font_small.size("Zeit: 00:00.0   ")[0]
 
         # State + Variablen
         self.state = GameState.MENU
@@ -202,10 +300,22 @@ class Game:
         self.active_question = None
         self.last_question_feedback = None
         self.mistakes = 0   # Spieler darf 2 Fehler machen
+
+        # Frage-Overlay: Abdunkeln einmal anlegen, Text-Panel pro Frage
+        self.question_dim = pygame.Surface((self.width, self.height))
+        self.question_dim.set_alpha(200)
+        self.question_dim.fill((0, 0, 0))
+        self.question_panel: pygame.Surface | None = None
+        self.question_panel_rect = pygame.Rect(0, 0, 0, 0)
         
         # Godmode 
         self.godmode=False
         
+        # Level werden im Hintergrund vorgebaut (nächstes Semester, Neustart, Menü).
+        # Der Seed fürs nächste Level steht deshalb schon vorher fest.
+        self.prebuilder = LevelPrebuilder(PREBUILD_LEVELS)
+        self._next_level_seed = self.rng.getrandbits(32)
+
         # Level & Student erstellen
         self.current_level_index = 0
         self._create_level_and_student()
@@ -226,25 +336,36 @@ class Game:
         #Animationsobjekte deklarieren 
         self.game_over_animation=Animator_Scenes(self.screen.get_width(),self.screen.get_height(),
                                                  250,1)
-        self.animationslist=self.game_over_animation.load_from_spritesheet("assets\sprites\GAME OVER Scene.png",315,180,self.background)
+        self.animationslist=self.game_over_animation.load_from_spritesheet(os.path.join("assets", "sprites", "GAME OVER Scene.png"),315,180,self.background)
         self.hauptmenu=MainMenu(self.screen,self.background,self.background_rect,self.font_small,"")
     # ------------------------------------------------------------------------------
     # Neues Level erstellen + Student spawnen
     # ------------------------------------------------------------------------------
     def _create_level_and_student(self):
-        self.level = Level(self.tile_size, level_index=self.current_level_index, sound_manager=self.sound_manager,godmode=self.godmode)
+        # vorgebautes Level abholen (oder direkt bauen, falls keins passt)
+        self.level = self.prebuilder.take(self.current_level_index, self.godmode,
+                                          self._next_level_seed)
+        self._next_level_seed = self.rng.getrandbits(32)
 
         # Startkoordinaten – momentan fest, könnte man später zufällig machen
         start_x, start_y = 1, 1
 
-        # Student-Grafik
-        student_img = pygame.image.load("assets/sprites/student.png").convert_alpha()
-        student_img = pygame.transform.scale(student_img, (self.tile_size, self.tile_size))
-
-        self.student = Student(start_x, start_y, self.tile_size, student_img)
+        self.student = Student(start_x, start_y)
+        self.view.reset_student()
 
         # Startfeld ausgraben, damit der Spieler nicht feststeckt
-        self.level.tiles[start_x][start_y].dig()
+        self.level.dig(start_x, start_y)
+
+        # Kamera auf das neue Level + Startfeld einstellen
+        self.camera.reset(self.level.cols, self.level.rows, start_x, start_y)
+
+        # Kandidaten fürs nächste Level schon mal bauen lassen:
+        # nächstes Semester (N), Neustart (R), Menü -> Semester 1
+        index = self.current_level_index
+        candidates = [index + 1] if index + 1 < len(LEVELS) else []
+        candidates += [index, 0]
+        for candidate in dict.fromkeys(candidates):
+            self.prebuilder.request(candidate, self.godmode, self._next_level_seed)
 
     # ------------------------------------------------------------------------------
     # Neustartoption
@@ -266,43 +387,191 @@ class Game:
     def run(self):
 
         while self.running:
-            # dt = Zeit seit letztem Frame in Sekunden
-            dt = self.clock.tick(60) / 1000.0
+            # Schlafen, bis eine Eingabe kommt oder die nächste Änderung fällig ist
+            events = self.scheduler.wait()
 
-            # Eingaben abfragen
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
+            # dt = Zeit seit letztem Frame in Sekunden (inkl. Schlafzeit)
+            dt = self.clock.tick(RENDER_FPS_CAP) / 1000.0
+            profiler = self.profiler
+            profiler.begin_frame()
 
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-                    self.handle_key(event.key)
-
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    self.handle_mouse_click(event.pos)
-
-            # Nur updaten, wenn wir uns im RUNNING-State befinden
-            if self.state == GameState.RUNNING:
-                self.level.update(dt)
-                self.student.update_animation(dt)
-                self.student.update_buffs(dt)
-                self.check_prof_collision()
-
-                # Übergang in neue States
-                if self.level.is_game_over:
-                    self.state = GameState.GAME_OVER
-                    self.sound_manager.pause_music()
-                    self.sound_manager.game_over_music()    
-                elif self.level.is_won:
-                    self.state = GameState.LEVEL_COMPLETE
-
-            # Immer zeichnen
+            # Eingaben abfragen
+            was_running = self.state == GameState.RUNNING
+            for event in events:
+                self.handle_event(event)
+            profiler.mark("events")
+
+            # Zurück ins Spiel (Pause aus, Frage beantwortet, ...): dt enthält die
+            # ganze Zeit im Standbild -> verwerfen, sonst läuft die BAföG-Uhr weiter
+            if not was_running and self.state == GameState.RUNNING:
+                dt = 0.0
+                self.sim_accumulator = 0.0
+
+            if self.state in STATIC_STATES:
+                # Standbild: keine Simulationsschritte sammeln (die Level-Uhr
+                # steht), nur die Spieluhr für die Game-Over-Animation weiter
+                game_clock.tick(dt)
+            else:
+                # Simulation in festen Schritten nachziehen (Akkumulator),
+                # nach einem Hänger aber höchstens SIM_MAX_CATCHUP_STEPS Schritte
+                self.sim_accumulator = min(self.sim_accumulator + dt,
+                                           self.sim_step * SIM_MAX_CATCHUP_STEPS)
+                while self.sim_accumulator >= self.sim_step:
+                    self.sim_accumulator -= self.sim_step
+                    self.step(self.sim_step)
+
+            # Immer zeichnen (Standbilder zeichnen intern nur nach Eingaben)
             self.draw()
+            profiler.end_frame()
 
+            self.schedule_next_frame()
+
+        self.prebuilder.shutdown()
         pygame.quit()
         sys.exit()
 
+    # ------------------------------------------------------------------------------
+    # Ein Event verarbeiten (aus der Event-Queue oder aus einem Replay)
+    # ------------------------------------------------------------------------------
+    def handle_event(self, event):
+        # Aufzeichnen, bevor es verarbeitet wird (Zeitpunkt = aktueller Sim-Schritt)
+        if self.recorder is not None:
+            self.recorder.record(self.sim_ticks, event, self.state)
+
+        # Hauptmenü bekommt alle Events selbst (keine eigene Schleife mehr)
+        if self.state == GameState.MENU:
+            self.handle_menu_event(event)
+            return
+
+        # Standbilder (Pause, Frage, ...) nur nach Eingaben neu zeichnen
+        if self.state != GameState.RUNNING:
+            self.renderer.request_full_redraw()
+
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            # F4: gesammeltes vs. einzelnes Blitten (zum Profilen)
+            if event.key == pygame.K_F4:
+                self.batched_blits = not self.batched_blits
+            # F3: Frame-Profiler ein/aus (beim Ausblenden alles neu zeichnen)
+            if event.key == pygame.K_F3:
+                self.profiler.toggle()
+                self.renderer.request_full_redraw()
+            self.handle_key(event.key)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.handle_mouse_click(event.pos)
+
+    # ------------------------------------------------------------------------------
+    # Ein fester Simulationsschritt
+    # ------------------------------------------------------------------------------
+    def step(self, dt: float):
+        profiler = self.profiler
+        self.sim_ticks += 1
+
+        # gemeinsame Spieluhr für alle Animationen weiterstellen
+        game_clock.tick(dt)
+
+        # Nur updaten, wenn wir uns im RUNNING-State befinden
+        if self.state != GameState.RUNNING:
+            return
+
+        self.level.update(dt)
+        profiler.mark("level_update")
+        self.view.update_student(self.student)
+        profiler.mark("student_update")
+        self.check_prof_collision()
+        profiler.mark("collision")
+
+        # Übergang in neue States
+        if self.level.is_game_over:
+            self.state = GameState.GAME_OVER
+            self.sound_manager.pause_music()
+            self.sound_manager.game_over_music()    
+        elif self.level.is_won:
+            self.state = GameState.LEVEL_COMPLETE
+
+    # ------------------------------------------------------------------------------
+    # Wann muss der nächste Frame gezeichnet werden?
+    # ------------------------------------------------------------------------------
+    def schedule_next_frame(self):
+        scheduler = self.scheduler
+        scheduler.clear()
+
+        # Profiler-Graph und ausstehender Full-Redraw -> sofort
+        if self.profiler.enabled or self.renderer.full_redraw:
+            scheduler.now()
+            return
+
+        if self.state == GameState.GAME_OVER:
+            wait_ms = self.game_over_animation.next_frame_in()
+            if wait_ms is not None:
+                scheduler.due_in(wait_ms)
+            return
+
+        if self.state != GameState.RUNNING:
+            # Menü, Pause, Frage, Semester geschafft: Standbild bis zur nächsten Eingabe
+            return
+
+        level, student = self.level, self.student
+
+        # HUD-Zeit: nächstes Zehntel
+        if not self.godmode:
+            time_left = level.timer.time_left
+            scheduler.due_in((time_left - int(time_left * 10) / 10.0) * 1000.0)
+
+        # Coins (nur sichtbare, nur wenn animiert)
+        visible = self.camera.visible
+        for ects in level.ects_items:
+            if visible(ects.gx, ects.gy):
+                wait_ms = self.view.coin_next_change_in()
+                if wait_ms is not None:
+                    scheduler.due_in(wait_ms)
+                # alle Coins teilen sich Clip + Phase -> einer reicht
+                break
+
+        # Profs, Schild-Ende, Meldungen: nächster Eintrag der Level-Zeitleiste
+        due_in = level.clock.next_due_in()
+        if due_in is not None:
+            scheduler.due_in(due_in * 1000.0)
+
+        # Student-Animation und Schild-Anzeige (volle Sekunden)
+        frame_in = self.view.student_next_frame_in()
+        if frame_in is not None:
+            scheduler.due_in(frame_in * 1000.0)
+        shield_left = level.shield_time_left(student)
+        if shield_left > 0:
+            scheduler.due_in((shield_left % 1.0) * 1000.0)
+
+        # Nicht länger schlafen, als der Akkumulator nachholen kann - sonst
+        # fehlt die Zeit darüber hinaus still in der Simulation
+        scheduler.due_in(self.sim_step * SIM_MAX_CATCHUP_STEPS * 1000.0)
+
+        # Änderungen passieren nur in ganzen Simulationsschritten
+        scheduler.align(self.sim_step * 1000.0, self.sim_accumulator * 1000.0)
+
+    # ------------------------------------------------------------------------------
+    # Hauptmenü: Events weiterreichen + Auswahl übernehmen
+    # ------------------------------------------------------------------------------
+    def handle_menu_event(self, event):
+        # neu zeichnen nur, wenn sich der Hover-Zustand eines Buttons ändert
+        if self.hauptmenu.handle_event(event):
+            self.renderer.request_full_redraw()
+
+        hauptmenu_status = self.hauptmenu.take_result()
+        if hauptmenu_status is None:
+            return
+        if hauptmenu_status["auswahl"] == "START":
+            self.state = GameState.RUNNING
+        elif hauptmenu_status["auswahl"] == "QUIT":
+            self.running = False
+        if hauptmenu_status["godmode"] == True:
+            self.godmode = True
+        self.restart()
+
     # ------------------------------------------------------------------------------
     # Tastatursteuerung – abhängig vom aktuellen State
     # ------------------------------------------------------------------------------
@@ -347,6 +616,7 @@ class Game:
             if dx or dy:
                 self.sound_manager.play_footsteps()
                 prof = self.student.move(dx, dy, self.level)
+                self.view.play_events(self.level)
                 if prof is not None:
                     self.open_question(prof)
             return
@@ -413,20 +683,12 @@ class Game:
         if not self.level or not self.student:
             return
 
-        for prof in self.level.professors:
-            if (prof.grid_x, prof.grid_y) == (self.student.grid_x, self.student.grid_y):
-                
-                # A) Hat der Student ein Pizza-Schild?
-                if self.student.has_pizza_shield:
-                    self.student.has_pizza_shield = False  # Schild verbrauchen
-                    self.level.last_powerup_message = "Pizza-Schild hat dich gerettet! 🍕"
-                    self.level.remove_professor(prof)      # Prof entfernen, damit er nicht nochmal trifft
-                    self.sound_manager.play_hitsound()     # Optional: Sound abspielen
-                    return                                 # WICHTIG: Hier abbrechen, KEINE Frage starten!
-
-                # B) Kein Schild -> Frage starten
-                self.open_question(prof)
-                return
+        # Pizza-Schild verbraucht das Level selbst (-> kein Prof, Sound über Ereignis),
+        # sonst bekommen wir den Prof zurück und stellen die Frage
+        prof = self.level.player_contact(self.student)
+        self.view.play_events(self.level)
+        if prof is not None:
+            self.open_question(prof)
 
     # ------------------------------------------------------------------------------
     # Frage öffnen
@@ -444,6 +706,9 @@ class Game:
         self.active_prof = prof
         self.active_question = question
 
+        # Overlay-Text einmal pro Frage bauen (nicht jeden Frame)
+        self.question_panel, self.question_panel_rect = self._build_question_panel(question)
+
         self.last_question_feedback = None
         self.state = GameState.QUESTION
         self.sound_manager.play_hitsound()
@@ -468,28 +733,23 @@ class Game:
         q = self.active_question
         prof = self.active_prof
 
+        # vorgerendertes Overlay wird nicht mehr gebraucht
+        self.question_panel = None
+
         if q is None:
             self.state = GameState.RUNNING
             return
 
         # Richtige Antwort
         if given_index == q.correct or self.godmode:
-            self.level.collected_ects += 1
-            
-            #Standardannahme (für Profs)
-            is_defeated = True  
-            
-            if prof is not None and hasattr(prof, "hp"):
-                prof.hp -= 1
-                if prof.hp > 0:
-                    is_defeated = False #Hat noch Leben -> NICHT besiegt
+            # ECTS, HP, Prof entfernen und Zeitstrafe macht das Level
+            is_defeated = self.level.answer_question(prof, True)
 
             #Feedback für den Spieler
             if is_defeated:
                 feedback = f"Richtige Antwort! +1 ECTS. {q.explanation} (Prof besiegt!)"
                 self.sound_manager.stop_hitsound()
                 self.sound_manager.unpause_music()
-                self.level.remove_professor(prof)
             else:
                 feedback = f"Richtige Antwort! +1 ECTS. {q.explanation} (Noch {prof.hp} HP)"
 
@@ -511,17 +771,16 @@ class Game:
                 self.sound_manager.pause_music()
                 self.sound_manager.game_over_music()
                 return
-            
-        #Zeitstrafe
-        self.level.timer.time_left = max(5.0, self.level.timer.time_left - 10.0)
+
+            # Zeitstrafe gibt es auch bei falschen Antworten
+            self.level.answer_question(prof, False)
 
         #Frage abschließen
         self.active_prof = None
         self.active_question = None
 
-        # Siegbedingung prüfen
-        if self.level.collected_ects >= REQUIRED_ECTS and not self.level.is_game_over:
-            self.level.is_won = True
+        # Siegbedingung prüft das Level in answer_question
+        if self.level.is_won:
             self.state = GameState.LEVEL_COMPLETE
         else:
             self.state = GameState.RUNNING
@@ -530,18 +789,27 @@ class Game:
     # Rendering
     # ------------------------------------------------------------------------------
     def draw(self):
-        self.screen.blit(self.background, self.background_rect)
+        # State-Wechsel -> einmal alles zeichnen und flippen
+        if self.state != self._drawn_state:
+            self.renderer.request_full_redraw()
+            self._drawn_state = self.state
+
+        # Die Game-Over-Animation läuft über den ganzen Bildschirm
+        if self.state == GameState.GAME_OVER and self.game_over_animation.aktiv:
+            self.renderer.request_full_redraw()
+
+        # Standbild ohne Änderung -> gar nichts zeichnen
+        if not self.renderer.full_redraw and self.state in STATIC_STATES:
+            return
+
+        if self.renderer.full_redraw:
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(self.background, self.background_rect)
 
         if self.state == GameState.MENU:
-            hauptmenu_status=self.hauptmenu.run()
-            if hauptmenu_status["auswahl"]=="START":
-                self.state=GameState.RUNNING
-            elif hauptmenu_status["auswahl"]=="QUIT":
-                self.running=False
-            if hauptmenu_status["godmode"]==True:
-                self.godmode=True
-            self.restart()
-                
+            # Titel + Buttons (Hintergrund ist beim Full-Redraw schon gezeichnet)
+            self.hauptmenu.draw(self.screen)
+
         elif self.state == GameState.PAUSED:
             self.draw_game()
             self.pause_menu.draw(self.screen)
@@ -549,7 +817,21 @@ class Game:
         else:
             self.draw_game()
 
-        pygame.display.flip()
+        # Profiler-Overlay liegt über allem
+        self.profiler.mark("draw_game")
+        self.renderer.add(self.profiler.draw(self.screen))
+
+        self.renderer.present()
+        self.profiler.mark("present")
+
+    # ------------------------------------------------------------------------------
+    # Hintergrund (Gamepad + Tiles) in einem Rechteck wiederherstellen
+    # ------------------------------------------------------------------------------
+    def _restore_background(self, rect: pygame.Rect):
+        self.screen.fill((0, 0, 0), rect)
+        self.screen.blit(self.background, rect.topleft,
+                         rect.move(-self.background_rect.x, -self.background_rect.y))
+        self.terrain.draw_area(self.screen, self.grid_offset_x, self.grid_offset_y, rect)
 
     # ------------------------------------------------------------------------------
     # Menü zeichnen
@@ -578,41 +860,33 @@ class Game:
     def draw_game(self):
         assert self.level and self.student
 
-        # Tiles zeichnen
-        for x in range(self.level.cols):
-            for y in range(self.level.rows):
-                tile = self.level.tiles[x][y]
-                px = self.grid_offset_x + x * self.tile_size
-                py = self.grid_offset_y + y * self.tile_size
-
-                # --- Darunter befindet sich die Schleife ---
-                if tile.type == TileType.GRASS:
-                    self.block_grass.draw(self.screen, px, py)
-                elif tile.is_solid:
-                    self.block_solid.draw(self.screen, px, py)
-                else:
-                    self.block_empty.draw(self.screen, px, py)
-                # -----------------------------
-
-        # ECTS-Objekte
-        for ects in self.level.ects_items:
-            ects.draw(self.screen, self.grid_offset_x, self.grid_offset_y)
-
-
-        # PowerUps
-        for p in self.level.powerups:
-            p.draw(self.screen, self.grid_offset_x, self.grid_offset_y)
+        # Kamera nachziehen, bevor irgendwas gezeichnet wird
+        self.camera.follow(self.student.grid_x, self.student.grid_y)
 
-
-        # Professoren
-        for prof in self.level.professors:
-            prof.draw(self.screen, self.grid_offset_x, self.grid_offset_y)
-
-        # Spieler
-        self.student.draw(self.screen, self.grid_offset_x, self.grid_offset_y)
+        # Tiles zeichnen: eine vorgerenderte Ebene (nur der sichtbare Ausschnitt)
+        # statt Schleife über alle Felder, gegrabene Felder werden vorher geflickt
+        changed_cells = self.terrain.sync(self.level, self.camera)
+        if self.renderer.full_redraw:
+            self.terrain.draw(self.screen, self.grid_offset_x, self.grid_offset_y)
+        else:
+            # Dirty-Rects: nur die alten Positionen aus dem letzten Frame
+            # und frisch gegrabene Felder mit Hintergrund übermalen
+            for rect in self.renderer.previous_rects:
+                self._restore_background(rect)
+            for cell in changed_cells:
+                rect = cell.move(self.grid_offset_x, self.grid_offset_y)
+                self._restore_background(rect)
+                self.renderer.add(rect)
+
+        if self.batched_blits:
+            self.draw_entities_batched()
+        else:
+            self.draw_entities()
 
         # HUD
+        self.profiler.mark("draw_game")
         self.draw_hud()
+        self.profiler.mark("draw_hud")
 
         # Overlays
         if self.state == GameState.QUESTION:
@@ -635,34 +909,100 @@ class Game:
                 (120, 255, 120)
             )
 
+    # ------------------------------------------------------------------------------
+    # Grid-Objekte zeichnen: einzeln (alter Weg) oder gesammelt per blits()
+    # ------------------------------------------------------------------------------
+    # Nur Objekte im Kamera-Ausschnitt werden gezeichnet (Culling).
+    # Der Student ist immer sichtbar, die Kamera folgt ihm ja.
+    def draw_entities(self):
+        add = self.renderer.add
+        ox, oy = self.camera.offset(self.grid_offset_x, self.grid_offset_y)
+        visible = self.camera.visible
+
+        # ECTS-Objekte
+        view, blit = self.view, self.screen.blit
+        for ects in self.level.ects_items:
+            if visible(ects.gx, ects.gy):
+                add(blit(*view.ects_item(ects, ox, oy)))
+
+
+        # PowerUps
+        for p in self.level.powerups:
+            if visible(p.grid_x, p.grid_y):
+                add(blit(*view.powerup_item(p, ox, oy)))
+
+
+        # Professoren
+        for prof in self.level.professors:
+            if visible(prof.grid_x, prof.grid_y):
+                add(blit(*view.prof_item(prof, ox, oy)))
+
+        # Spieler
+        add(blit(*view.student_item(self.student, ox, oy)))
+
+    def draw_entities_batched(self):
+        ox, oy = self.camera.offset(self.grid_offset_x, self.grid_offset_y)
+        visible = self.camera.visible
+        render_list = self.render_list
+        view = self.view
+
+        for ects in self.level.ects_items:
+            if visible(ects.gx, ects.gy):
+                render_list.add("items", *view.ects_item(ects, ox, oy))
+        for p in self.level.powerups:
+            if visible(p.grid_x, p.grid_y):
+                render_list.add("items", *view.powerup_item(p, ox, oy))
+        for prof in self.level.professors:
+            if visible(prof.grid_x, prof.grid_y):
+                render_list.add("enemies", *view.prof_item(prof, ox, oy))
+        render_list.add("player", *view.student_item(self.student, ox, oy))
+
+        # Rechtecke brauchen wir nur im RUNNING-State für die Dirty-Rects,
+        # auf den Standbildern wird sowieso komplett geflippt
+        rects = render_list.flush(self.screen, doreturn=self.state == GameState.RUNNING)
+        self.renderer.add_all(rects)
+
     # ------------------------------------------------------------------------------
     # HUD (Zeit, ECTS, Semester, Controls, Feedback)
     # ------------------------------------------------------------------------------
-    def draw_hud(self):
-        assert self.level # Sicherstellen, dass Level existiert
+    def ui(self, px: int) -> int:
+        """Pixelmaß aus dem 1080p-Layout auf die aktuelle Auflösung umrechnen."""
+        return max(1, round(px * self.ui_scale))
 
-        # --- 1. TRANSPARENTE HINTERGRUND-OBERFLÄCHE ERSTELLEN ---
+    def _build_hud_box(self) -> pygame.Surface:
+        """Baut den halbtransparenten HUD-Kasten inkl. der festen Controls-Zeile."""
         # Definieren der Maße der Box
-        box_width = 500
-        box_height = 90
-        
-        # Erstellen einer neuen Oberfläche mit Alpha-Kanal (SRCALPHA)
+        box_width = self.ui(500)
+        box_height = self.ui(90)
+
+        # Oberfläche mit Alpha-Kanal (SRCALPHA)
         hud_bg_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        
-        # Definieren der transparenten Farbe (Dunkelgrau: 30, 30, 30, mit Alpha: 180)
+
+        # Transparente Farbe (Dunkelgrau: 30, 30, 30, mit Alpha: 180)
         # Alpha 180 von 255 ist ca. 70% Deckkraft
-        TRANSPARENT_BLACK = (30, 30, 30, 180) 
-        
-        # Rechteck auf die neue, transparente Oberfläche zeichnen (beginnend bei 0, 0)
+        TRANSPARENT_BLACK = (30, 30, 30, 180)
+
         hud_bg_rect_local = hud_bg_surface.get_rect()
-        pygame.draw.rect(hud_bg_surface, TRANSPARENT_BLACK, hud_bg_rect_local) 
-        
-        # Optional: Weißer Rand (opaker Rand, da auf der HUD-Surface)
+        pygame.draw.rect(hud_bg_surface, TRANSPARENT_BLACK, hud_bg_rect_local)
+
+        # Weißer Rand (opaker Rand, da auf der HUD-Surface)
         pygame.draw.rect(hud_bg_surface, (255, 255, 255), hud_bg_rect_local, 1)
 
-        # 2. Die transparente Oberfläche auf den Bildschirm blitten
-        hud_start_x, hud_start_y = 10, 10
-        self.screen.blit(hud_bg_surface, (hud_start_x, hud_start_y))
+        # Controls ändern sich nie -> direkt in die Box malen
+        # (Box liegt bei (10, 10), Text soll bei (20, 70) stehen)
+        controls = self.font_small.render(
+            "Pfeiltasten: bewegen/graben  |  SHIFT: Pause  |  R: Neustart",
+            True, (255, 255, 255)
+        )
+        hud_bg_surface.blit(controls, (self.ui(10), self.ui(60)))
+        return hud_bg_surface
+
+    def draw_hud(self):
+        assert self.level # Sicherstellen, dass Level existiert
+
+        # --- 1. HUD-BOX (einmal in _build_hud_box gebaut, inkl. Controls-Zeile) ---
+        hud_start_x, hud_start_y = self.ui(10), self.ui(10)
+        self.renderer.add(self.screen.blit(self.hud_box, (hud_start_x, hud_start_y)))
         # ---------------------------------------------------------
 
         # --- KORRIGIERTE ZEIT-FORMATIERUNG ---
@@ -675,45 +1015,48 @@ class Game:
         # --------------------------------------
 
         # 1) Erste HUD-Zeile: Zeit + ECTS
-        hud_line1 = self.font_small.render(
-            f"Zeit: {time_string}   " # <--- Jetzt mit dynamischer Anzeige
+        # Zeit und ECTS sind getrennte Textstücke, damit bei jedem Zehntel
+        # nur die Zeit neu gerendert wird (beides kommt aus dem Text-Cache)
+        hud_time = render_text(self.font_small, f"Zeit: {time_string}", (255, 255, 255))
+        self.screen.blit(hud_time, (self.ui(20), self.ui(20))) # Text startet bei (20, 20)
+
+        hud_ects = render_text(
+            self.font_small,
             f"ECTS: {self.level.collected_ects}/{self.level.required_ects}",
-            True, (255, 255, 255)
+            (255, 255, 255)
         )
-        self.screen.blit(hud_line1, (20, 20)) # Text startet bei (20, 20)
+        self.screen.blit(hud_ects, (self.ui(20) + self.hud_ects_x, self.ui(20)))
 
         # 2) Zweite HUD-Zeile: Semester (aka Level)
-        hud_line2 = self.font_small.render(
+        hud_line2 = render_text(
+            self.font_small,
             f"Semester: {self.current_level_index + 1}/7",
-            True, (255, 255, 255)
+            (255, 255, 255)
         )
-        self.screen.blit(hud_line2, (20, 45)) # bisschen unter die erste Zeile
+        self.screen.blit(hud_line2, (self.ui(20), self.ui(45))) # bisschen unter die erste Zeile
 
-        # 3) Controls (eine Zeile tiefer)
-        controls = self.font_small.render(
-            "Pfeiltasten: bewegen/graben  |  SHIFT: Pause  |  R: Neustart",
-            True, (255, 255, 255)
-        )
-        self.screen.blit(controls, (20, 70))
+        # 3) Controls sind schon fest in die HUD-Box gemalt
 
         # 4) Feedback unten (z.B. nach Fragen)
         if self.last_question_feedback:
             # ... (dieser Teil war nicht das Problem)
-            msg = self.font_small.render(
+            msg = render_text(
+                self.font_small,
                 self.last_question_feedback,
-                True, (200, 255, 200)
+                (200, 255, 200)
             )
-            self.screen.blit(msg, (20, self.height - 40))
+            self.renderer.add(self.screen.blit(msg, (self.ui(20), self.height - self.ui(40))))
 
         elif self.level and self.level.last_powerup_message:
-            msg = self.font_small.render(
+            msg = render_text(
+                self.font_small,
                 self.level.last_powerup_message,
-                True, (255, 255, 100) # Gelb für Items
+                (255, 255, 100) # Gelb für Items
             )
-            self.screen.blit(msg, (20, self.height - 40))
+            self.renderer.add(self.screen.blit(msg, (self.ui(20), self.height - self.ui(40))))
 
         # 5) Buttons / UI
-        self.mute_button.draw(self.screen)
+        self.renderer.add(self.mute_button.draw(self.screen))
         self.draw_buff_timer_top_right()
 
         #Funktion für das Pizza-Schild Timer oben rechts
@@ -721,44 +1064,64 @@ class Game:
         if self.student is None:
             return
 
-        if self.student.has_pizza_shield and self.student.pizza_shield_left > 0:
-            secs = int(self.student.pizza_shield_left)
-            text_surf = self.font_small.render(f"Schild: {secs}s", True, (255, 255, 255))
+        shield_left = self.level.shield_time_left(self.student) if self.level else 0.0
+        if shield_left > 0:
+            secs = int(shield_left)
+            text_surf = render_text(self.font_small, f"Schild: {secs}s", (255, 255, 255))
 
             
-            gap = 10
-            x = self.width - 460
-            y = self.board_rect.top - 40
+            gap = self.ui(10)
+            x = self.width - self.ui(460)
+            y = self.board_rect.top - self.ui(40)
             size = self.buff_icon_size 
 
             #Icon zeichnen 
-            self.screen.blit(self.buff_icon_pizza, (x, y))
+            self.renderer.add(self.screen.blit(self.buff_icon_pizza, (x, y)))
 
             #Text daneben zeichnen
             text_rect = text_surf.get_rect()
             text_rect.left = x + size + gap
             text_rect.centery = y + size // 2   
-            self.screen.blit(text_surf, text_rect)
+            self.renderer.add(self.screen.blit(text_surf, text_rect))
 
     # ------------------------------------------------------------------------------
     # Frage-Overlay
     # ------------------------------------------------------------------------------
-    def draw_question_overlay(self):
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def _build_question_panel(self, q) -> tuple[pygame.Surface, pygame.Rect]:
+        """
+        Rendert Frage + Antworten einmal auf eine eigene Surface.
+        Wird in open_question aufgerufen und bis resolve_question wiederverwendet.
+        """
+        lines = [q.text] + [f"{i+1}) {ans}" for i, ans in enumerate(q.answers)]
+        lines.append("Antwort mit 1 / 2 / 3")
 
-        q = self.active_question
+        surfs = [self.font_small.render(text, True, (255, 255, 255)) for text in lines]
+        line_h = 30
+        panel_w = max(s.get_width() for s in surfs)
+        panel_h = (len(surfs) - 1) * line_h + max(s.get_height() for s in surfs)
+
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        for i, surf in enumerate(surfs):
+            # gleiche Anordnung wie früher: jede Zeile mittig, 30px Abstand
+            rect = surf.get_rect(centerx=panel_w // 2, centery=surfs[0].get_height() // 2 + i * line_h)
+            # MAX-Blend übernimmt die Textpixel 1:1 (inkl. Alpha) auf die leere Surface
+            panel.blit(surf, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        # Panel so platzieren, dass die erste Zeile bei (cx, cy) zentriert ist
         cx = self.width // 2
         cy = self.height // 2 - 80
+        panel_rect = panel.get_rect(centerx=cx, top=cy - surfs[0].get_height() // 2)
+        return panel, panel_rect
 
-        lines = [q.text] + [f"{i+1}) {ans}" for i, ans in enumerate(q.answers)]
-        lines.append("Antwort mit 1 / 2 / 3")
+    def draw_question_overlay(self):
+        # Abdunkeln mit der einmal angelegten Overlay-Surface
+        self.screen.blit(self.question_dim, (0, 0))
+
+        # Panel fehlt nur, wenn jemand die Frage ohne open_question gesetzt hat
+        if self.question_panel is None:
+            self.question_panel, self.question_panel_rect = self._build_question_panel(self.active_question)
 
-        for i, text in enumerate(lines):
-            surf = self.font_small.render(text, True, (255, 255, 255))
-            self.screen.blit(surf, surf.get_rect(center=(cx, cy + i * 30)))
+        self.screen.blit(self.question_panel, self.question_panel_rect)
 
     # ------------------------------------------------------------------------------
     # Zentrierte Meldung (Game Over / Level Complete)
@@ -767,9 +1130,9 @@ class Game:
         cx = self.width // 2
         cy = self.height // 2
 
-        surf_title = self.font_big.render(title, True, color_title)
-        surf_line1 = self.font_small.render(line1, True, (255, 255, 255))
-        surf_line2 = self.font_small.render(line2, True, (255, 255, 255))
+        surf_title = render_text(self.font_big, title, color_title)
+        surf_line1 = render_text(self.font_small, line1, (255, 255, 255))
+        surf_line2 = render_text(self.font_small, line2, (255, 255, 255))
 
         self.screen.blit(surf_title, surf_title.get_rect(center=(cx, cy - 40)))
         self.screen.blit(surf_line1, surf_line1.get_rect(center=(cx, cy)))
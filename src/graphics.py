@@ -6,12 +6,15 @@
 
 import pygame
 
+from src.assets import asset_cache
+
 
 class Sprite:
     def __init__(self, path: str, width: int, height: int):
         # Bild laden und direkt auf die gewünschte Größe skalieren
-        img = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.scale(img, (width, height))
+        # (über den Asset-Cache: gleiche Bilder gibt es nur einmal im Speicher)
+        self.image = asset_cache.load(path, (width, height), owner=self)
 
-    def draw(self, surface: pygame.Surface, x: int, y: int) -> None:
-        surface.blit(self.image, (x, y))
+    def draw(self, surface: pygame.Surface, x: int, y: int) -> pygame.Rect:
+        # Rückgabe: das Rechteck, das sich auf dem Bildschirm geändert hat
+        return surface.blit(self.image, (x, y))
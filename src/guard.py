@@ -0,0 +1,85 @@
+# guard.py
+# ----------------------------------------------------------
+# Revier eines Wach-Profs (guard_mode, siehe level.py).
+#
+# Ein Wach-Prof bewacht ein ECTS (seinen Posten) und bleibt an der
+# "Leine": er läuft nur über Felder, die höchstens GUARD_LEASH Wegkosten
+# vom Posten entfernt sind. Durch einen gegrabenen Tunnel kostet ein
+# Schritt 1, durch Erde 2 - das Revier reicht also entlang der Tunnel
+# des Studenten weiter als in die Erde hinein.
+#
+# Das Revier (Feld -> Kosten) wird einmal pro Level berechnet und nur neu,
+# wenn in seiner Nähe gegraben wird. Der Prof selbst macht pro Schritt nur
+# Nachschlagen im dict, keine Wegsuche.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import heapq
+from typing import TYPE_CHECKING
+
+from src.tile import TileType
+
+if TYPE_CHECKING:
+    from src.tile import TileGrid
+
+_EMPTY = TileType.EMPTY.value
+
+# Wegkosten pro Schritt für das Revier
+TUNNEL_COST = 1
+EARTH_COST = 2
+
+
+class GuardRegion:
+    def __init__(self, tiles: TileGrid, post: tuple[int, int], leash: int):
+        self.tiles = tiles
+        self.post = post
+        self.leash = leash
+
+        # Feld -> Wegkosten vom Posten (nur Felder im Revier)
+        self.costs: dict[tuple[int, int], int] = {}
+        self._dirty = True
+
+    def on_dig(self, x: int, y: int) -> None:
+        """
+        Gegraben wurde: neu rechnen, falls das Feld das Revier ändern kann.
+        Jeder Schritt kostet mindestens 1, das Revier liegt also komplett in
+        der Raute mit Radius leash um den Posten - alles außerhalb ist egal.
+        """
+        px, py = self.post
+        if abs(x - px) + abs(y - py) <= self.leash:
+            self._dirty = True
+
+    def _refresh(self) -> None:
+        self._dirty = False
+        tiles = self.tiles
+        cols, rows, cells = tiles.cols, tiles.rows, tiles.cells
+
+        # Dijkstra ab dem Posten, Abbruch bei leash
+        costs = {self.post: 0}
+        heap = [(0, self.post)]
+        while heap:
+            cost, (x, y) = heapq.heappop(heap)
+            if cost > costs[(x, y)]:
+                continue
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    new_cost = cost + (TUNNEL_COST if cells[ny * cols + nx] == _EMPTY else EARTH_COST)
+                    if new_cost <= self.leash and new_cost < costs.get((nx, ny), new_cost + 1):
+                        costs[(nx, ny)] = new_cost
+                        heapq.heappush(heap, (new_cost, (nx, ny)))
+        self.costs = costs
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        if self._dirty:
+            self._refresh()
+        return cell in self.costs
+
+    def way_home(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Nachbarfelder, die näher am Posten liegen (für Profs außerhalb des Reviers)."""
+        px, py = self.post
+        cells = []
+        if x != px:
+            cells.append((x + (1 if px > x else -1), y))
+        if y != py:
+            cells.append((x, y + (1 if py > y else -1)))
+        return cells
@@ -14,16 +14,23 @@
 # - Wie implementiere ich die automatische Professoren genereirung aber ab lvl 3 soll ein manueller Professor erzeugt werden?
 #- Wie kann ich einem Professor sagen, dass er einen ECTS "bewachen soll"?
 # ------------------------------------------------------------
-import os
+# Reine Spiel-Logik: hier (und in entities/enemy/powerups/tile) wird kein
+# pygame importiert. Sprites und Sounds macht presentation.LevelView, das
+# Level meldet nur Ereignisse (LevelEvent). Damit läuft ein Level auch ohne
+# Display/Mixer, z.B. für Simulationen und Replays.
+# ------------------------------------------------------------
 import random
-import pygame
+import warnings
+from enum import Enum, auto
 
-from src.graphics import Sprite
 from src.enemy import ProfessorEnemy
 from src.powerups import PowerUp, PowerUpType
-from src.tile import Tile, TileType
+from src.tile import TileGrid, TileType, TileView
+from src.occupancy import CellIndex, CellPool
+from src.flowfield import FlowField
+from src.guard import GuardRegion
+from src.timeline import Timeline
 from .timer import BafoegTimer
-from .sound import SoundManager
 # ------------------------------------------------------------
 # Config / Fallbacks:
 # Wenn config oder timer fehlen, laufen wir mit Standardwerten,
@@ -38,67 +45,39 @@ from src.config import (
     BAFOEG_TIME_SECONDS,  
     REQUIRED_ECTS,
     LEVELS,
-    PROFESSORS
+    PROFESSORS,
+    PLAYER_STEP_SECONDS,
+    PLAYER_DIG_SECONDS,
+    LEVEL_GEN_MAX_ATTEMPTS,
+    PROF_CHASE_RADIUS,
+    GUARD_LEASH,
+    POWERUP_MESSAGE_SECONDS,
     )
 
+# Startfeld des Studenten (Game/Simulator setzen ihn dorthin)
+START_CELL = (1, 1)
 
 
 # ============================================================
 # ECTS (Coin)
 # ============================================================
 class ECTS:
-    """Ein ECTS/Coin, der auf einem Grid-Feld liegt und animiert ist."""
+    """Ein ECTS/Coin, der auf einem Grid-Feld liegt (Animation: presentation.py)."""
+
+    __slots__ = ("gx", "gy")
 
-    def __init__(self, grid_x: int, grid_y: int, tile_size: int):
+    def __init__(self, grid_x: int, grid_y: int):
         self.gx = grid_x
         self.gy = grid_y
-        self.tile_size = tile_size
-
-        # Coin Animation Frames (aus Sprite Sheet)
-        self.frames: list[pygame.Surface] = []
-        self._load_coin_frames()
-
-    def _load_coin_frames(self):
-        """
-        Lädt die Coin-Frames:
-        - Standard: Coin v3 (mehrere Frames untereinander)
-        - Fallback: Coin v1 (ein Bild)
-        """
-        path = os.path.join("assets", "sprites", "Coin v3 (kann man animiert darstellen).png")
-
-        try:
-            sheet = pygame.image.load(path).convert_alpha()
-        except:
-            # Wenn Sheet nicht existiert -> fallback auf Coin v1
-            fallback = os.path.join("assets", "sprites", "Coin v1.png")
-            img = pygame.image.load(fallback).convert_alpha()
-            img = pygame.transform.scale(img, (self.tile_size, self.tile_size))
-            self.frames = [img]
-            return
-
-        # Frames sind quadratisch (Breite = Höhe pro Frame)
-        frame_w = sheet.get_width()
-        frame_h = frame_w
-        count = sheet.get_height() // frame_h
-
-        for i in range(count):
-            rect = pygame.Rect(0, i * frame_h, frame_w, frame_h)
-            frame = sheet.subsurface(rect).copy()
-            frame = pygame.transform.scale(frame, (self.tile_size, self.tile_size))
-            self.frames.append(frame)
 
-        # Falls irgendwas komisch ist und keine Frames geladen wurden:
-        if not self.frames:
-            self.frames = [pygame.Surface((self.tile_size, self.tile_size))]
 
-    def draw(self, screen: pygame.Surface, offset_x: int, offset_y: int):
-        """Zeichnet den Coin an seine Pixelposition (Offset + Grid * TileSize)."""
-        px = offset_x + self.gx * self.tile_size
-        py = offset_y + self.gy * self.tile_size
-
-        # Animation: alle 100ms nächstes Frame
-        idx = (pygame.time.get_ticks() // 100) % len(self.frames)
-        screen.blit(self.frames[idx], (px, py))
+# ============================================================
+# Ereignisse für die Darstellung (Sounds usw.)
+# ============================================================
+class LevelEvent(Enum):
+    ECTS_COLLECTED = auto()
+    POWERUP_COLLECTED = auto()
+    SHIELD_USED = auto()
 
 
 # ============================================================
@@ -110,32 +89,57 @@ class Level:
     (Tiles, Coins, PowerUps, Professoren + Timer).
     """
 
-    def __init__(self, tile_size: int, sound_manager: SoundManager, level_index: int = 0, godmode: bool = False):
+    def __init__(self, level_index: int = 0, godmode: bool = False, seed: int | None = None):
         self.level_index = level_index
-        self.sound_manager = sound_manager
 
-        # Grid-Größe und Tile-Größe
+        # Eigener Zufallsgenerator statt globalem random: Level-Aufbau, Prof-Bewegung
+        # und PowerUp-Effekte hängen nur vom Seed ab (-> Replays, siehe replay.py)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Grid-Größe (die Tile-Größe in Pixeln kennt nur die Darstellung)
         self.cols = GRID_COLS
         self.rows = GRID_ROWS
-        self.tile_size = tile_size
 
-        # Tiles als 2D-Liste [x][y]
+        # Tiles als kompaktes Grid (1 Byte pro Feld, siehe tile.py)
         # Erst mal alles SOLID (Erde), wird dann in _build_world() umgebaut.
-        self.tiles: list[list[Tile]] = []
-        for x in range(self.cols):
-            spalte = []
-            for y in range(self.rows):
-                spalte.append(Tile(TileType.SOLID))
-            self.tiles.append(spalte)
+        self.tiles = TileGrid(self.cols, self.rows, TileType.SOLID)
+
+        # Felder, die seit dem letzten Zeichnen gegraben wurden
+        # (die TerrainLayer im Game flickt nur diese Felder neu)
+        self.dirty_tiles: set[tuple[int, int]] = set()
+
+        # Distanzfeld zum Studenten durch die Tunnel, geteilt von allen Profs
+        # (wird nur neu gerechnet, wenn der Student läuft oder gegraben wird)
+        self.flow = FlowField(self.tiles, PROF_CHASE_RADIUS)
+        self.flow.set_target(*START_CELL)
+
+        # Reviere der Wach-Profs (guard.py), werden beim Graben mitgezogen
+        self.guard_regions: list[GuardRegion] = []
+
+        # Ereignisse seit dem letzten pop_events() (Game spielt dazu Sounds ab)
+        self.events: list[LevelEvent] = []
 
         # Timer (BAföG)
         self.timer = BafoegTimer(BAFOEG_TIME_SECONDS)
 
+        # Zeitleiste: Prof-Schritte, Ablauf von Schild und Meldungen (timeline.py).
+        # update() führt nur aus, was gerade fällig ist.
+        self.clock = Timeline()
+        self._shield_timer = None
+        self._message_timer = None
+
         # Inhalte im Level
         self.ects_items: list[ECTS] = []
         self.powerups: list[PowerUp] = []
         self.professors: list[ProfessorEnemy] = []
 
+        # Belegungs-Index: Feld -> Objekte (O(1) statt Listen durchsuchen).
+        # Wird von add_*/move_professor/remove_* synchron gehalten.
+        self.ects_cells = CellIndex()
+        self.powerup_cells = CellIndex()
+        self.prof_cells = CellIndex()
+
         # Level-Status
         self.collected_ects = 0
         self.required_ects = REQUIRED_ECTS
@@ -144,6 +148,8 @@ class Level:
         self.game_over_reason = ""
         self.last_powerup_message = None
         self.godmode = godmode
+        # setzt _build_world(): False, wenn kein Versuch die Zeit-Prüfung geschafft hat
+        self.winnable = True
         # Level direkt aufbauen
         self._build_world()
 
@@ -161,120 +167,123 @@ class Level:
 
         Idee (simpel gehalten):
         - Semester 1/2: ECTS random + Professoren random
-        - Semester 2 optional guard_mode: 1 Prof startet bei einem ECTS
-        - Semester 3: ECTS an festen Punkten, Profs spawnen nahe der ECTS
+        - Semester 3: ECTS an festen Punkten
         - Semester 4: ECTS Cluster / mehr “Chaos”
+        - guard_mode (config.LEVELS): jeder der ersten Profs bewacht ein ECTS
+          (spawnt daneben, bleibt in seinem Revier, siehe guard.py)
+
+        Gewürfelt wird aus Pools freier Felder (occupancy.CellPool), jede
+        Platzierung kostet O(1) und kann nicht mehr hängen, wenn das Grid voll
+        ist. Danach prüft _is_winnable(), ob das Level in der BAföG-Zeit zu
+        schaffen ist - sonst neu würfeln, höchstens LEVEL_GEN_MAX_ATTEMPTS-mal.
+        Die Prüfung ist nicht gratis: pro Versuch eine Dijkstra-Suche vom Start,
+        die mit der Grid-Größe wächst (begrenzt durch die BAföG-Zeit).
+
+        Klappt es in keinem Versuch, bleibt der letzte und self.winnable ist
+        False (Game/batchsim/replay können das prüfen, keine Ausgabe pro Level).
         """
-
-        # ----------------------------
-        # 0) Level-Config holen + absichern
-        # ----------------------------
+        cfg = self._level_config()
+        for _ in range(LEVEL_GEN_MAX_ATTEMPTS):
+            self._generate(cfg)
+            if self._is_winnable():
+                self.winnable = True
+                return
+        # Budget aufgebraucht -> letzten Versuch behalten statt endlos weiterzuwürfeln.
+        # warnings meldet das nur einmal pro Stelle, nicht bei jedem Batch-Lauf.
+        self.winnable = False
+        warnings.warn(f"Semester {self.level_index + 1} ist evtl. nicht in der Zeit schaffbar "
+                      f"({LEVEL_GEN_MAX_ATTEMPTS} Versuche)", RuntimeWarning, stacklevel=2)
+
+    def _level_config(self) -> dict:
+        """Level-Config holen + absichern."""
         if not LEVELS:
             # Falls config leer ist -> minimaler Default
-            cfg = {"ects": REQUIRED_ECTS, "pizzas": 1, "prof_count": len(PROFESSORS), "guard_mode": False}
-        else:
-            # level_index absichern, damit nix out-of-range ist
-            idx = max(0, min(self.level_index, len(LEVELS) - 1))
-            cfg = LEVELS[idx]
+            return {"ects": REQUIRED_ECTS, "pizzas": 1, "prof_count": len(PROFESSORS), "guard_mode": False}
+        # level_index absichern, damit nix out-of-range ist
+        idx = max(0, min(self.level_index, len(LEVELS) - 1))
+        return LEVELS[idx]
 
+    def _generate(self, cfg: dict):
+        """Ein Versuch: Tiles, ECTS, PowerUps und Profs neu verteilen."""
         # Werte aus Config ziehen (mit Defaults)
         ects_target = int(cfg.get("ects", REQUIRED_ECTS))
         pizza_target = int(cfg.get("pizzas", 1))          # aktuell nicht genutzt, bleibt aber drin
         prof_target = int(cfg.get("prof_count", len(PROFESSORS)))
         guard_mode = bool(cfg.get("guard_mode", False))
 
+        # Reste vom letzten Versuch wegräumen
+        self.ects_items.clear()
+        self.powerups.clear()
+        self.professors = []
+        self.ects_cells.clear()
+        self.powerup_cells.clear()
+        self.prof_cells.clear()
+        self.guard_regions.clear()
+        self.clock.clear()
+        self.dirty_tiles.clear()
+
         # ----------------------------
         # 1) Tiles resetten: oben Gras, darunter Erde
         # ----------------------------
-        for x in range(self.cols):
-            for y in range(self.rows):
-                if y == 0:
-                    self.tiles[x][y] = Tile(TileType.GRASS)
-                else:
-                    self.tiles[x][y] = Tile(TileType.SOLID)
+        self.tiles.fill(TileType.SOLID)
+        self.tiles.fill_row(0, TileType.GRASS)
+        self.flow.invalidate()
 
         # kleiner Start-Tunnel (damit Start nicht “eingemauert” ist)
-        self.tiles[1][1].dig()
-        self.tiles[1][2].dig()
-        self.tiles[2][2].dig()
+        start_tunnel = [START_CELL, (1, 2), (2, 2)]
+        for x, y in start_tunnel:
+            self.tiles.dig(x, y)
+
+        # Pools: ECTS/PowerUps nur auf Erde (nicht im Start-Tunnel),
+        # Profs überall außer auf dem Startfeld
+        item_pool = CellPool(self.cols, self.rows, exclude=start_tunnel)
+        prof_pool = CellPool(self.cols, self.rows, exclude=[START_CELL])
 
         # ----------------------------
         # 2) ECTS-Positionen festlegen
         # ----------------------------
-        ects_positions: set[tuple[int, int]] = set()
-
         if self.level_index == 2:
-            # Semester 3: 3 ECTS nahe Ecken
-            ects_positions = {
-                (1, 1),
-                (self.cols - 2, 1),
-                (1, self.rows - 2),
-            }
-
+            # Semester 3: 3 ECTS nahe Ecken (die Ecke am Startfeld fällt weg)
+            fixed = [(1, 1), (self.cols - 2, 1), (1, self.rows - 2)]
         elif self.level_index == 3:
             # Semester 4: 1 Ecke + 2 als Cluster
-            ects_positions = {
-                (self.cols - 2, 1),
-                (self.cols // 2, self.rows // 2),
-                (self.cols // 2 + 1, self.rows // 2),
-            }
-
+            fixed = [(self.cols - 2, 1), (self.cols // 2, self.rows // 2), (self.cols // 2 + 1, self.rows // 2)]
+        else:
+            fixed = None
+
+        ects_positions: list[tuple[int, int]] = []
+        if fixed is not None:
+            for cell in fixed:
+                if cell != START_CELL and self.in_bounds(*cell) and cell not in ects_positions:
+                    ects_positions.append(cell)
+                    item_pool.discard(cell)
         else:
             # Semester 1 & 2: random SOLID-Felder (nicht Startfeld)
-            while len(ects_positions) < ects_target:
-                x = random.randrange(self.cols)
-                y = random.randrange(self.rows)
-
-                if (x, y) == (1, 1):
-                    continue
-
-                # ECTS nur auf Erde (solid) legen
-                if self.tiles[x][y].is_solid:
-                    ects_positions.add((x, y))
+            for _ in range(min(ects_target, len(item_pool))):
+                ects_positions.append(item_pool.take(self.rng))
 
         # ECTS-Objekte erzeugen
         for (x, y) in ects_positions:
-            # Bei dir wird (1,1) bewusst übersprungen (Startfeld)
-            if (x, y) == (1, 1):
-                continue
-            self.ects_items.append(ECTS(x, y, self.tile_size))
+            self.add_ects(ECTS(x, y))
 
         # wichtig fürs Gewinnen
         self.required_ects = ects_target
 
         # ----------------------------
-        # 3) PowerUps platzieren
+        # 3) PowerUps platzieren (Erde, nicht Startfeld, nicht auf ECTS)
         # ----------------------------
-        # Kandidaten-Felder für PowerUps:
-        # - nicht Startfeld
-        # - nicht auf ECTS
-        # - nur auf SOLID (also Erde)
-        kandidaten: list[tuple[int, int]] = []
-        for x in range(self.cols):
-            for y in range(self.rows):
-                if (x, y) == (1, 1):
-                    continue
-                if (x, y) in ects_positions:
-                    continue
-                if not self.tiles[x][y].is_solid:
-                    continue
-                kandidaten.append((x, y))
-
-        random.shuffle(kandidaten)
-
         # Anzahl PowerUps pro Level (Default: mindestens 1)
         powerups_total = int(cfg.get("powerups_total", max(1, self.required_ects // 2)))
 
         type_list = list(PowerUpType)  # z.B. PIZZA, PARTY, CHATGPT
-        for (x, y) in kandidaten[:powerups_total]:
-            ptype = random.choice(type_list)
-            self.powerups.append(PowerUp(x, y, self.tile_size, ptype))
+        for _ in range(min(powerups_total, len(item_pool))):
+            x, y = item_pool.take(self.rng)
+            ptype = self.rng.choice(type_list)
+            self.add_powerup(PowerUp(x, y, ptype))
 
         # ----------------------------
         # 4) Professoren erzeugen
         # ----------------------------
-        self.professors = []
-
         # Wir filtern zuerst Prof-Infos aus der Config:
         # - “harte” Profs (hp >= 3) erst ab Semester 3 (level_index >= 2)
         prof_infos: list[dict] = []
@@ -295,69 +304,34 @@ class Level:
         # Anzahl Professoren auf prof_target begrenzen
         prof_infos = prof_infos[:min(prof_target, len(prof_infos))]
 
-        # guard_target: irgendein ECTS (nur fürs “bewachen” im Semester 2)
-        guard_target = next(iter(ects_positions)) if ects_positions else None
-
         for i, prof_info in enumerate(prof_infos):
             bild_pfad = prof_info["sprite"]
             fragen_liste = prof_info["questions"]
 
-            sprite = Sprite(bild_pfad, self.tile_size, self.tile_size)
-
-            # Spawn-Position suchen
-            spawn_x, spawn_y = None, None
+            # Wen bewacht der Prof? (Spawn direkt neben diesem ECTS)
+            # guard_mode: die ersten min(prof_count, #ECTS) Profs bewachen je ein ECTS
+            guarded = ects_positions[i] if guard_mode and i < len(ects_positions) else None
 
-            # Semester 2 (level_index == 1): erster Prof soll nahe bei einem ECTS starten
-            if self.level_index == 1 and guard_mode and guard_target is not None and i == 0:
-                gx, gy = guard_target
+            spawn = None
+            if guarded is not None:
+                gx, gy = guarded
                 kandidaten_guard = [(gx + 1, gy), (gx - 1, gy), (gx, gy + 1), (gx, gy - 1)]
-                random.shuffle(kandidaten_guard)
-
-                for xx, yy in kandidaten_guard:
-                    if not self.in_bounds(xx, yy):
-                        continue
-                    if (xx, yy) == (1, 1):
-                        continue
-                    # kein anderer Prof darf dort stehen
-                    if any(p.grid_x == xx and p.grid_y == yy for p in self.professors):
-                        continue
-                    spawn_x, spawn_y = xx, yy
-                    break
-
-            # Semester 3 (level_index == 2): Profs spawnen nahe an ECTS (pro ECTS ein Prof)
-            if self.level_index == 2:
-                ects_list = list(ects_positions)
-                if i < len(ects_list):
-                    gx, gy = ects_list[i]
-                    kandidaten_guard = [(gx + 1, gy), (gx - 1, gy), (gx, gy + 1), (gx, gy - 1)]
-                    random.shuffle(kandidaten_guard)
-
-                    for xx, yy in kandidaten_guard:
-                        if not self.in_bounds(xx, yy):
-                            continue
-                        if (xx, yy) == (1, 1):
-                            continue
-                        if any(p.grid_x == xx and p.grid_y == yy for p in self.professors):
-                            continue
-                        spawn_x, spawn_y = xx, yy
-                        break
+                self.rng.shuffle(kandidaten_guard)
+                # im Pool = im Grid, nicht Startfeld, noch kein Prof dort
+                spawn = next((c for c in kandidaten_guard if c in prof_pool), None)
+                if spawn is not None:
+                    prof_pool.discard(spawn)
 
             # Falls wir noch keinen Spawn gefunden haben -> random freies Feld
-            if spawn_x is None:
-                while True:
-                    x = random.randrange(self.cols)
-                    y = random.randrange(self.rows)
-
-                    if (x, y) == (1, 1):
-                        continue
-                    if any(p.grid_x == x and p.grid_y == y for p in self.professors):
-                        continue
-
-                    spawn_x, spawn_y = x, y
-                    break
+            if spawn is None:
+                spawn = prof_pool.take(self.rng)
+                if spawn is None:
+                    break  # Grid ist voll, mehr Profs passen nicht rein
 
             # Prof erzeugen
-            prof = ProfessorEnemy(spawn_x, spawn_y, self.tile_size, sprite)
+            # Tempo aus der Config (z.B. Klausur speed=0.5), Standard 1.0
+            prof = ProfessorEnemy(spawn[0], spawn[1], rng=self.rng, sprite_path=bild_pfad,
+                                  speed=float(prof_info.get("speed", 1.0)))
 
             # Fragen-Liste an Prof geben (wichtig für Quiz)
             prof.questions_pool = fragen_liste
@@ -367,7 +341,94 @@ class Level:
                 prof.hp = int(prof_info["hp"])
                 prof.max_hp = int(prof_info["hp"])
 
-            self.professors.append(prof)
+            # Wach-Prof: bleibt in seinem Revier um das ECTS (auch wenn der
+            # Spawn daneben nicht geklappt hat)
+            if guarded is not None:
+                prof.guard = GuardRegion(self.tiles, guarded, GUARD_LEASH)
+                self.guard_regions.append(prof.guard)
+
+            self.add_professor(prof)
+
+    # ------------------------------------------------------------
+    # Ist das Level in der BAföG-Zeit zu schaffen?
+    # ------------------------------------------------------------
+    def _is_winnable(self) -> bool:
+        """
+        - Gibt es überhaupt genug ECTS? (Coins + 1 pro Prof-HP über Fragen + ChatGPT)
+        - Ist jeder Coin vom Start aus in der Zeit erreichbar?
+        - Schafft man die nötigen Coins auf einem Rundweg (immer zum nächsten)?
+        Laufzeit: PLAYER_STEP_SECONDS pro Schritt im Tunnel, PLAYER_DIG_SECONDS in Erde.
+
+        Kosten pro Versuch: Manhattan-Schranken in O(k²) für k Coins, nur wenn
+        die nichts entscheiden EINE Dijkstra-Suche vom Start aus (bis zum Budget).
+        """
+        coins = [(e.gx, e.gy) for e in self.ects_items]
+        available = (len(coins) + sum(p.hp for p in self.professors)
+                     + sum(1 for p in self.powerups if p.ptype is PowerUpType.CHATGPT))
+        if available < self.required_ects:
+            return False
+        if not coins:
+            return True
+
+        need = min(len(coins), self.required_ects)
+        budget = self.timer.duration
+        # Erst die schnellen Schranken über den Manhattan-Abstand: jeder Schritt
+        # kostet mindestens PLAYER_STEP_SECONDS.
+        if max(self._steps(START_CELL, c) for c in coins) * PLAYER_STEP_SECONDS > budget:
+            return False  # der weiteste Coin ist selbst im Tunnel zu weit weg
+        if need == len(coins) and self._spanning_steps(coins) * PLAYER_STEP_SECONDS > budget:
+            return False  # alle Coins nötig, aber selbst der kürzeste Weg ist zu lang
+
+        # Geradeaus graben (Manhattan * PLAYER_DIG_SECONDS) geht immer - passt
+        # das schon, ist das Level sicher schaffbar.
+        dig_leg = {c: self._steps(START_CELL, c) * PLAYER_DIG_SECONDS for c in coins}
+        if self._route_time(coins, need, dig_leg) <= budget:
+            return True
+
+        # Genau wird nur die Zeit vom Start aus gerechnet (dort liegt der einzige
+        # Tunnel). Zwischen den Coins ist noch alles Erde: geradeaus graben
+        # kostet genau Manhattan * PLAYER_DIG_SECONDS, und dieser Weg geht immer.
+        costs = self.tiles.travel_costs(*START_CELL, PLAYER_STEP_SECONDS, PLAYER_DIG_SECONDS, budget)
+        first_leg = {c: costs[c[1] * self.cols + c[0]] for c in coins}
+        if max(first_leg.values()) > budget:
+            return False
+        return self._route_time(coins, need, first_leg) <= budget
+
+    @staticmethod
+    def _steps(a: tuple[int, int], b: tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    @classmethod
+    def _spanning_steps(cls, coins: list[tuple[int, int]]) -> int:
+        """
+        Länge des minimalen Spannbaums (Manhattan) über Start + Coins.
+        Jeder Weg, der alle Coins abläuft, ist mindestens so lang (Prim, O(k²)).
+        """
+        best = {c: cls._steps(START_CELL, c) for c in coins}
+        total = 0
+        while best:
+            cell = min(best, key=best.get)
+            total += best.pop(cell)
+            for other in best:
+                best[other] = min(best[other], cls._steps(cell, other))
+        return total
+
+    def _route_time(self, coins: list[tuple[int, int]], need: int,
+                    first_leg: dict[tuple[int, int], float]) -> float:
+        """
+        Zeit für den Rundweg über need Coins (immer zum nächsten):
+        erster Abschnitt aus first_leg (Dijkstra vom Start), danach
+        Manhattan * PLAYER_DIG_SECONDS von Coin zu Coin.
+        """
+        nxt = min(coins, key=first_leg.get)
+        total = first_leg[nxt]
+        left = [c for c in coins if c != nxt]
+        for _ in range(need - 1):
+            pos = nxt
+            nxt = min(left, key=lambda c: self._steps(pos, c))
+            total += self._steps(pos, nxt) * PLAYER_DIG_SECONDS
+            left.remove(nxt)
+        return total
 
     # ------------------------------------------------------------
     # Hilfsfunktionen
@@ -377,8 +438,68 @@ class Level:
         return 0 <= x < self.cols and 0 <= y < self.rows
 
     def dig(self, x: int, y: int):
-        """Damit andere Klassen nicht direkt self.tiles[x][y] anfassen müssen."""
-        self.tiles[x][y].dig()
+        """Damit andere Klassen nicht direkt self.tiles anfassen müssen."""
+        self.tiles.dig(x, y)
+        self.dirty_tiles.add((x, y))
+        self.flow.invalidate()
+        for region in self.guard_regions:
+            region.on_dig(x, y)
+
+    def is_solid(self, x: int, y: int) -> bool:
+        """True, wenn auf (x,y) noch Erde/Gras ist."""
+        return self.tiles.is_solid(x, y)
+
+    def tile(self, x: int, y: int) -> TileView:
+        """Tile-Ansicht für Code, der noch mit Tile-Objekten arbeitet."""
+        return self.tiles.tile(x, y)
+
+    def pop_events(self) -> list[LevelEvent]:
+        """Gesammelte Ereignisse abholen (danach ist die Liste leer)."""
+        events = self.events
+        self.events = []
+        return events
+
+    # ------------------------------------------------------------
+    # Belegung: Objekte hinzufügen / bewegen / entfernen / abfragen
+    # ------------------------------------------------------------
+    def add_ects(self, ects: ECTS) -> None:
+        self.ects_items.append(ects)
+        self.ects_cells.add(ects, ects.gx, ects.gy)
+
+    def add_powerup(self, powerup: PowerUp) -> None:
+        self.powerups.append(powerup)
+        self.powerup_cells.add(powerup, powerup.grid_x, powerup.grid_y)
+
+    def add_professor(self, prof) -> None:
+        self.professors.append(prof)
+        self.prof_cells.add(prof, prof.grid_x, prof.grid_y)
+        prof.turn = self.clock.schedule(prof.first_move_in, self._prof_turn, prof)
+
+    def move_professor(self, prof, x: int, y: int) -> None:
+        """Prof auf ein anderes Feld setzen (Index wird mitgezogen)."""
+        self.prof_cells.move(prof, prof.grid_x, prof.grid_y, x, y)
+        prof.grid_x = x
+        prof.grid_y = y
+
+    def professor_at(self, x: int, y: int):
+        """Prof auf dem Feld oder None."""
+        return self.prof_cells.first(x, y)
+
+    def is_prof_at(self, x: int, y: int) -> bool:
+        return (x, y) in self.prof_cells
+
+    def chase_step(self, x: int, y: int) -> tuple[int, int] | None:
+        """
+        Nächstes Feld für einen Prof auf (x, y), der den Studenten jagt.
+        None -> Student nicht durch Tunnel erreichbar (Prof läuft zufällig).
+        Sind alle besseren Felder von anderen Profs belegt, bleibt er stehen.
+        """
+        if self.flow.distance(x, y) is None:
+            return None
+        for cell in self.flow.downhill(x, y):
+            if not self.is_prof_at(*cell):
+                return cell
+        return x, y
 
     # ------------------------------------------------------------
     # Update
@@ -394,9 +515,45 @@ class Level:
             self.is_game_over = True
             self.game_over_reason = "BAföG-Zeit abgelaufen."
 
-        # Professoren updaten (Movement / KI kommt in enemy.py)
-        for prof in self.professors:
-            prof.update(dt, self)
+        if self.is_finished:
+            return
+
+        # Uhr weiterstellen: nur fällige Profs/Effekte kommen dran
+        self.clock.advance(dt)
+
+    def _prof_turn(self, prof) -> None:
+        """Prof ist dran (Movement / KI kommt in enemy.py), danach neu eintragen."""
+        delay = prof.take_turn(self)
+        prof.turn = self.clock.schedule(delay, self._prof_turn, prof)
+
+    # ------------------------------------------------------------
+    # Zeitlich begrenzte Effekte (laufen über die Zeitleiste ab)
+    # ------------------------------------------------------------
+    def show_message(self, text: str) -> None:
+        """PowerUp-Meldung fürs HUD, verschwindet nach POWERUP_MESSAGE_SECONDS."""
+        self.last_powerup_message = text
+        self.clock.cancel(self._message_timer)
+        self._message_timer = self.clock.schedule(POWERUP_MESSAGE_SECONDS, self._clear_message)
+
+    def _clear_message(self) -> None:
+        self.last_powerup_message = None
+        self._message_timer = None
+
+    def grant_shield(self, student, seconds: float) -> None:
+        """Pizza-Schild für seconds Sekunden (eine neue Pizza startet die Zeit neu)."""
+        student.has_pizza_shield = True
+        self.clock.cancel(self._shield_timer)
+        self._shield_timer = self.clock.schedule(seconds, self._expire_shield, student)
+
+    def _expire_shield(self, student) -> None:
+        student.has_pizza_shield = False
+        self._shield_timer = None
+
+    def shield_time_left(self, student) -> float:
+        """Restzeit des Pizza-Schilds in Sekunden (0 = kein Schild)."""
+        if not student.has_pizza_shield:
+            return 0.0
+        return self.clock.time_until(self._shield_timer)
 
     # ------------------------------------------------------------
     # Interaktion: Spieler betritt ein Feld
@@ -409,38 +566,43 @@ class Level:
         - Sieg prüfen
         - checken ob Prof auf dem Feld steht
         """
-        beruehrter_prof = None
-
         # ECTS einsammeln
-        for ects in list(self.ects_items):
-            if ects.gx == gx and ects.gy == gy:
-                self.ects_items.remove(ects)
-                self.collected_ects += 1
-                
-                self.sound_manager.play_ects_sound()
+        for ects in self.ects_cells.at(gx, gy):
+            self.ects_items.remove(ects)
+            self.ects_cells.remove(ects, gx, gy)
+            self.collected_ects += 1
+            self._release_guards(gx, gy)
+
+            self.events.append(LevelEvent.ECTS_COLLECTED)
 
         # Sieg prüfen
-        if self.collected_ects >= self.required_ects and not self.is_game_over:
-            self.is_won = True
+        self._check_won()
 
         # PowerUps einsammeln
-        for p in list(self.powerups):
-            if p.grid_x == gx and p.grid_y == gy:
-                self.powerups.remove(p)
-                
-                self.sound_manager.play_powerup_sound()
-                nachricht = p.apply_to(self, student)
-                if nachricht:
-                    self.last_powerup_message = nachricht
+        for p in self.powerup_cells.at(gx, gy):
+            self.powerups.remove(p)
+            self.powerup_cells.remove(p, gx, gy)
+
+            self.events.append(LevelEvent.POWERUP_COLLECTED)
+            nachricht = p.apply_to(self, student)
+            if nachricht:
+                self.show_message(nachricht)
+
+        # Profs jagen ab jetzt zum neuen Feld
+        self.flow.set_target(gx, gy)
 
         # Prof-Kollision prüfen
-        for prof in self.professors:
-            if prof.grid_x == gx and prof.grid_y == gy:
-                beruehrter_prof = prof
-                break
+        beruehrter_prof = self.professor_at(gx, gy)
 
         return beruehrter_prof
 
+    def _release_guards(self, gx: int, gy: int) -> None:
+        """ECTS ist weg -> seine Wachen laufen ab jetzt wie normale Profs."""
+        for prof in self.professors:
+            if prof.guard is not None and prof.guard.post == (gx, gy):
+                self.guard_regions.remove(prof.guard)
+                prof.guard = None
+
     # ------------------------------------------------------------
     # Quiz / Professoren-Handling
     # ------------------------------------------------------------
@@ -452,32 +614,59 @@ class Level:
         """Entfernt einen Prof aus dem Level (wenn besiegt)."""
         if prof in self.professors:
             self.professors.remove(prof)
+            self.prof_cells.remove(prof, prof.grid_x, prof.grid_y)
+            self.clock.cancel(prof.turn)
+            if prof.guard is not None:
+                self.guard_regions.remove(prof.guard)
 
-    # ------------------------------------------------------------
-    # Rendering
-    # ------------------------------------------------------------
-    def draw(self, screen: pygame.Surface, offset_x: int, offset_y: int, block_solid, block_empty):
-        """Zeichnet Tiles + Items + Gegner."""
-        # Tiles
-        for x in range(self.cols):
-            for y in range(self.rows):
-                tile = self.tiles[x][y]
-                px = offset_x + x * self.tile_size
-                py = offset_y + y * self.tile_size
-
-                if tile.is_solid:
-                    block_solid.draw(screen, px, py)
-                else:
-                    block_empty.draw(screen, px, py)
-
-        # ECTS
-        for ects in self.ects_items:
-            ects.draw(screen, offset_x, offset_y)
-
-        # PowerUps
-        for p in self.powerups:
-            p.draw(screen, offset_x, offset_y)
-
-        # Professoren
-        for prof in self.professors:
-            prof.draw(screen, offset_x, offset_y)
+    def player_contact(self, student):
+        """
+        Steht ein Prof auf dem Feld des Studenten?
+        - mit Pizza-Schild: Schild verbrauchen, Prof entfernen -> None
+        - sonst: den Prof zurückgeben (Game stellt dann die Frage)
+        """
+        prof = self.professor_at(student.grid_x, student.grid_y)
+        if prof is None:
+            return None
+
+        if student.has_pizza_shield:
+            student.has_pizza_shield = False  # Schild verbrauchen
+            self.clock.cancel(self._shield_timer)
+            self._shield_timer = None
+            self.show_message("Pizza-Schild hat dich gerettet! 🍕")
+            self.remove_professor(prof)       # Prof entfernen, damit er nicht nochmal trifft
+            self.events.append(LevelEvent.SHIELD_USED)
+            return None
+        return prof
+
+    def answer_question(self, prof, correct: bool) -> bool:
+        """
+        Ergebnis einer Prof-Frage anwenden:
+        - richtig: +1 ECTS, Prof verliert 1 HP, bei 0 HP fliegt er raus
+        - immer: 10s Zeitstrafe (aber nie unter 5s)
+        - Sieg prüfen (is_won)
+        Rückgabe: True, wenn der Prof besiegt wurde.
+        """
+        defeated = False
+        if correct:
+            self.collected_ects += 1
+
+            # Standardannahme (für Profs): eine richtige Antwort reicht
+            defeated = True
+            if prof is not None and hasattr(prof, "hp"):
+                prof.hp -= 1
+                if prof.hp > 0:
+                    defeated = False  # Hat noch Leben -> NICHT besiegt
+            if defeated:
+                self.remove_professor(prof)
+
+        # Zeitstrafe
+        self.timer.time_left = max(5.0, self.timer.time_left - 10.0)
+
+        self._check_won()
+        return defeated
+
+    def _check_won(self) -> None:
+        """Genug ECTS für dieses Level gesammelt -> gewonnen."""
+        if self.collected_ects >= self.required_ects and not self.is_game_over:
+            self.is_won = True
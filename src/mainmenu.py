@@ -5,12 +5,12 @@ import pygame
 
 
 class MainMenu:
-    #Hauptmenüklasse, beinhaltet Hintergrund, Butttons Update und Draw Logik
+    #Hauptmenüklasse, beinhaltet Hintergrund, Buttons, Event- und Draw-Logik
+    #Das Menü hat KEINE eigene Schleife mehr: Game.run reicht im MENU-State
+    #die Events an handle_event weiter und zeichnet über draw()
     def __init__(self, screen, bg_scaled, bg_rect, font, titleimg):
         self.screen=screen
-        self.clock= pygame.time.Clock() #clock für fps begrenzung
-        self.auswahl=None
-        self.running=True
+        self.auswahl=None   #"START" / "QUIT", sobald gewählt wurde
         self.bg_scaled=bg_scaled
         self.bg_rect=bg_rect
         self.font=font
@@ -60,43 +60,43 @@ class MainMenu:
         }
         
         
-    def update(self):
-        for event in pygame.event.get():
-            if event.type==pygame.QUIT:
-                self.auswahl="QUIT"
-                self.running=False
-            elif event.type==pygame.KEYDOWN:
-                self.handle_cheat_input(event)
-        mouse_pos=pygame.mouse.get_pos()
-        for name, button in self.buttons.items():
-            button.b_groesse_aendern(mouse_pos)
-
-            if button.is_clicked():
-                self.auswahl=name
-                self.running=False
-        
-        
-    def draw (self):
-        #Zeichnet Huntergrund, Buttons, aktualiiert den bildschirm
-        self.screen.fill((0,0,0))
-        self.screen.blit(self.bg_scaled,self.bg_rect)
-        self.screen.blit(self.title_surface,self.title_rect)
+    def handle_event(self, event):
+        #Verarbeitet ein Event aus Game.run
+        #return True wenn sich etwas Sichtbares geändert hat (Hover)
+        if event.type==pygame.QUIT:
+            self.auswahl="QUIT"
+        elif event.type==pygame.KEYDOWN:
+            self.handle_cheat_input(event)
+        elif event.type==pygame.MOUSEMOTION:
+            #Hover nur bei Mausbewegung neu prüfen (nicht jeden Frame)
+            changed=False
+            for button in self.buttons.values():
+                changed=button.set_hover(event.pos) or changed
+            return changed
+        elif event.type==pygame.MOUSEBUTTONDOWN and event.button==1:
+            for name, button in self.buttons.items():
+                if button.is_clicked(event.pos):
+                    self.auswahl=name
+        return False
+
+    def take_result(self):
+        #Gibt die Auswahl genau einmal zurück (None solange nichts gewählt wurde)
+        if self.auswahl is None:
+            return None
+        result={"auswahl": self.auswahl, "godmode":self.godmode}
+        self.auswahl=None
+        return result
+
+    def draw (self, screen=None):
+        #Zeichnet Titel + Buttons, Hintergrund und Präsentieren macht das Game
+        #return: gezeichnete Rechtecke
+        screen=screen or self.screen
+        rects=[screen.blit(self.title_surface,self.title_rect)]
 
         for button in self.buttons.values():
-            button.draw(self.screen)
-
-        pygame.display.flip()
-
-    def run(self):
-        #Hauptschleife des Menüs läuft solange wie Running=True
-        #Gibt am ende die Aktion zurück 
-        while self.running:
-            self.update()
-            self.draw()
-            self.clock.tick(60)
-        self.running=True
-        return {"auswahl": self.auswahl, "godmode":self.godmode}
-    
+            rects.append(button.draw(screen))
+        return rects
+
     def handle_cheat_input(self,event):
         if event.unicode.isprintable() and not self.godmode:
             self.cheat_buffer += event.unicode.lower()
@@ -0,0 +1,109 @@
+# occupancy.py
+# ----------------------------------------------------------
+# Belegungs-Index fürs Grid: Feld -> Objekte auf diesem Feld.
+#
+# Statt bei jeder Frage "steht hier ein Prof / liegt hier ein ECTS?"
+# über alle Listen zu laufen, schaut man direkt im Dict nach (O(1)).
+# Level hält den Index synchron (spawnen, bewegen, entfernen), deshalb
+# sollten Grid-Objekte nur noch über die Level-Methoden bewegt werden.
+#
+# Pro Feld eine Liste (keine Menge), damit die Reihenfolge stabil bleibt
+# (wichtig für reproduzierbare Läufe).
+# ----------------------------------------------------------
+
+from __future__ import annotations
+
+
+class CellIndex:
+    def __init__(self):
+        self._cells: dict[tuple[int, int], list] = {}
+
+    def add(self, obj, x: int, y: int) -> None:
+        self._cells.setdefault((x, y), []).append(obj)
+
+    def remove(self, obj, x: int, y: int) -> None:
+        objs = self._cells.get((x, y))
+        if not objs or obj not in objs:
+            return
+        objs.remove(obj)
+        if not objs:
+            del self._cells[(x, y)]
+
+    def move(self, obj, old_x: int, old_y: int, new_x: int, new_y: int) -> None:
+        self.remove(obj, old_x, old_y)
+        self.add(obj, new_x, new_y)
+
+    def at(self, x: int, y: int) -> tuple:
+        """Alle Objekte auf dem Feld (Kopie, darf beim Durchlaufen verändert werden)."""
+        objs = self._cells.get((x, y))
+        return tuple(objs) if objs else ()
+
+    def first(self, x: int, y: int):
+        """Erstes Objekt auf dem Feld oder None."""
+        objs = self._cells.get((x, y))
+        return objs[0] if objs else None
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        return cell in self._cells
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+
+
+class CellPool:
+    """
+    Menge freier Felder eines cols x rows Grids, aus der man in O(1)
+    zufällig zieht.
+
+    Statt "randrange, bis ein passendes Feld kommt" (kann bei vollem Grid
+    ewig laufen) ist das ein Fisher-Yates, der nur die vertauschten Stellen
+    in Dicts speichert: am Anfang liegt jedes Feld an "seiner" Position,
+    gezogene/entfernte Felder wandern ans Ende. Anlegen kostet deshalb
+    nichts, egal wie groß das Grid ist - Speicher nur pro entferntem Feld.
+    """
+
+    def __init__(self, cols: int, rows: int, exclude=()):
+        self.cols = cols
+        self._size = cols * rows
+        # Position -> Feld und Feld -> Position, nur wo abweichend
+        self._at: dict[int, int] = {}
+        self._pos: dict[int, int] = {}
+        for x, y in exclude:
+            self.discard((x, y))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _position(self, i: int) -> int:
+        return self._pos.get(i, i)
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        x, y = cell
+        if not (0 <= x < self.cols):
+            return False
+        i = y * self.cols + x
+        return 0 <= i and self._position(i) < self._size
+
+    def discard(self, cell: tuple[int, int]) -> None:
+        """Feld aus dem Pool nehmen (falls noch drin)."""
+        if cell not in self:
+            return
+        i = cell[1] * self.cols + cell[0]
+        p = self._position(i)
+        last = self._size - 1
+        j = self._at.get(last, last)
+        # Feld mit dem letzten im Pool tauschen und den Pool verkleinern
+        self._at[p], self._pos[j] = j, p
+        self._at[last], self._pos[i] = i, last
+        self._size = last
+
+    def take(self, rng) -> tuple[int, int] | None:
+        """Zufälliges Feld ziehen und entfernen (None, wenn der Pool leer ist)."""
+        if self._size == 0:
+            return None
+        p = rng.randrange(self._size)
+        i = self._at.get(p, p)
+        cell = (i % self.cols, i // self.cols)
+        self.discard(cell)
+        return cell
@@ -3,6 +3,7 @@
 #Prompt: "Kannst du mir bei der Struktur des Pause-Menüs helfen? ich muss den Volume Slider mit einbinden wie mache ich das am besten"
 import pygame
 from .ui import VolumeSlider
+from .text_cache import render_text
 class PauseMenu:
     def __init__(self, width: int, height: int, font_title: pygame.font.Font, font_small: pygame.font.Font, sound_manager):
         self.width = width
@@ -47,7 +48,7 @@ class PauseMenu:
         center_x = self.width // 2
         center_y = self.height // 2
 
-        title_surface = self.font_title.render("PAUSE", True, (30, 50, 240))
+        title_surface = render_text(self.font_title, "PAUSE", (30, 50, 240))
         screen.blit(title_surface, title_surface.get_rect(center=(center_x, center_y - 120)))
 
         self.volume_slider.draw(screen)
@@ -58,11 +59,11 @@ class PauseMenu:
 
         pygame.draw.rect(screen, color_res, self.button_resume,)
         pygame.draw.rect(screen, color_menu, self.button_menu,)
-        resume_text_surface = self.font_small.render("Weiter", True, (20, 20, 20))
-        menu_text_surface   = self.font_small.render("Hauptmenü", True, (20, 20, 20))
+        resume_text_surface = render_text(self.font_small, "Weiter", (20, 20, 20))
+        menu_text_surface   = render_text(self.font_small, "Hauptmenü", (20, 20, 20))
         
         screen.blit(resume_text_surface, resume_text_surface.get_rect(center=self.button_resume.center))
         screen.blit(menu_text_surface,   menu_text_surface.get_rect(center=self.button_menu.center))
 
-        hint = self.font_small.render("Tastatur: SHIFT (Weiter) | R (Neustart)", True, (200, 200, 200))
+        hint = render_text(self.font_small, "Tastatur: SHIFT (Weiter) | R (Neustart)", (200, 200, 200))
         screen.blit(hint, hint.get_rect(center=(center_x, center_y + 140)))
\ No newline at end of file
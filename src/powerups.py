@@ -26,24 +26,11 @@
 from __future__ import annotations
 from enum import Enum, auto
 from typing import TYPE_CHECKING
-import pygame
-import random
 
 if TYPE_CHECKING:
     from .level import Level
     from .entities import Student
 
-# Hilfsfunktion zum sicheren Laden von Bildern
-def load_scaled(path: str, size: int) -> pygame.Surface | None:
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(img, (size, size))
-    except FileNotFoundError:
-        # Gibt None zurück, damit wir wissen, dass das Bild fehlt
-        # und wir stattdessen ein farbiges Rechteck zeichnen können.
-        print(f"Asset-Warnung: {path} nicht gefunden.")
-        return None
-
 class PowerUpType(Enum):
     PIZZA = auto()    # Schutzschild
     PARTY = auto()    # Zeit-Modifikation (Risiko)
@@ -51,57 +38,13 @@ class PowerUpType(Enum):
 
 class PowerUp:
     """
-    Repräsentiert ein einsammelbares Item.
-    Kapselt Rendering (View) und Effekt-Logik (Model).
+    Repräsentiert ein einsammelbares Item (nur Logik, kein pygame).
+    Bilder und Fallback-Rechtecke stecken in presentation.LevelView.
     """
-    def __init__(self, grid_x: int, grid_y: int, tile_size: int, ptype: PowerUpType):
+    def __init__(self, grid_x: int, grid_y: int, ptype: PowerUpType):
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.tile_size = tile_size
         self.ptype = ptype
-        
-        self.sprite = None
-        
-        # Asset-Zuordnung: Hier werden die Dateinamen definiert
-        if self.ptype == PowerUpType.PIZZA:
-            self.sprite = load_scaled("assets/sprites/pizza.png", tile_size)
-        elif self.ptype == PowerUpType.PARTY:
-            self.sprite = load_scaled("assets/sprites/party.png", tile_size)
-        elif self.ptype == PowerUpType.CHATGPT:
-            self.sprite = load_scaled("assets/sprites/Ai Icon.png", tile_size)
-
-    # --------------------------------------------------------
-    # Zeichnen (View-Ebene)
-    # --------------------------------------------------------
-    def draw(self, screen: pygame.Surface, offset_x: int, offset_y: int) -> None:
-        px = offset_x + self.grid_x * self.tile_size
-        py = offset_y + self.grid_y * self.tile_size
-
-        # PRIORITÄT A: Wenn das Sprite erfolgreich geladen wurde -> Zeichnen
-        if self.sprite is not None:
-            screen.blit(self.sprite, (px, py))
-            return
-
-        # PRIORITÄT B: Fallback (falls Bilddatei fehlt) -> Farbiges Rechteck
-        # Das garantiert, dass das Spiel spielbar bleibt, auch ohne Assets.
-        margin = self.tile_size // 6
-        
-        if self.ptype == PowerUpType.PARTY:
-            color = (180, 80, 200) # Lila
-        elif self.ptype == PowerUpType.CHATGPT:
-            color = (80, 220, 180) # Türkis
-        elif self.ptype == PowerUpType.PIZZA:
-            color = (255, 100, 100) # Rot
-        else:
-            color = (255, 255, 0) # Gelb (Unbekannt)
-
-        rect = pygame.Rect(
-            px + margin,
-            py + margin,
-            self.tile_size - 2 * margin,
-            self.tile_size - 2 * margin,
-        )
-        pygame.draw.rect(screen, color, rect)
 
     # --------------------------------------------------------
     # Logik anwenden (Business Logic)
@@ -114,13 +57,13 @@ class PowerUp:
         
         # Pizza: Setzt den Status im Studenten-Objekt
         if self.ptype == PowerUpType.PIZZA:
-            student.has_pizza_shield = True
-            student.pizza_shield_left = 10.0 
+            level.grant_shield(student, 10.0)
             return "Pizza: Ein Treffer vom Prof wird ignoriert! 🍕"
 
         # Party: Manipuliert die globale Level-Zeit
         if self.ptype == PowerUpType.PARTY:
-            delta = random.choice([-10.0, +10.0])
+            # Zufall vom Level (Seed -> reproduzierbar für Replays)
+            delta = level.rng.choice([-10.0, +10.0])
             new_time = max(5.0, level.timer.time_left + delta)
             level.timer.time_left = new_time
 
@@ -0,0 +1,62 @@
+# prebuild.py
+# ----------------------------------------------------------
+# Level im Hintergrund vorbauen.
+#
+# Welche Level als Nächstes gebraucht werden könnten, wissen wir schon
+# vorher: das nächste Semester (N), dasselbe Semester nochmal (R) oder
+# Semester 1 (Menü -> Start). Game bestellt diese Level direkt nach dem
+# Erstellen des aktuellen Levels, ein Worker-Thread baut sie, während
+# gespielt wird bzw. der "Semester geschafft"-Screen steht. Beim Wechsel
+# wird nur noch das fertige Level abgeholt.
+#
+# Alle Kandidaten bekommen denselben Seed (den, den das nächste Level
+# sowieso bekommen hätte) - der Spielverlauf ist also derselbe wie ohne
+# Vorbauen, Replays bleiben gültig. Nach dem Abholen sind die übrigen
+# Kandidaten veraltet und werden verworfen.
+#
+# Level ist reine Logik ohne pygame (siehe level.py), deshalb ist das
+# Bauen im Thread unkritisch: es fasst nichts an, was der GameLoop benutzt.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.level import Level
+
+
+class LevelPrebuilder:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prebuild") if enabled else None
+        # (level_index, godmode, seed) -> fertiges oder noch laufendes Level
+        self._pending: dict[tuple[int, bool, int], Future] = {}
+
+    def request(self, level_index: int, godmode: bool, seed: int) -> None:
+        """Level im Hintergrund bauen lassen (doppelte Bestellungen werden ignoriert)."""
+        if not self.enabled:
+            return
+        key = (level_index, godmode, seed)
+        if key not in self._pending:
+            self._pending[key] = self._executor.submit(Level, level_index=level_index, godmode=godmode, seed=seed)
+
+    def take(self, level_index: int, godmode: bool, seed: int) -> Level:
+        """
+        Vorgebautes Level abholen (wartet notfalls kurz auf den Worker),
+        sonst direkt bauen. Alle anderen Kandidaten werden verworfen.
+        """
+        future = self._pending.pop((level_index, godmode, seed), None)
+        self.discard()
+        if future is not None:
+            return future.result()
+        return Level(level_index=level_index, godmode=godmode, seed=seed)
+
+    def discard(self) -> None:
+        """Alle bestellten Level verwerfen (noch nicht gestartete werden abgebrochen)."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,212 @@
+# presentation.py
+# ----------------------------------------------------------
+# Darstellung der Spiel-Logik: Sprites, Animationen und Sounds.
+#
+# Level, Student, Professoren und PowerUps (level.py, entities.py,
+# enemy.py, powerups.py) sind reine Logik ohne pygame. Diese Schicht
+# schaut sich deren Zustand an und macht daraus Bilder:
+# - Coin-Clip, PowerUp-Bilder, Prof-Bilder, Laufanimation des Studenten
+#   (alles einmal pro Tile-Größe geladen, von allen Objekten geteilt)
+# - LevelEvents (ECTS/PowerUp eingesammelt, ...) -> Sounds
+#
+# Game hält genau eine LevelView und fragt sie beim Zeichnen nach
+# (Surface, Position) für jedes Objekt.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import os
+from typing import TYPE_CHECKING
+import pygame
+
+from src.animation import AnimationClip, Animator, game_clock, load_clip, clip_from_files
+from src.assets import asset_cache
+from src.level import LevelEvent
+from src.powerups import PowerUpType
+
+if TYPE_CHECKING:
+    from src.level import Level, ECTS
+    from src.entities import Student
+    from src.enemy import Enemy
+    from src.powerups import PowerUp
+    from src.sound import SoundManager
+
+
+# Coin-Animation: alle 100ms nächstes Frame
+ECTS_FRAME_MS = 100
+
+# Student-Laufanimation: so lange bleibt ein Frame stehen (ms)
+STUDENT_FRAME_MS = 150
+
+# Bilder der PowerUps
+POWERUP_SPRITES = {
+    PowerUpType.PIZZA: "assets/sprites/pizza.png",
+    PowerUpType.PARTY: "assets/sprites/party.png",
+    PowerUpType.CHATGPT: "assets/sprites/Ai Icon.png",
+}
+
+# Fallback-Farben, falls ein PowerUp-Bild fehlt (Spiel bleibt spielbar)
+POWERUP_COLORS = {
+    PowerUpType.PARTY: (180, 80, 200),    # Lila
+    PowerUpType.CHATGPT: (80, 220, 180),  # Türkis
+    PowerUpType.PIZZA: (255, 100, 100),   # Rot
+}
+
+# Welcher SoundManager-Aufruf zu welchem Level-Ereignis gehört
+EVENT_SOUNDS = {
+    LevelEvent.ECTS_COLLECTED: "play_ects_sound",
+    LevelEvent.POWERUP_COLLECTED: "play_powerup_sound",
+    LevelEvent.SHIELD_USED: "play_hitsound",
+}
+
+
+class LevelView:
+    def __init__(self, tile_size: int, sound_manager: SoundManager | None = None):
+        self.tile_size = tile_size
+        self.sound_manager = sound_manager
+        size = (tile_size, tile_size)
+
+        # Coins: alle teilen sich EINEN Clip
+        self.coin_clip = self._load_coin_clip(size)
+
+        # PowerUps: ein Bild pro Typ
+        self.powerup_images = {ptype: self._load_powerup(ptype, size) for ptype in PowerUpType}
+
+        # Profs: Bilder nach Pfad (aus der Config), beim ersten Zeichnen geladen
+        self.prof_images: dict[str, pygame.Surface] = {}
+
+        # Student: Idle-Bild + Laufanimationen (unsere Team-Sprites)
+        idle = asset_cache.load("assets/sprites/student.png", size, owner=self)
+        self.student_idle = AnimationClip((idle,), STUDENT_FRAME_MS)
+
+        # Rechtslauf – nur die einzelnen Frames benutzen
+        self.student_right = clip_from_files([
+            "assets/sprites/student move right einzeln.png",
+            "assets/sprites/student move right einzeln 1.png",
+        ], size, STUDENT_FRAME_MS)
+
+        # Linkslauf – hier gibt es nur einen "einzeln", ich dupliziere ihn einfach
+        self.student_left = clip_from_files([
+            "assets/sprites/Student move left einzeln.png",
+            "assets/sprites/Student move left einzeln.png",
+        ], size, STUDENT_FRAME_MS)
+
+        # Untenlauf – nur die zwei Einzelframes, NICHT das Sprite-Sheet
+        self.student_down = clip_from_files([
+            "assets/sprites/Student move down einzeln.png",
+            "assets/sprites/Student move down einzeln (2).png",
+        ], size, STUDENT_FRAME_MS)
+
+        # Obenlauf – die drei Einzelframes
+        self.student_up = clip_from_files([
+            "assets/sprites/Student move up einzeln 1.png",
+            "assets/sprites/Student move up einzeln 2.png",
+            "assets/sprites/student move up einzeln 3.png",
+        ], size, STUDENT_FRAME_MS)
+
+        # aktueller Animationszustand des Studenten (Frame kommt von der Spieluhr)
+        self.student_anim = Animator(self.student_idle)
+
+    # ------------------------------------------------------------
+    # Laden
+    # ------------------------------------------------------------
+    @staticmethod
+    def _load_coin_clip(size: tuple[int, int]) -> AnimationClip:
+        """
+        Lädt die Coin-Frames:
+        - Standard: Coin v3 (mehrere Frames untereinander)
+        - Fallback: Coin v1 (ein Bild)
+        """
+        path = os.path.join("assets", "sprites", "Coin v3 (kann man animiert darstellen).png")
+        try:
+            # Frames sind quadratisch (Breite = Höhe pro Frame) und untereinander.
+            clip = load_clip(path, None, None, size, ECTS_FRAME_MS)
+        except:
+            # Wenn Sheet nicht existiert -> fallback auf Coin v1
+            fallback = os.path.join("assets", "sprites", "Coin v1.png")
+            return clip_from_files([fallback], size, ECTS_FRAME_MS)
+
+        # Falls irgendwas komisch ist und keine Frames geladen wurden:
+        if not clip.frames:
+            clip = AnimationClip((pygame.Surface(size),), ECTS_FRAME_MS)
+        return clip
+
+    def _load_powerup(self, ptype: PowerUpType, size: tuple[int, int]) -> pygame.Surface:
+        try:
+            return asset_cache.load(POWERUP_SPRITES[ptype], size, owner=self)
+        except FileNotFoundError:
+            print(f"Asset-Warnung: {POWERUP_SPRITES[ptype]} nicht gefunden.")
+
+        # Fallback: farbiges Rechteck mit etwas Rand, einmal als Surface gebaut
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        margin = self.tile_size // 6
+        color = POWERUP_COLORS.get(ptype, (255, 255, 0))  # Gelb (Unbekannt)
+        pygame.draw.rect(image, color, (margin, margin,
+                                        self.tile_size - 2 * margin, self.tile_size - 2 * margin))
+        return image
+
+    def prof_image(self, prof: Enemy) -> pygame.Surface:
+        image = self.prof_images.get(prof.sprite_path)
+        if image is None:
+            image = asset_cache.load(prof.sprite_path, (self.tile_size, self.tile_size), owner=self)
+            self.prof_images[prof.sprite_path] = image
+        return image
+
+    # ------------------------------------------------------------
+    # Zustand -> Bild
+    # ------------------------------------------------------------
+    def reset_student(self) -> None:
+        """Neuer Student (neues Level / Restart) steht erst mal still."""
+        self.student_anim = Animator(self.student_idle)
+
+    def update_student(self, student: Student) -> None:
+        # anhand der letzten Richtung auswählen, welcher Clip benutzt wird
+        # (welcher Frame gerade dran ist, rechnet der Animator aus der Spieluhr)
+        if student.last_dx > 0:
+            self.student_anim.play(self.student_right)
+        elif student.last_dx < 0:
+            self.student_anim.play(self.student_left)
+        elif student.last_dy > 0:
+            self.student_anim.play(self.student_down)
+        elif student.last_dy < 0:
+            self.student_anim.play(self.student_up)
+        else:
+            # steht gerade, also Idle
+            self.student_anim.play(self.student_idle)
+
+    def student_next_frame_in(self) -> float | None:
+        """Sekunden bis zum nächsten Animationsframe (None = Idle, keine Animation)."""
+        ms = self.student_anim.next_change_in()
+        return None if ms is None else ms / 1000.0
+
+    def coin_next_change_in(self) -> float | None:
+        """ms bis zum nächsten Coin-Frame (alle Coins teilen sich Clip + Phase)."""
+        return self.coin_clip.next_change_in(game_clock.time_ms)
+
+    # (Surface, Position) für die RenderList bzw. für ein einzelnes blit()
+    def ects_item(self, ects: ECTS, offset_x: int, offset_y: int):
+        ts = self.tile_size
+        clip = self.coin_clip
+        return clip.frames[clip.current_index()], (offset_x + ects.gx * ts, offset_y + ects.gy * ts)
+
+    def powerup_item(self, powerup: PowerUp, offset_x: int, offset_y: int):
+        ts = self.tile_size
+        return self.powerup_images[powerup.ptype], (offset_x + powerup.grid_x * ts, offset_y + powerup.grid_y * ts)
+
+    def prof_item(self, prof: Enemy, offset_x: int, offset_y: int):
+        ts = self.tile_size
+        return self.prof_image(prof), (offset_x + prof.grid_x * ts, offset_y + prof.grid_y * ts)
+
+    def student_item(self, student: Student, offset_x: int, offset_y: int):
+        ts = self.tile_size
+        return self.student_anim.image(), (offset_x + student.grid_x * ts, offset_y + student.grid_y * ts)
+
+    # ------------------------------------------------------------
+    # Ereignisse -> Sounds
+    # ------------------------------------------------------------
+    def play_events(self, level: Level) -> None:
+        """Ereignisse des Levels abholen und die passenden Sounds abspielen."""
+        events = level.pop_events()
+        if self.sound_manager is None:
+            return
+        for event in events:
+            getattr(self.sound_manager, EVENT_SOUNDS[event])()
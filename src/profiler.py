@@ -0,0 +1,162 @@
+# profiler.py
+# ----------------------------------------------------------
+# Frame-Profiler mit Overlay (F3 im Spiel).
+#
+# Game.run ruft pro Frame begin_frame(), nach jeder Phase mark("name")
+# und am Ende end_frame() auf. Die Zeit seit dem letzten mark() wird der
+# genannten Phase gutgeschrieben. Das Overlay zeigt einen rollenden,
+# nach Phasen gestapelten Graphen + min/avg/p99 und einen Hitch-Zähler
+# (Frames über dem 16,6-ms-Budget).
+#
+# Ist das Overlay aus, macht mark() nur eine einzige if-Abfrage.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from collections import deque
+import time
+import pygame
+
+from src.config import FRAME_BUDGET_MS, PROFILER_HISTORY_FRAMES
+
+
+# Phasen in Reihenfolge des GameLoops + Farbe im Graphen
+PHASES = (
+    ("events", (120, 120, 255)),
+    ("level_update", (80, 200, 80)),
+    ("student_update", (200, 200, 80)),
+    ("collision", (200, 120, 40)),
+    ("draw_game", (220, 80, 80)),
+    ("draw_hud", (200, 80, 200)),
+    ("present", (80, 200, 220)),
+)
+
+
+class FrameProfiler:
+    def __init__(self, history: int = PROFILER_HISTORY_FRAMES, budget_ms: float = FRAME_BUDGET_MS):
+        self.enabled = False
+        self.budget_ms = budget_ms
+
+        # pro Frame: dict Phase -> ms, und Gesamtzeit
+        self.frames: deque[dict[str, float]] = deque(maxlen=history)
+        self.totals: deque[float] = deque(maxlen=history)
+        self.hitches = 0
+
+        self._current: dict[str, float] = {}
+        self._last = 0.0
+
+        # Overlay-Grafik
+        self.bar_w = 2
+        self.graph_h = 100
+        self.width = history * self.bar_w
+        self.height = self.graph_h + 70
+        self.pos = (0, 0)
+        self._graph: pygame.Surface | None = None
+        self._stats_lines: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._stats_next = 0.0
+        self._font: pygame.font.Font | None = None
+
+    # ------------------------------------------------------------
+    # Messen
+    # ------------------------------------------------------------
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self.totals.clear()
+        self.hitches = 0
+        self._graph = None
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._current = {}
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Zeit seit dem letzten mark() der Phase zuschreiben."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        total = sum(self._current.values())
+        self.frames.append(self._current)
+        self.totals.append(total)
+        if total > self.budget_ms:
+            self.hitches += 1
+        self._push_graph_column(self._current)
+
+    # ------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------
+    def _push_graph_column(self, frame: dict[str, float]) -> None:
+        """Graph um eine Spalte weiterschieben und nur die neue Spalte malen."""
+        if self._graph is None:
+            self._graph = pygame.Surface((self.width, self.graph_h))
+            self._graph.fill((20, 20, 20))
+
+        g = self._graph
+        g.scroll(-self.bar_w, 0)
+        x = self.width - self.bar_w
+        g.fill((20, 20, 20), (x, 0, self.bar_w, self.graph_h))
+
+        # Skala: Budget-Linie liegt bei halber Höhe (Graph zeigt bis 2x Budget)
+        scale = self.graph_h / (2 * self.budget_ms)
+        y = self.graph_h
+        for name, color in PHASES:
+            h = int(frame.get(name, 0.0) * scale + 0.5)
+            if h <= 0:
+                continue
+            y -= h
+            g.fill(color, (x, max(0, y), self.bar_w, h))
+        budget_y = self.graph_h - int(self.budget_ms * scale)
+        g.fill((255, 255, 255), (x, budget_y, self.bar_w, 1))
+
+    def _refresh_stats(self) -> None:
+        if self._font is None:
+            self._font = pygame.font.SysFont(None, 18)
+
+        totals = sorted(self.totals)
+        if totals:
+            p99 = totals[min(len(totals) - 1, int(0.99 * (len(totals) - 1) + 0.5))]
+            avg = sum(totals) / len(totals)
+            line1 = f"Frame min {totals[0]:.2f}  avg {avg:.2f}  p99 {p99:.2f} ms   Hitches: {self.hitches}"
+        else:
+            line1 = "Frame -"
+
+        # Zeile 1: Gesamtwerte, darunter Durchschnitt pro Phase in der Graph-Farbe
+        self._stats_lines = [(self._font.render(line1, True, (255, 255, 255)), (0, 0))]
+        n = max(1, len(self.frames))
+        dx, dy = 0, 17
+        for name, color in PHASES:
+            avg_phase = sum(f.get(name, 0.0) for f in self.frames) / n
+            surf = self._font.render(f"{name} {avg_phase:.2f}", True, color)
+            if dx and dx + surf.get_width() > self.width:
+                dx, dy = 0, dy + 17
+            self._stats_lines.append((surf, (dx, dy)))
+            dx += surf.get_width() + 10
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect | None:
+        if not self.enabled or self._graph is None:
+            return None
+
+        # Texte nur 4x pro Sekunde neu rendern, sonst kostet das Overlay selbst zu viel
+        now = time.perf_counter()
+        if now >= self._stats_next:
+            self._refresh_stats()
+            self._stats_next = now + 0.25
+
+        x = screen.get_width() - self.width - 10
+        y = 10
+        self.pos = (x, y)
+        rect = pygame.Rect(x, y, self.width, self.height)
+        screen.fill((0, 0, 0), rect)
+        screen.blit(self._graph, (x, y))
+
+        ty = y + self.graph_h + 4
+        for surf, (dx, dy) in self._stats_lines:
+            screen.blit(surf, (x + 2 + dx, ty + dy))
+        return rect
@@ -0,0 +1,150 @@
+# render.py
+# ----------------------------------------------------------
+# Dirty-Rect-Rendering: statt jeden Frame den kompletten Bildschirm
+# neu zu zeichnen und mit pygame.display.flip() zu präsentieren,
+# merken wir uns nur die Rechtecke, die sich geändert haben, und
+# geben genau diese mit pygame.display.update(rects) aus.
+#
+# Ein kompletter Flip passiert nur, wenn jemand request_full_redraw()
+# aufruft (z.B. bei einem State-Wechsel MENU -> RUNNING).
+#
+# Außerdem: RenderList sammelt (Surface, Position)-Paare pro Ebene und
+# schickt jede Ebene mit EINEM Surface.blits()-Aufruf raus, statt pro
+# Objekt einmal durch Python zu blitten.
+#
+# RedrawScheduler: statt stur 60x pro Sekunde zu zeichnen, melden die
+# Objekte, wann ihre nächste sichtbare Änderung fällig ist (Coin-Frame,
+# Timer-Zehntel, Prof-Schritt, ...). Bis dahin schläft der GameLoop in
+# pygame.event.wait() und wacht nur für Eingaben früher auf.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import math
+import pygame
+
+
+class DirtyRectRenderer:
+    def __init__(self):
+        # Beim allerersten Frame muss natürlich alles gezeichnet werden
+        self.full_redraw = True
+
+        # Rechtecke aus dem letzten präsentierten Frame. Dort muss vor dem
+        # nächsten Frame der Hintergrund wiederhergestellt werden.
+        self.previous_rects: list[pygame.Rect] = []
+
+        # Rechtecke, die im aktuellen Frame gezeichnet wurden
+        self.rects: list[pygame.Rect] = []
+
+    def request_full_redraw(self) -> None:
+        """Nächster Frame wird komplett gezeichnet und geflippt."""
+        self.full_redraw = True
+
+    def add(self, rect) -> None:
+        """Meldet ein geändertes Rechteck (None und leere Rechtecke werden ignoriert)."""
+        if rect:
+            self.rects.append(rect)
+
+    def add_all(self, rects) -> None:
+        for rect in rects:
+            self.add(rect)
+
+    def present(self) -> None:
+        """Bringt den Frame auf den Bildschirm."""
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.previous_rects or self.rects:
+            # alte Positionen (wurden mit Hintergrund übermalt) + neue Positionen
+            pygame.display.update(self.previous_rects + self.rects)
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full_redraw = False
+
+
+class RenderList:
+    # Zeichenreihenfolge der Ebenen (hinten -> vorne).
+    # Tiles sind keine Ebene: die kommen fertig aus der TerrainLayer (terrain.py).
+    LAYERS = ("items", "enemies", "player")
+
+    def __init__(self):
+        self.layers: dict[str, list[tuple[pygame.Surface, tuple[int, int]]]] = {
+            name: [] for name in self.LAYERS
+        }
+
+    def add(self, layer: str, surface: pygame.Surface, dest: tuple[int, int]) -> None:
+        self.layers[layer].append((surface, dest))
+
+    def clear(self) -> None:
+        for items in self.layers.values():
+            items.clear()
+
+    def flush(self, screen: pygame.Surface, doreturn: bool = False) -> list[pygame.Rect]:
+        """
+        Blittet alle Ebenen (ein blits()-Aufruf pro Ebene) und leert die Liste.
+        doreturn=True nur, wenn die Rechtecke gebraucht werden (Dirty-Rects),
+        sonst spart doreturn=False das Anlegen der Rect-Objekte.
+        """
+        rects: list[pygame.Rect] = []
+        for name in self.LAYERS:
+            items = self.layers[name]
+            if not items:
+                continue
+            if doreturn:
+                rects.extend(screen.blits(items, doreturn=True))
+            else:
+                screen.blits(items, doreturn=False)
+            items.clear()
+        return rects
+
+
+class RedrawScheduler:
+    def __init__(self, enabled: bool = True):
+        # False -> verhält sich wie vorher (jeder Frame sofort)
+        self.enabled = enabled
+        # in wie vielen ms der nächste Frame fällig ist (None = erst bei Eingabe)
+        self.due_ms: float | None = 0.0
+
+    def clear(self) -> None:
+        """Vor dem Sammeln: nichts ist fällig."""
+        self.due_ms = None
+
+    def due_in(self, ms: float) -> None:
+        """Meldet eine sichtbare Änderung in ms Millisekunden (die früheste gewinnt)."""
+        ms = max(0.0, ms)
+        if self.due_ms is None or ms < self.due_ms:
+            self.due_ms = ms
+
+    def now(self) -> None:
+        """Nächster Frame sofort (z.B. Animation läuft jeden Frame)."""
+        self.due_ms = 0.0
+
+    def align(self, step_ms: float, accumulated_ms: float) -> None:
+        """
+        Die Simulation läuft in festen Schritten: eine Änderung in due_ms wird
+        erst im Schritt sichtbar, der diese Zeit überschreitet. Darauf aufrunden
+        (abzüglich der Zeit, die schon im Akkumulator liegt).
+        """
+        if self.due_ms is None or self.due_ms == 0.0:
+            return
+        steps = max(1, math.ceil(self.due_ms / step_ms))
+        self.due_ms = max(0.0, steps * step_ms - accumulated_ms)
+
+    def wait(self) -> list[pygame.event.Event]:
+        """
+        Schläft, bis eine Eingabe kommt oder die nächste Änderung fällig ist,
+        und gibt alle anstehenden Events zurück.
+        """
+        if not self.enabled or self.due_ms == 0.0:
+            return pygame.event.get()
+
+        if self.due_ms is None:
+            # Standbild: schlafen, bis irgendein Event kommt
+            first = pygame.event.wait()
+        else:
+            # +1, damit wir nicht knapp vor dem Wechsel aufwachen
+            first = pygame.event.wait(int(self.due_ms) + 1)
+
+        events = pygame.event.get()
+        if first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        return events
@@ -0,0 +1,217 @@
+# replay.py
+# ----------------------------------------------------------
+# Eingaben aufzeichnen und Sessions exakt nachspielen.
+#
+# Eine Aufnahme besteht nur aus dem Session-Seed (daraus ziehen alle
+# Level ihren Zufall, siehe Level.rng) und den Eingaben mit dem
+# Simulationsschritt, in dem sie verarbeitet wurden. Weil die Simulation
+# in festen Schritten läuft (Game.step), kommt beim Nachspielen exakt
+# derselbe Spielverlauf heraus - egal wie schnell der Rechner ist.
+#
+# Aufruf (aus dem Projektordner, wie das Spiel selbst):
+#   python -m src.replay record session.json            (normal spielen, wird aufgezeichnet)
+#   python -m src.replay play session.json              (headless, so schnell wie möglich)
+#   python -m src.replay play session.json --realtime   (im Fenster, in Echtzeit)
+#   python -m src.replay play session.json --no-draw    (nur Simulation, z.B. für CI)
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import pygame
+
+from src.config import LOGICAL_RESOLUTION, SIM_TICK_RATE
+
+
+# Erhöhen, wenn sich Level-Aufbau oder Simulation so ändern, dass alte
+# Aufnahmen anders ablaufen würden (2: Level-Generator mit Feld-Pools,
+# 3: Profs jagen den Studenten durch die Tunnel, 4: Wach-Profs mit Revier,
+# 5: Prof-Schritte und Effekte über die Zeitleiste, 6: Wachen für jedes guard_mode-Semester,
+# 7: Prof-Tempo aus der Config, 8: Zeitleisten-Einträge laufen zu ihrem Fälligkeitszeitpunkt)
+REPLAY_VERSION = 8
+
+# Im Menü/Pause zählt auch die Mausposition (Hover vergrößert die Buttons),
+# im laufenden Spiel brauchen wir Mausbewegungen nicht.
+_CODES = {"q": pygame.QUIT, "k": pygame.KEYDOWN, "c": pygame.MOUSEBUTTONDOWN, "m": pygame.MOUSEMOTION}
+
+
+class InputRecorder:
+    def __init__(self, seed: int, size: tuple[int, int], logical_size: tuple[int, int] | None = None):
+        self.seed = seed
+        self.size = size
+        self.logical_size = logical_size
+        self.events: list[list] = []
+        self.end_tick = 0
+
+    def record(self, tick: int, event: pygame.event.Event, state) -> None:
+        """Wird von Game.handle_event für jedes Event aufgerufen."""
+        if event.type == pygame.QUIT:
+            self.events.append([tick, "q"])
+        elif event.type == pygame.KEYDOWN:
+            self.events.append([tick, "k", event.key, event.unicode])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.events.append([tick, "c", event.pos[0], event.pos[1], event.button])
+        elif event.type == pygame.MOUSEMOTION and state.name != "RUNNING":
+            self.events.append([tick, "m", event.pos[0], event.pos[1]])
+
+    def to_dict(self) -> dict:
+        return {
+            "version": REPLAY_VERSION,
+            "tick_rate": SIM_TICK_RATE,
+            "seed": self.seed,
+            "size": list(self.size),
+            "logical_size": list(self.logical_size) if self.logical_size else None,
+            "end_tick": self.end_tick,
+            "events": self.events,
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            # eine Zeile pro Event bleibt kompakt und trotzdem diff-bar
+            data = self.to_dict()
+            events = data.pop("events")
+            f.write(json.dumps(data)[:-1] + ', "events": [\n')
+            f.write(",\n".join(json.dumps(e, ensure_ascii=False) for e in events))
+            f.write("\n]}\n")
+
+
+def load_recording(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unbekannte Replay-Version: {data.get('version')}")
+    if data["tick_rate"] != SIM_TICK_RATE:
+        raise ValueError(f"Aufnahme lief mit {data['tick_rate']} Schritten/s, "
+                         f"config.SIM_TICK_RATE ist {SIM_TICK_RATE}")
+    return data
+
+
+def _to_event(entry: list) -> pygame.event.Event:
+    code = entry[1]
+    etype = _CODES[code]
+    if code == "k":
+        return pygame.event.Event(etype, key=entry[2], unicode=entry[3], mod=0, scancode=0)
+    if code == "c":
+        return pygame.event.Event(etype, pos=(entry[2], entry[3]), button=entry[4])
+    if code == "m":
+        return pygame.event.Event(etype, pos=(entry[2], entry[3]), rel=(0, 0), buttons=(0, 0, 0))
+    return pygame.event.Event(etype)
+
+
+def state_digest(game) -> str:
+    """Kurzer Fingerabdruck des Spielstands (zum Vergleichen zweier Läufe)."""
+    level = game.level
+    parts = [
+        game.state.name, game.current_level_index, game.mistakes,
+        level.collected_ects, round(level.timer.time_left, 6),
+        game.student.grid_x, game.student.grid_y,
+        [(p.grid_x, p.grid_y, p.hp) for p in level.professors],
+        [(e.gx, e.gy) for e in level.ects_items],
+        bytes(level.tiles.cells).hex(),
+    ]
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:12]
+
+
+# ------------------------------------------------------------
+# Aufnehmen / Abspielen
+# ------------------------------------------------------------
+def record(path: str, seed: int | None = None, display_size: tuple[int, int] | None = None) -> None:
+    """Spiel normal starten und alle Eingaben nach path schreiben."""
+    from src.game import Game
+
+    game = Game(display_size=display_size, seed=seed)
+    # Bei pygame.SCALED ist screen.get_size() schon die logische Auflösung
+    logical = LOGICAL_RESOLUTION if game.screen.get_flags() & pygame.SCALED else None
+    game.recorder = InputRecorder(game.seed, game.screen.get_size(), logical)
+    try:
+        game.run()
+    except SystemExit:
+        pass
+    finally:
+        game.recorder.end_tick = game.sim_ticks
+        game.recorder.save(path)
+
+
+def replay(data: dict, realtime: bool = False, draw: bool = True):
+    """
+    Spielt eine Aufnahme durch Game/Level nach und gibt das Game zurück.
+    realtime=False -> so schnell wie möglich (headless).
+    """
+    from src.game import Game
+
+    logical = tuple(data["logical_size"]) if data.get("logical_size") else None
+    game = Game(display_size=tuple(data["size"]), logical_size=logical, seed=data["seed"])
+    events = data["events"]
+    end_tick = data["end_tick"]
+    i = 0
+
+    while game.running and game.sim_ticks < end_tick:
+        # alle Eingaben, die vor diesem Schritt verarbeitet wurden
+        while i < len(events) and events[i][0] <= game.sim_ticks:
+            game.handle_event(_to_event(events[i]))
+            i += 1
+        game.step(game.sim_step)
+
+        if draw:
+            game.draw()
+        if realtime:
+            game.clock.tick(SIM_TICK_RATE)
+            # Fenster bedienbar halten, Schließen bricht das Replay ab
+            if pygame.event.peek(pygame.QUIT):
+                break
+            pygame.event.pump()
+
+    # Eingaben nach dem letzten Schritt (z.B. ESC zum Beenden)
+    while i < len(events) and game.running:
+        game.handle_event(_to_event(events[i]))
+        i += 1
+    return game
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Dig Or Exma: Sessions aufzeichnen und nachspielen")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    rec = sub.add_parser("record", help="spielen und Eingaben aufzeichnen")
+    rec.add_argument("path")
+    rec.add_argument("--seed", type=int, help="fester Session-Seed (sonst zufällig)")
+    rec.add_argument("--size", type=_parse_size, help="Fenstergröße statt Vollbild, z.B. 1280x720")
+
+    play = sub.add_parser("play", help="Aufnahme nachspielen")
+    play.add_argument("path")
+    play.add_argument("--realtime", action="store_true", help="im Fenster in Echtzeit statt headless")
+    play.add_argument("--no-draw", action="store_true", help="nur simulieren, nichts zeichnen")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "record":
+        record(args.path, args.seed, args.size)
+        return 0
+
+    if not args.realtime:
+        # Muss vor dem ersten pygame.init() gesetzt sein
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    data = load_recording(args.path)
+    t0 = time.perf_counter()
+    game = replay(data, realtime=args.realtime, draw=not args.no_draw)
+    elapsed = time.perf_counter() - t0
+
+    print(f"{game.sim_ticks} Schritte in {elapsed:.2f} s ({game.sim_ticks / max(elapsed, 1e-9):.0f} Schritte/s)")
+    print(f"State {game.state.name}, Semester {game.current_level_index + 1}, "
+          f"ECTS {game.level.collected_ects}/{game.level.required_ects}, Digest {state_digest(game)}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
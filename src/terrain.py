@@ -0,0 +1,143 @@
+# terrain.py
+# ----------------------------------------------------------
+# Vorgerenderte Tile-Ebene (Erde/Gras/Tunnel) für das Spielfeld.
+#
+# Die Tiles ändern sich nur, wenn gegraben wird. Deshalb malen wir
+# den sichtbaren Ausschnitt (Kamera, siehe camera.py) einmal auf eine
+# eigene Surface und flicken danach nur die Felder, die Level.dig() als
+# geändert meldet. Pro Frame muss Game.draw_game dann nur noch EIN Bild
+# blitten.
+#
+# Die Surface ist nur so groß wie der Viewport, nicht wie das Level.
+# Verschiebt sich die Kamera, wird der Inhalt per scroll() verschoben
+# und nur der neu sichtbare Streifen gemalt.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pygame
+
+from src.tile import TileType
+
+if TYPE_CHECKING:
+    from src.level import Level
+    from src.camera import Camera
+
+
+class TerrainLayer:
+    def __init__(self, tile_size: int, block_solid, block_empty, block_grass):
+        self.tile_size = tile_size
+
+        # Sprites (graphics.Sprite) für die drei Tile-Arten
+        self.block_solid = block_solid
+        self.block_empty = block_empty
+        self.block_grass = block_grass
+
+        # Für welches Level (und welchen Kamera-Ausschnitt) die Surface gebaut ist
+        self.level: Level | None = None
+        self.surface: pygame.Surface | None = None
+        self.view_x = 0
+        self.view_y = 0
+        self.cols = 0
+        self.rows = 0
+
+    def _draw_tile(self, x: int, y: int) -> None:
+        """Malt genau ein Feld (Level-Koordinaten) neu auf die Ebene."""
+        ttype = self.level.tiles.type_at(x, y)
+        px = (x - self.view_x) * self.tile_size
+        py = (y - self.view_y) * self.tile_size
+
+        if ttype == TileType.GRASS:
+            self.block_grass.draw(self.surface, px, py)
+        elif ttype == TileType.SOLID:
+            self.block_solid.draw(self.surface, px, py)
+        else:
+            self.block_empty.draw(self.surface, px, py)
+
+    def _draw_cells(self, x0: int, x1: int, y0: int, y1: int) -> None:
+        for x in range(x0, x1):
+            for y in range(y0, y1):
+                self._draw_tile(x, y)
+
+    def build(self, level: Level, camera: Camera) -> None:
+        """Baut den kompletten sichtbaren Ausschnitt neu (neues Level)."""
+        self.level = level
+        self.view_x, self.view_y = camera.x, camera.y
+        self.cols, self.rows = camera.cols, camera.rows
+        # Tiles sind komplett deckend -> convert() ohne Alpha blittet am schnellsten
+        self.surface = pygame.Surface(
+            (self.cols * self.tile_size, self.rows * self.tile_size)
+        ).convert()
+
+        self._draw_cells(self.view_x, self.view_x + self.cols,
+                         self.view_y, self.view_y + self.rows)
+
+        # alles ist jetzt aktuell
+        level.dirty_tiles.clear()
+
+    def _scroll_to(self, camera: Camera) -> None:
+        """Inhalt verschieben und nur die neu sichtbaren Streifen malen."""
+        dx = camera.x - self.view_x
+        dy = camera.y - self.view_y
+        self.view_x, self.view_y = camera.x, camera.y
+
+        # zu weit gesprungen -> einfach alles neu
+        if abs(dx) >= self.cols or abs(dy) >= self.rows:
+            self._draw_cells(self.view_x, self.view_x + self.cols,
+                             self.view_y, self.view_y + self.rows)
+            return
+
+        self.surface.scroll(-dx * self.tile_size, -dy * self.tile_size)
+
+        x0, x1 = self.view_x, self.view_x + self.cols
+        y0, y1 = self.view_y, self.view_y + self.rows
+        if dx > 0:
+            self._draw_cells(x1 - dx, x1, y0, y1)
+        elif dx < 0:
+            self._draw_cells(x0, x0 - dx, y0, y1)
+        if dy > 0:
+            self._draw_cells(x0, x1, y1 - dy, y1)
+        elif dy < 0:
+            self._draw_cells(x0, x1, y0, y0 - dy)
+
+    def sync(self, level: Level, camera: Camera) -> list[pygame.Rect]:
+        """
+        Bringt die Ebene auf den Stand von Level und Kamera:
+        - neues Level -> komplett neu bauen
+        - Kamera verschoben -> scrollen + Streifen nachmalen
+        - sonst nur die gegrabenen Felder im Ausschnitt flicken
+
+        Rückgabe: geänderte Bereiche als Rechtecke (relativ zur Ebene).
+        """
+        if (level is not self.level or self.surface is None
+                or (camera.cols, camera.rows) != (self.cols, self.rows)):
+            self.build(level, camera)
+            return [self.surface.get_rect()]
+
+        changed: list[pygame.Rect] = []
+        if (camera.x, camera.y) != (self.view_x, self.view_y):
+            self._scroll_to(camera)
+            changed.append(self.surface.get_rect())
+
+        if level.dirty_tiles:
+            for (x, y) in level.dirty_tiles:
+                # Felder außerhalb des Ausschnitts werden beim Reinscrollen gemalt
+                if not camera.visible(x, y):
+                    continue
+                self._draw_tile(x, y)
+                changed.append(pygame.Rect((x - self.view_x) * self.tile_size,
+                                           (y - self.view_y) * self.tile_size,
+                                           self.tile_size, self.tile_size))
+            level.dirty_tiles.clear()
+        return changed
+
+    def draw(self, screen: pygame.Surface, offset_x: int, offset_y: int) -> pygame.Rect:
+        return screen.blit(self.surface, (offset_x, offset_y))
+
+    def draw_area(self, screen: pygame.Surface, offset_x: int, offset_y: int,
+                  screen_rect: pygame.Rect) -> None:
+        """Zeichnet nur den Teil der Ebene, der in screen_rect (Bildschirm-Koordinaten) liegt."""
+        layer_rect = self.surface.get_rect(topleft=(offset_x, offset_y))
+        clip = layer_rect.clip(screen_rect)
+        if clip.width and clip.height:
+            screen.blit(self.surface, clip.topleft, clip.move(-offset_x, -offset_y))
@@ -0,0 +1,69 @@
+# text_cache.py
+# ----------------------------------------------------------
+# Gemeinsamer Cache für gerenderte Texte.
+#
+# font.render() ist teuer und wir rendern im HUD, in den Menüs und bei
+# Meldungen jeden Frame fast immer die gleichen Strings. Deshalb merken
+# wir uns die fertigen Surfaces, Schlüssel: (font, text, color, antialias).
+#
+# Damit der Cache nicht endlos wächst (Timer-Text ändert sich z.B. alle
+# 0,1 s), fliegt der am längsten nicht benutzte Eintrag raus (LRU), sobald
+# die Speichergrenze erreicht ist.
+# ----------------------------------------------------------
+
+from __future__ import annotations
+from collections import OrderedDict
+import pygame
+
+from src.config import TEXT_CACHE_MAX_BYTES
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class TextCache:
+    def __init__(self, max_bytes: int = TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        # kleine Statistik, praktisch zum Profilen
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Wie font.render(), aber jeder String wird nur einmal gerendert."""
+        key = (font, text, tuple(color), antialias)
+
+        surface = self._entries.get(key)
+        if surface is not None:
+            # als "zuletzt benutzt" markieren
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        self.bytes_used += _surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def _evict(self) -> None:
+        # den neuesten Eintrag behalten wir immer, auch wenn er alleine zu groß ist
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self.bytes_used -= _surface_bytes(old)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+
+# Ein gemeinsamer Cache für das ganze Spiel
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    return text_cache.render(font, text, color, antialias)
@@ -12,6 +12,7 @@
 # Verantwortlich: Aaron Lehrke (937367)
 # ==============================================================================
 
+import heapq
 from enum import Enum, auto
 
 # ==============================================================================
@@ -49,3 +50,137 @@ class Tile:
     def dig(self) -> None:
         """Egal ob Gras oder Erde: Nach dem Graben ist es leer."""
         self.type = TileType.EMPTY
+
+
+# ==============================================================================
+# TILE GRID (kompakter Speicher fürs ganze Spielfeld)
+# ==============================================================================
+# Früher war Level.tiles eine Liste von Listen mit einem Tile-Objekt pro Feld
+# (~100 Byte pro Feld, beim Levelaufbau sogar doppelt angelegt). Jetzt liegt
+# pro Feld nur noch 1 Byte (TileType.value) in einem bytearray, zeilenweise:
+# Index = y * cols + x. Wer noch ein Tile braucht, bekommt eine TileView,
+# die direkt in das Grid liest und schreibt.
+
+# Byte-Code -> TileType (TileType.value ist 1, 2, 3)
+_TYPE_BY_CODE = {t.value: t for t in TileType}
+_EMPTY = TileType.EMPTY.value
+
+
+class TileView:
+    """Sieht aus wie ein Tile, gehört aber zu einem Feld im TileGrid."""
+    __slots__ = ("_grid", "_x", "_y")
+
+    def __init__(self, grid: "TileGrid", x: int, y: int):
+        self._grid = grid
+        self._x = x
+        self._y = y
+
+    @property
+    def type(self) -> TileType:
+        return self._grid.type_at(self._x, self._y)
+
+    @type.setter
+    def type(self, ttype: TileType) -> None:
+        self._grid.set(self._x, self._y, ttype)
+
+    @property
+    def is_solid(self) -> bool:
+        return self._grid.is_solid(self._x, self._y)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._grid.is_solid(self._x, self._y)
+
+    def dig(self) -> None:
+        self._grid.dig(self._x, self._y)
+
+
+class _ColumnView:
+    # nur für alten Code im Stil grid[x][y]
+    __slots__ = ("_grid", "_x")
+
+    def __init__(self, grid: "TileGrid", x: int):
+        self._grid = grid
+        self._x = x
+
+    def __getitem__(self, y: int) -> TileView:
+        return TileView(self._grid, self._x, y)
+
+
+class TileGrid:
+    def __init__(self, cols: int, rows: int, fill: TileType = TileType.SOLID):
+        self.cols = cols
+        self.rows = rows
+        self.cells = bytearray([fill.value]) * (cols * rows)
+
+    def fill(self, ttype: TileType) -> None:
+        """Alle Felder auf einen Typ setzen (ohne neues Array)."""
+        self.cells[:] = bytes([ttype.value]) * len(self.cells)
+
+    def fill_row(self, y: int, ttype: TileType) -> None:
+        start = y * self.cols
+        self.cells[start:start + self.cols] = bytes([ttype.value]) * self.cols
+
+    def type_at(self, x: int, y: int) -> TileType:
+        return _TYPE_BY_CODE[self.cells[y * self.cols + x]]
+
+    def set(self, x: int, y: int, ttype: TileType) -> None:
+        self.cells[y * self.cols + x] = ttype.value
+
+    def is_solid(self, x: int, y: int) -> bool:
+        # Gras zählt auch als fest -> alles außer EMPTY
+        return self.cells[y * self.cols + x] != _EMPTY
+
+    def dig(self, x: int, y: int) -> None:
+        self.cells[y * self.cols + x] = _EMPTY
+
+    def tile(self, x: int, y: int) -> TileView:
+        return TileView(self, x, y)
+
+    def __getitem__(self, x: int) -> _ColumnView:
+        return _ColumnView(self, x)
+
+    # --------------------------------------------------------------------------
+    # Abfragen über das ganze Grid (laufen in C über das bytearray)
+    # --------------------------------------------------------------------------
+    def count(self, ttype: TileType) -> int:
+        return self.cells.count(ttype.value)
+
+    def count_dug(self) -> int:
+        return self.cells.count(_EMPTY)
+
+    def solid_neighbours(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Feste Nachbarfelder (oben/unten/links/rechts) von (x, y)."""
+        result = []
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= nx < self.cols and 0 <= ny < self.rows and self.is_solid(nx, ny):
+                result.append((nx, ny))
+        return result
+
+    def travel_costs(self, x: int, y: int, step_cost: float, dig_cost: float,
+                     limit: float = float("inf")) -> list[float]:
+        """
+        Kürzeste Laufzeit von (x, y) zu jedem Feld (flach: Index y * cols + x).
+        Durch Tunnel kostet ein Schritt step_cost, in Erde dig_cost (Graben).
+        Dijkstra über das bytearray, jedes Feld ist erreichbar (man kann überall graben).
+        Felder teurer als limit werden nicht weiter untersucht (bleiben inf).
+        """
+        cols, rows, cells = self.cols, self.rows, self.cells
+        inf = float("inf")
+        costs = [inf] * (cols * rows)
+        start = y * cols + x
+        costs[start] = 0.0
+        heap = [(0.0, start)]
+        while heap:
+            cost, i = heapq.heappop(heap)
+            if cost > costs[i]:
+                continue
+            cx, cy = i % cols, i // cols
+            for nx, ny in ((cx, cy - 1), (cx, cy + 1), (cx - 1, cy), (cx + 1, cy)):
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    j = ny * cols + nx
+                    new_cost = cost + (step_cost if cells[j] == _EMPTY else dig_cost)
+                    if new_cost < costs[j] and new_cost <= limit:
+                        costs[j] = new_cost
+                        heapq.heappush(heap, (new_cost, j))
+        return costs
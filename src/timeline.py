@@ -0,0 +1,102 @@
+# timeline.py
+# ----------------------------------------------------------
+# Zeitleiste der Simulation: "mach X in n Sekunden".
+#
+# Früher hat jedes Objekt jeden Schritt selbst runtergezählt (Prof-Cooldown,
+# Pizza-Schild, ...), auch wenn gar nichts passiert. Jetzt trägt jedes
+# Objekt ein, wann es das nächste Mal dran ist, und Level.update() stellt
+# nur die Uhr weiter: ausgeführt wird nur, was fällig ist (Heap nach
+# Fälligkeit, bei Gleichstand in Eintragungsreihenfolge -> deterministisch
+# für Replays).
+#
+# Die Uhr läuft nur, wenn das Level läuft (Pause/Frage halten sie an).
+# ----------------------------------------------------------
+
+from __future__ import annotations
+import heapq
+import itertools
+from typing import Callable
+
+
+class Timer:
+    """Eintrag in der Zeitleiste (zum Abbrechen mit Timeline.cancel)."""
+
+    __slots__ = ("due", "action", "args")
+
+    def __init__(self, due: float, action: Callable, args: tuple):
+        self.due = due
+        self.action: Callable | None = action
+        self.args = args
+
+
+class Timeline:
+    def __init__(self):
+        # Sekunden seit Levelstart (nur laufende Simulationszeit)
+        self.now = 0.0
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._order = itertools.count()
+        # abgebrochene Einträge, die noch im Heap liegen
+        self._cancelled = 0
+
+    def clear(self) -> None:
+        """Alles vergessen, Uhr zurück auf 0 (neuer Level-Versuch)."""
+        self.now = 0.0
+        self._heap.clear()
+        self._cancelled = 0
+
+    def schedule(self, delay: float, action: Callable, *args) -> Timer:
+        """action(*args) in delay Sekunden ausführen."""
+        timer = Timer(self.now + delay, action, args)
+        heapq.heappush(self._heap, (timer.due, next(self._order), timer))
+        return timer
+
+    def cancel(self, timer: Timer | None) -> None:
+        # bleibt erst mal im Heap liegen und wird beim Erreichen übersprungen.
+        # Ist mehr als die Hälfte tot, wird aufgeräumt (O(n), selten) - sonst
+        # wächst der Heap bei jedem Schild-/Meldungs-Wechsel weiter.
+        if timer is None or timer.action is None:
+            return
+        timer.action = None
+        self._cancelled += 1
+        if self._cancelled * 2 > len(self._heap):
+            # in place, advance() hält evtl. gerade eine Referenz auf die Liste
+            self._heap[:] = [entry for entry in self._heap if entry[2].action is not None]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def time_until(self, timer: Timer | None) -> float:
+        """Sekunden bis zum Eintrag (0, wenn abgebrochen oder schon vorbei)."""
+        if timer is None or timer.action is None:
+            return 0.0
+        return max(0.0, timer.due - self.now)
+
+    def advance(self, dt: float) -> None:
+        """
+        Uhr weiterstellen und alles Fällige ausführen (auch neu eingetragenes).
+        Während ein Eintrag läuft, steht die Uhr auf seinem Fälligkeitszeitpunkt:
+        trägt er sich mit "in n Sekunden" neu ein, zählt das ab dort und nicht
+        ab dem Ende des Schritts - und ist es dann noch in diesem Schritt
+        fällig, läuft es hier gleich mit.
+        """
+        target = self.now + dt
+        heap = self._heap
+        while heap and heap[0][0] <= target:
+            due, _, timer = heapq.heappop(heap)
+            action = timer.action
+            if action is None:
+                self._cancelled -= 1
+            else:
+                timer.action = None
+                self.now = max(self.now, due)
+                action(*timer.args)
+        self.now = target
+
+    def next_due_in(self) -> float | None:
+        """Sekunden bis zum nächsten Eintrag (für den RedrawScheduler), None = nichts geplant."""
+        heap = self._heap
+        while heap and heap[0][2].action is None:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.now)
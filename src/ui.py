@@ -5,6 +5,8 @@
 import pygame
 from .questions import questions
 from .config import WHITE
+from .text_cache import render_text
+from .assets import asset_cache
 
 class QuestionUI:
 
@@ -16,14 +18,33 @@ class QuestionUI:
         self.qid = None
         self.selected = 0
 
+        # vorgerenderte Texte der aktuellen Frage (werden in open() gebaut)
+        self.title_surf = None
+        self.question_surf = None
+        self.answer_surfs: list[pygame.Surface] = []
+        self.answer_surfs_selected: list[pygame.Surface] = []
+
     def open(self, qid):
         self.active = True
         self.qid = qid
         self.selected = 0
 
+        # Alles, was sich während der Frage nicht ändert, nur einmal rendern.
+        # Für die Antworten gibt es je eine normale und eine markierte Version,
+        # beim Umschalten wird dann nur die andere Surface geblittet.
+        q = questions[qid]
+        self.title_surf = self.font_big.render(q["prof_name"], True, WHITE)
+        self.question_surf = self.font_small.render(q["question"], True, WHITE)
+        self.answer_surfs = [self.font_small.render(ans, True, WHITE) for ans in q["answers"]]
+        self.answer_surfs_selected = [self.font_small.render(ans, True, (255,200,50)) for ans in q["answers"]]
+
     def close(self):
         self.active = False
         self.qid = None
+        self.title_surf = None
+        self.question_surf = None
+        self.answer_surfs = []
+        self.answer_surfs_selected = []
 
     def update(self, event):
         if not self.active:
@@ -46,18 +67,13 @@ class QuestionUI:
         if not self.active:
             return
 
-        q = questions[self.qid]
         cx = surf.get_width() // 2
 
-        title = self.font_big.render(q["prof_name"], True, WHITE)
-        surf.blit(title, title.get_rect(center=(cx, 150)))
+        surf.blit(self.title_surf, self.title_surf.get_rect(center=(cx, 150)))
+        surf.blit(self.question_surf, self.question_surf.get_rect(center=(cx, 220)))
 
-        question = self.font_small.render(q["question"], True, WHITE)
-        surf.blit(question, question.get_rect(center=(cx, 220)))
-
-        for i, ans in enumerate(q["answers"]):
-            color = (255,200,50) if i == self.selected else WHITE
-            line = self.font_small.render(ans, True, color)
+        for i in range(len(self.answer_surfs)):
+            line = self.answer_surfs_selected[i] if i == self.selected else self.answer_surfs[i]
             surf.blit(line, line.get_rect(center=(cx, 300 + i*40)))
 
 
@@ -105,7 +121,7 @@ class VolumeSlider:
     def _draw_button(self, screen, rect, text):
         mouse_pos = pygame.mouse.get_pos() #aktuelle Mausposition abfragen
         col = self.col_hover if rect.collidepoint(mouse_pos) else self.col_text #prüft ob die Maus über dem Button ist und passt Farbe an
-        surf = self.font.render(text, True, col) #unseren Text zeichnen
+        surf = render_text(self.font, text, col) #unseren Text zeichnen (aus dem Text-Cache)
         screen.blit(surf, surf.get_rect(center=rect.center)) #zeichnet den Text zentriert im Button-Rechteck
 
     def draw(self, screen):
@@ -147,16 +163,14 @@ class Mutebutton:
         self.rect = pygame.Rect(x, y, size, size)
         self.sound_manager = sound_manager
 
-        img_mute = pygame.image.load("assets/sprites/mute.png").convert_alpha()
-        img_unmute = pygame.image.load("assets/sprites/unmute.png").convert_alpha()
-
-        icon_size = 32  
-        self.img_mute = pygame.transform.scale(img_mute, (icon_size, icon_size))
-        self.img_unmute = pygame.transform.scale(img_unmute, (icon_size, icon_size))
+        # Icon 32px bei 50px Button (wächst mit dem Button)
+        icon_size = max(1, size * 32 // 50)
+        self.img_mute = asset_cache.load("assets/sprites/mute.png", (icon_size, icon_size))
+        self.img_unmute = asset_cache.load("assets/sprites/unmute.png", (icon_size, icon_size))
 
     def draw(self, screen):
         img = self.img_mute if self.sound_manager.is_muted else self.img_unmute
-        screen.blit(img, (self.rect.x, self.rect.y))  
+        return screen.blit(img, (self.rect.x, self.rect.y))
 
     def handle_click(self, pos):
         if self.rect.collidepoint(pos):
@@ -0,0 +1,50 @@
+from src.flowfield import FlowField
+from src.tile import TileGrid, TileType
+
+
+def _grid_with_tunnel():
+    # Tunnel in Zeile 1 von x=0 bis x=5, Rest Erde
+    tiles = TileGrid(8, 4, TileType.SOLID)
+    for x in range(6):
+        tiles.dig(x, 1)
+    return tiles
+
+
+def test_distances_follow_tunnels_only():
+    tiles = _grid_with_tunnel()
+    flow = FlowField(tiles, radius=10)
+    flow.set_target(0, 1)
+    assert [flow.distance(x, 1) for x in range(6)] == [0, 1, 2, 3, 4, 5]
+    assert flow.distance(6, 1) is None  # Erde
+    assert flow.distance(0, 2) is None
+
+
+def test_downhill_steps_towards_target():
+    tiles = _grid_with_tunnel()
+    flow = FlowField(tiles, radius=10)
+    flow.set_target(0, 1)
+    assert flow.downhill(3, 1) == [(2, 1)]
+    assert flow.downhill(0, 1) == []  # schon am Ziel
+
+
+def test_radius_limits_search():
+    tiles = _grid_with_tunnel()
+    flow = FlowField(tiles, radius=2)
+    flow.set_target(0, 1)
+    assert flow.distance(2, 1) == 2
+    assert flow.distance(3, 1) is None
+
+
+def test_recomputes_after_dig_and_target_change():
+    tiles = _grid_with_tunnel()
+    flow = FlowField(tiles, radius=10)
+    flow.set_target(0, 1)
+    assert flow.distance(5, 2) is None
+
+    tiles.dig(5, 2)
+    flow.invalidate()
+    assert flow.distance(5, 2) == 6
+
+    flow.set_target(5, 1)
+    assert flow.distance(0, 1) == 5
+    assert flow.distance(5, 2) == 1
@@ -0,0 +1,39 @@
+from src.guard import GuardRegion
+from src.tile import TileGrid, TileType
+
+
+def test_region_is_bounded_by_leash():
+    tiles = TileGrid(20, 20, TileType.SOLID)
+    region = GuardRegion(tiles, (10, 10), leash=4)
+    # nur Erde: 2 pro Schritt -> höchstens 2 Schritte weit
+    assert (10, 10) in region
+    assert (12, 10) in region
+    assert (13, 10) not in region
+    assert (11, 11) in region
+
+
+def test_tunnels_extend_region_after_dig():
+    tiles = TileGrid(20, 20, TileType.SOLID)
+    region = GuardRegion(tiles, (10, 10), leash=4)
+    assert (14, 10) not in region
+
+    for x in range(11, 15):
+        tiles.dig(x, 10)
+        region.on_dig(x, 10)
+    assert (14, 10) in region  # 4 Tunnel-Schritte
+
+
+def test_dig_far_away_keeps_region():
+    tiles = TileGrid(20, 20, TileType.SOLID)
+    region = GuardRegion(tiles, (10, 10), leash=4)
+    assert (10, 10) in region
+    tiles.dig(0, 0)
+    region.on_dig(0, 0)
+    assert not region._dirty
+
+
+def test_way_home_moves_closer():
+    tiles = TileGrid(20, 20, TileType.SOLID)
+    region = GuardRegion(tiles, (10, 10), leash=4)
+    assert region.way_home(15, 8) == [(14, 8), (15, 9)]
+    assert region.way_home(10, 3) == [(10, 4)]
@@ -0,0 +1,58 @@
+# Level-Aufbau (_generate + _is_winnable): muss auch bei vollem Grid fertig
+# werden und ein nicht schaffbares Level ehrlich melden.
+
+import warnings
+
+import pytest
+
+import src.level as level_module
+from src.level import Level
+
+
+def _all_cells(level):
+    cells = [(e.gx, e.gy) for e in level.ects_items]
+    cells += [(p.grid_x, p.grid_y) for p in level.powerups]
+    return cells
+
+
+def test_full_grid_with_many_profs_finishes(monkeypatch):
+    # 3x3 Grid, aber weit mehr ECTS/PowerUps/Profs verlangt als Felder frei sind
+    monkeypatch.setattr(level_module, "GRID_COLS", 3)
+    monkeypatch.setattr(level_module, "GRID_ROWS", 3)
+    monkeypatch.setattr(level_module, "LEVELS",
+                        [{"ects": 4, "powerups_total": 9, "prof_count": 50}])
+    monkeypatch.setattr(level_module, "PROFESSORS", level_module.PROFESSORS * 20)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        level = Level(level_index=0, seed=1)
+
+    # Items nur auf Erde außerhalb des Start-Tunnels, jedes Feld höchstens einmal
+    items = _all_cells(level)
+    assert len(items) == len(set(items))
+    assert len(items) <= 9 - 3
+    # Profs überall außer auf dem Startfeld, nie zwei auf einem Feld
+    profs = [(p.grid_x, p.grid_y) for p in level.professors]
+    assert len(profs) == len(set(profs)) <= 8
+    assert level_module.START_CELL not in profs
+
+
+def test_unwinnable_level_is_reported(monkeypatch):
+    # in 0,1s BAföG-Zeit ist kein Coin erreichbar
+    monkeypatch.setattr(level_module, "BAFOEG_TIME_SECONDS", 0.1)
+    monkeypatch.setattr(level_module, "LEVEL_GEN_MAX_ATTEMPTS", 3)
+
+    with pytest.warns(RuntimeWarning):
+        level = Level(level_index=0, seed=3)
+    assert level.winnable is False
+    assert level.ects_items  # der letzte Versuch bleibt stehen
+
+
+@pytest.mark.parametrize("level_index", range(len(level_module.LEVELS)))
+def test_default_levels_are_winnable_and_seeded(level_index):
+    a = Level(level_index=level_index, seed=42)
+    b = Level(level_index=level_index, seed=42)
+    assert a.winnable
+    assert a._is_winnable()
+    assert bytes(a.tiles.cells) == bytes(b.tiles.cells)
+    assert [(e.gx, e.gy) for e in a.ects_items] == [(e.gx, e.gy) for e in b.ects_items]
@@ -0,0 +1,38 @@
+import random
+
+from src.occupancy import CellPool
+
+
+def test_take_returns_every_cell_once():
+    pool = CellPool(4, 3)
+    rng = random.Random(1)
+    cells = [pool.take(rng) for _ in range(12)]
+    assert sorted(cells) == [(x, y) for x in range(4) for y in range(3)]
+    assert len(pool) == 0
+    assert pool.take(rng) is None
+
+
+def test_exclude_and_discard():
+    pool = CellPool(3, 3, exclude=[(0, 0), (1, 1)])
+    assert len(pool) == 7
+    assert (0, 0) not in pool and (1, 1) not in pool
+    pool.discard((2, 2))
+    pool.discard((2, 2))  # zweimal ist egal
+    assert len(pool) == 6
+    rng = random.Random(5)
+    taken = {pool.take(rng) for _ in range(6)}
+    assert taken.isdisjoint({(0, 0), (1, 1), (2, 2)})
+
+
+def test_contains_out_of_bounds():
+    pool = CellPool(3, 2)
+    assert (3, 0) not in pool
+    assert (-1, 0) not in pool
+    assert (0, 2) not in pool
+    assert (2, 1) in pool
+
+
+def test_same_seed_same_order():
+    a, b = CellPool(10, 10), CellPool(10, 10)
+    ra, rb = random.Random(9), random.Random(9)
+    assert [a.take(ra) for _ in range(50)] == [b.take(rb) for _ in range(50)]
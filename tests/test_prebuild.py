@@ -0,0 +1,45 @@
+# Vorgebaute Level müssen genau dem entsprechen, was ein direkter Aufbau mit
+# demselben Seed liefert (sonst laufen Replays auseinander).
+
+import pytest
+
+from src.level import Level
+from src.prebuild import LevelPrebuilder
+
+
+def _layout(level):
+    return (bytes(level.tiles.cells),
+            [(e.gx, e.gy) for e in level.ects_items],
+            [(p.grid_x, p.grid_y) for p in level.professors],
+            level.required_ects)
+
+
+@pytest.fixture
+def prebuilder():
+    builder = LevelPrebuilder(enabled=True)
+    yield builder
+    builder.shutdown()
+
+
+def test_take_after_request_matches_direct_build(prebuilder):
+    prebuilder.request(1, False, 99)
+    prebuilder.request(0, False, 99)  # zweiter Kandidat, wird beim Abholen verworfen
+
+    level = prebuilder.take(1, False, 99)
+
+    assert level.level_index == 1 and level.seed == 99
+    assert _layout(level) == _layout(Level(level_index=1, seed=99))
+    assert not prebuilder._pending
+
+
+def test_take_without_request_builds_directly(prebuilder):
+    level = prebuilder.take(2, True, 5)
+    assert level.godmode
+    assert _layout(level) == _layout(Level(level_index=2, godmode=True, seed=5))
+
+
+def test_disabled_prebuilder_still_builds():
+    builder = LevelPrebuilder(enabled=False)
+    builder.request(0, False, 1)  # wird ignoriert
+    assert _layout(builder.take(0, False, 1)) == _layout(Level(level_index=0, seed=1))
+    builder.shutdown()
@@ -0,0 +1,57 @@
+from src.timeline import Timeline
+
+
+def test_runs_only_due_entries_in_order():
+    clock = Timeline()
+    calls = []
+    clock.schedule(0.5, calls.append, "b")
+    clock.schedule(0.2, calls.append, "a")
+    clock.schedule(0.5, calls.append, "c")  # gleiche Zeit -> Eintragungsreihenfolge
+    clock.advance(0.1)
+    assert calls == []
+    assert abs(clock.next_due_in() - 0.1) < 1e-9
+    clock.advance(0.4)
+    assert calls == ["a", "b", "c"]
+    assert clock.next_due_in() is None
+
+
+def test_action_can_reschedule_itself():
+    clock = Timeline()
+    calls = []
+
+    def tick():
+        calls.append(clock.now)
+        clock.schedule(1.0, tick)
+
+    clock.schedule(1.0, tick)
+    clock.advance(3.5)
+    # neu eingetragen wird ab dem Fälligkeitszeitpunkt, also 1, 2 und 3
+    assert calls == [1.0, 2.0, 3.0]
+    assert clock.now == 3.5
+    for _ in range(2):
+        clock.advance(1.0)
+    assert calls == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_cancel_and_time_until():
+    clock = Timeline()
+    calls = []
+    timer = clock.schedule(2.0, calls.append, 1)
+    clock.advance(0.5)
+    assert abs(clock.time_until(timer) - 1.5) < 1e-9
+    clock.cancel(timer)
+    clock.cancel(timer)  # zweimal ist egal
+    assert clock.time_until(timer) == 0.0
+    clock.advance(5.0)
+    assert calls == []
+
+
+def test_cancelled_entries_are_compacted():
+    clock = Timeline()
+    clock.schedule(100.0, lambda: None)
+    timer = None
+    for _ in range(1000):
+        clock.cancel(timer)
+        timer = clock.schedule(10.0, lambda: None)
+    assert len(clock._heap) <= 4
+    assert abs(clock.next_due_in() - 10.0) < 1e-9